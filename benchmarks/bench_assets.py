@@ -0,0 +1,108 @@
+"""
+Compare loading the assets from loose files and from the packed bundle.
+
+    python benchmarks/bench_assets.py [runs] [--drop-caches]
+
+Lays out two copies of the resources the way a frozen build extracts them,
+one with the loose theme/language/logo files and one with only assets.bin,
+then in a fresh interpreter per run (7 by default) does what startup does
+with them: load the theme and language, list themes and languages, and read
+the logo. Reports the median time and the number of files opened and bytes
+read under the resource directory. Imports are done before timing so only
+asset I/O is measured.
+
+Without --drop-caches the files are in the page cache; as root on Linux,
+--drop-caches flushes it before every run to measure a truly cold start.
+"""
+import os
+import json
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from imfont_compressor.core.assets import build_bundle, BUNDLE_FILENAME
+from imfont_compressor.core.utils import get_resource_path
+
+# Runs in the child: resources resolve against sys._MEIPASS like in a frozen build
+CHILD = r"""
+import json, os, sys, time
+sys._MEIPASS = sys.argv[1]
+
+from types import SimpleNamespace
+from imfont_compressor.core.ui_theme import UITheme
+from imfont_compressor.core.language import Language
+from imfont_compressor.core.assets import read_asset
+
+stats = {"files": 0, "bytes": 0}
+resource_dir = sys.argv[1]
+
+def audit(event, args):
+    if event == "open" and isinstance(args[0], str) and args[0].startswith(resource_dir):
+        stats["files"] += 1
+        stats["bytes"] += os.path.getsize(args[0]) if os.path.isfile(args[0]) else 0
+
+sys.addaudithook(audit)
+
+start = time.perf_counter()
+app = SimpleNamespace(initialized=False, main_window=None)
+theme = UITheme(app)
+language = Language(app, "ar")
+theme.get_theme_display_list()
+language.get_available_languages()
+read_asset("assets", "logo.png")
+stats["ms"] = (time.perf_counter() - start) * 1000.0
+print(json.dumps(stats))
+"""
+
+
+def drop_caches():
+    subprocess.run(["sync"], check=True)
+    with open("/proc/sys/vm/drop_caches", "w") as f:
+        f.write("3\n")
+
+
+def measure(resource_dir, runs, cold):
+    samples = []
+    for _ in range(runs):
+        if cold:
+            drop_caches()
+        output = subprocess.run(
+            [sys.executable, "-c", CHILD, resource_dir],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+            env={**os.environ, "IMFONT_ASSET_BUNDLE": os.path.join(resource_dir, BUNDLE_FILENAME)}
+        ).stdout
+        samples.append(json.loads(output.splitlines()[-1]))
+    return {key: statistics.median(s[key] for s in samples) for key in samples[0]}
+
+
+def main():
+    args = sys.argv[1:]
+    cold = "--drop-caches" in args
+    args = [a for a in args if a != "--drop-caches"]
+    runs = int(args[0]) if args else 7
+
+    work = tempfile.mkdtemp(prefix="imfont_assets_")
+    try:
+        loose = os.path.join(work, "loose")
+        packed = os.path.join(work, "packed")
+        shutil.copytree(get_resource_path("assets"), os.path.join(loose, "assets"))
+        os.makedirs(packed)
+        build_bundle(os.path.join(packed, BUNDLE_FILENAME))
+
+        results = [("loose files", measure(loose, runs, cold)), ("bundle", measure(packed, runs, cold))]
+
+        print(f"median of {runs} {'cold' if cold else 'warm-cache'} runs")
+        for label, result in results:
+            print(f"  {label:<12}{result['ms']:8.2f} ms  {result['files']:4.0f} files  {result['bytes'] / 1024:8.1f} KB in opened files")
+    finally:
+        shutil.rmtree(work)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""
+The asyncio API against the sync one: batch throughput, streaming and
+cancellation.
+
+    python benchmarks/bench_async.py [--fonts 8] [--workers N] [--scale 0.25]
+
+The synthetic Latin font (benchmarks/synthetic_fonts.py) with a few unique
+trailing bytes is written --fonts times, then:
+
+    sync     compress_file for each font in turn
+    batch    `async for` over compress_batch with --workers processes
+    stream   every font streamed to an asyncio.StreamWriter on a local socket
+
+While the jobs run, a heartbeat task measures how late the event loop is;
+it should stay near zero since the work is in other processes. Finally a
+batch is cancelled after its first result: the run fails unless the jobs
+still queued are dropped rather than run. The outputs of every mode must
+match the sync API's.
+"""
+import argparse
+import asyncio
+import contextlib
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from synthetic_fonts import generate
+from imfont_compressor import compress_file
+from imfont_compressor.aio import AsyncCompressor
+
+OPTIONS = {"encoding": "base85", "symbol": "font"}
+
+
+async def _heartbeat(lags, interval=0.01):
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append((time.perf_counter() - start - interval) * 1000.0)
+
+
+async def _timed(coro):
+    lags = []
+    heartbeat = asyncio.ensure_future(_heartbeat(lags))
+    start = time.perf_counter()
+    try:
+        result = await coro
+    finally:
+        heartbeat.cancel()
+    return result, time.perf_counter() - start, max(lags, default=0.0)
+
+
+async def _batch(compressor, paths):
+    return {result["path"]: result["source"] async for result in compressor.compress_batch(paths, **OPTIONS)}
+
+
+async def _stream(compressor, paths):
+    received = {}
+
+    async def sink(reader, writer):
+        path = (await reader.readline()).decode().strip()
+        received[path] = await reader.read()
+        writer.close()
+
+    server = await asyncio.start_server(sink, "127.0.0.1", 0)
+    host, port = server.sockets[0].getsockname()[:2]
+
+    async def send(path):
+        _, writer = await asyncio.open_connection(host, port)
+        writer.write(path.encode() + b"\n")
+        await compressor.compress_file(path, writer, **OPTIONS)
+        writer.close()  # after the buffered data
+        await writer.wait_closed()
+
+    async with server:
+        await asyncio.gather(*(send(path) for path in paths))
+        while len(received) < len(paths):
+            await asyncio.sleep(0.01)
+    return received
+
+
+async def _cancelled(compressor, paths):
+    """The time a job takes after a batch was abandoned at its first result."""
+    async with contextlib.aclosing(compressor.compress_batch(paths, **OPTIONS)) as results:
+        async for _ in results:
+            break
+    start = time.perf_counter()
+    await compressor.compress_file(paths[0], **OPTIONS)
+    return time.perf_counter() - start
+
+
+async def run(paths, expected, workers):
+    ok = True
+    async with AsyncCompressor(workers) as compressor:
+        await compressor.compress_bytes(b"warm up")  # start the pool outside the timings
+        for name, func in (("batch", _batch), ("stream", _stream)):
+            outputs, seconds, lag = await _timed(func(compressor, paths))
+            ok &= outputs == expected
+            print(f"{name:<8}{len(paths) / seconds:>9.1f} fonts/s   max loop lag {lag:6.1f} ms")
+
+        single = (await _timed(compressor.compress_file(paths[0], **OPTIONS)))[1]
+        after_cancel = await _cancelled(compressor, paths * 4)
+        # With the queued jobs dropped, only those already in a worker are left to finish first
+        dropped = after_cancel < single * (workers + 2)
+        ok &= dropped
+        print(f"\nCancelled a batch of {len(paths) * 4} after its first result: the next job took "
+              f"{after_cancel * 1000:.0f} ms (one job alone {single * 1000:.0f} ms): {'OK' if dropped else 'FAILED'}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the asyncio API against the sync API.")
+    parser.add_argument("--fonts", type=int, default=8, help="fonts per mode (default 8)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--scale", type=float, default=0.25, help="size of the Latin font (default 0.25)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="imfont_bench_async_") as directory:
+        base = generate("latin", args.scale)
+        paths = []
+        for i in range(args.fonts):
+            path = os.path.join(directory, f"Font{i}.ttf")
+            with open(path, "wb") as f:
+                f.write(base + i.to_bytes(4, "little"))
+            paths.append(path)
+
+        print(f"{args.fonts} fonts of {len(base) / 1024:.1f} KB, {args.workers} workers\n")
+        start = time.perf_counter()
+        expected = {path: compress_file(path, **OPTIONS) for path in paths}
+        print(f"{'sync':<8}{len(paths) / (time.perf_counter() - start):>9.1f} fonts/s")
+
+        ok = asyncio.run(run(paths, expected, args.workers))
+
+    if not ok:
+        print("\nFAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
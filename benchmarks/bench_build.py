@@ -0,0 +1,102 @@
+"""
+Incremental manifest builds: how long `build` takes when nothing, a font's
+time stamp, or one font's options changed.
+
+    python benchmarks/bench_build.py [--fonts 12] [--runs 10] [--scale 0.25] [--budget 10]
+
+The synthetic corpus (benchmarks/synthetic_fonts.py) is repeated with a few
+unique trailing bytes into --fonts fonts and listed in a JSON manifest. Each
+step runs `python -m imfont_compressor build` the way a build system would:
+
+    cold      every output generated
+    no-op     nothing changed
+    touched   every font's mtime changed, contents the same
+    option    one font's symbol changed in the manifest
+
+The time reported by the build itself (without interpreter startup) is
+compared. The run fails when a no-op build regenerates anything or takes
+longer than --budget milliseconds, or when a step rebuilds the wrong number
+of outputs.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from synthetic_fonts import CORPUS, generate
+
+
+def _build(manifest, *extra):
+    env = dict(os.environ, PYTHONPATH=ROOT, IMFONT_TELEMETRY="")
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = subprocess.run([sys.executable, "-m", "imfont_compressor", "build", manifest, "--json", *extra],
+                            env=env, capture_output=True, text=True, check=True)
+    report = json.loads(result.stdout)
+    return len(report["built"]), report["elapsed_ms"]
+
+
+def _write_manifest(path, fonts, renamed=None):
+    manifest = {"defaults": {"encoding": "base85"}, "fonts": [
+        {"input": font, "output": f"gen/{os.path.splitext(font)[0]}.h",
+         "symbol": "renamed" if font == renamed else os.path.splitext(font)[0]}
+        for font in fonts
+    ]}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark incremental manifest builds.")
+    parser.add_argument("--fonts", type=int, default=12, help="fonts in the manifest (default 12)")
+    parser.add_argument("--runs", type=int, default=10, help="no-op builds to time (default 10)")
+    parser.add_argument("--scale", type=float, default=0.25, help="size of the synthetic fonts (default 0.25)")
+    parser.add_argument("--budget", type=float, default=10.0, help="no-op build time allowed in ms (default 10)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="imfont_bench_build_") as directory:
+        names = list(CORPUS)
+        fonts = []
+        for i in range(args.fonts):
+            font = f"{names[i % len(names)]}{i}.ttf"
+            with open(os.path.join(directory, font), "wb") as f:
+                f.write(generate(names[i % len(names)], args.scale) + i.to_bytes(4, "little"))
+            fonts.append(font)
+        manifest = os.path.join(directory, "fonts.json")
+        _write_manifest(manifest, fonts)
+
+        print(f"{args.fonts} fonts, base85\n")
+        print(f"{'Step':<10}{'Built':>6}{'Time':>14}")
+        ok = True
+
+        built, ms = _build(manifest, "-j", str(os.cpu_count() or 1))
+        print(f"{'cold':<10}{built:>6}{ms:>11.1f} ms")
+        ok &= built == args.fonts
+
+        runs = [_build(manifest) for _ in range(args.runs)]
+        median = statistics.median(ms for _, ms in runs)
+        print(f"{'no-op':<10}{max(built for built, _ in runs):>6}{median:>11.2f} ms  (median of {args.runs})")
+        ok &= all(built == 0 for built, _ in runs) and median <= args.budget
+
+        for font in fonts:
+            os.utime(os.path.join(directory, font))
+        built, ms = _build(manifest)
+        print(f"{'touched':<10}{built:>6}{ms:>11.2f} ms  (fonts hashed again)")
+        ok &= built == 0
+
+        _write_manifest(manifest, fonts, renamed=fonts[0])
+        built, ms = _build(manifest)
+        print(f"{'option':<10}{built:>6}{ms:>11.1f} ms")
+        ok &= built == 1
+
+    print("\nOK" if ok else "\nFAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""
+Check the output size estimator against real compression.
+
+    python benchmarks/bench_estimator.py [--scales 0.3,1.0] [more fonts or folders...]
+
+The synthetic corpus (benchmarks/synthetic_fonts.py) is generated at each
+scale, so every machine checks the same bytes; fonts or folders given on
+the command line are added to it. Every font is estimated and then
+compressed for real, and the run fails when the payload or the -u8 source
+size, with or without compression, is off by more than ESTIMATE_TOLERANCE. A 20 MB file assembled from the corpus is then timed to
+confirm estimates stay within the latency budget.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from synthetic_fonts import CORPUS, generate
+from imfont_compressor.core.estimator import ESTIMATE_TOLERANCE, estimate_output
+from imfont_compressor.core.stb import stb_compress
+from imfont_compressor.core.encoders import encode
+
+LARGE_INPUT_SIZE = 20 * 1024 * 1024
+LATENCY_BUDGET_MS = 50.0
+
+
+def collect_fonts(paths):
+    fonts = []
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.lower().endswith((".ttf", ".otf")):
+                    fonts.append(os.path.join(path, name))
+        else:
+            fonts.append(path)
+    return fonts
+
+
+def write_corpus(directory, scales):
+    fonts = []
+    for scale in scales:
+        for name in CORPUS:
+            path = os.path.join(directory, f"synthetic_{name}@{scale:g}.ttf")
+            with open(path, "wb") as f:
+                f.write(generate(name, scale))
+            fonts.append(path)
+    return fonts
+
+
+def check_accuracy(fonts):
+    worst = 0.0
+    print(f"{'Font':<32}{'Estimate':>10}{'Actual':>10}{'Error':>9}{'Source err':>12}"
+          f"{'Uncompressed':>14}{'Time':>10}")
+    for path in fonts:
+        estimate = estimate_output(path, "-u8")
+        raw_estimate = estimate_output(path, "-u8", use_compression=False)
+        with open(path, "rb") as f:
+            data = f.read()
+        compressed = stb_compress(data)
+        source_size = len(encode(compressed, "-u8", "data", path, len(data)).encode("utf-8"))
+        raw_source_size = len(encode(data, "-u8", "data", path, len(data)).encode("utf-8"))
+
+        error = estimate["payload_size"] / len(compressed) - 1.0
+        source_error = estimate["source_size"] / source_size - 1.0
+        raw_source_error = raw_estimate["source_size"] / raw_source_size - 1.0
+        worst = max(worst, abs(error), abs(source_error), abs(raw_source_error))
+        print(f"{os.path.basename(path)[:31]:<32}{estimate['payload_size']:>10}{len(compressed):>10}"
+              f"{error:>+9.1%}{source_error:>+12.1%}{raw_source_error:>+14.1%}"
+              f"{estimate['elapsed_ms']:>7.1f} ms")
+
+    print(f"Worst error {worst:.1%} (tolerance {ESTIMATE_TOLERANCE:.0%})")
+    return worst <= ESTIMATE_TOLERANCE
+
+
+def check_latency(fonts, directory):
+    large_path = os.path.join(directory, "large.ttf")
+    with open(large_path, "wb") as f:
+        written = 0
+        while written < LARGE_INPUT_SIZE:
+            for path in fonts:
+                with open(path, "rb") as font:
+                    written += f.write(font.read())
+
+    timings = []
+    for _ in range(5):
+        start = time.perf_counter()
+        estimate_output(large_path, "-u8")
+        timings.append((time.perf_counter() - start) * 1000.0)
+
+    slowest = max(timings)
+    print(f"{written / (1024 * 1024):.0f} MB input: slowest estimate {slowest:.1f} ms "
+          f"(budget {LATENCY_BUDGET_MS:.0f} ms)")
+    return slowest <= LATENCY_BUDGET_MS
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check size estimates against real compression.")
+    parser.add_argument("fonts", nargs="*", help="more fonts or folders of fonts to check")
+    parser.add_argument("--scales", default="0.3,1.0", help="scales of the synthetic corpus (default 0.3,1.0)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="imfont_bench_estimator_") as directory:
+        fonts = write_corpus(directory, [float(scale) for scale in args.scales.split(",")])
+        fonts += collect_fonts(args.fonts)
+        accurate = check_accuracy(fonts)
+        fast = check_latency(fonts, directory)
+    print("\nOK" if accurate and fast else "\nFAILED")
+    return 0 if accurate and fast else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
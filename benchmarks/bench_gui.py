@@ -0,0 +1,72 @@
+"""
+Time building the main window and switching themes and languages.
+
+    python benchmarks/bench_gui.py
+
+Needs a display. Builds the full widget tree the way setup_gui does (without
+the splash screen or mainloop), times the first repaint, then cycles through
+every bundled theme and every language (alternating direction where RTL
+languages exist). A language switch, re-labelling and re-laying out the
+whole window, fails the run when its worst case exceeds
+LANGUAGE_SWITCH_BUDGET_MS. Only public entry points are used, so the script
+can be run on older revisions to compare.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+LANGUAGE_SWITCH_BUDGET_MS = 100.0
+
+
+def timed_ms(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return (time.perf_counter() - start) * 1000.0
+
+
+def main():
+    start = time.perf_counter()
+    from imfont_compressor.core.app import ImFontCompressorApp
+    from imfont_compressor.gui.main_window import MainWindow
+    import_ms = (time.perf_counter() - start) * 1000.0
+
+    app = ImFontCompressorApp()
+    build_ms = timed_ms(lambda: setattr(app, "main_window", MainWindow(app)))
+
+    app.initialized = True
+    first_paint_ms = timed_ms(app.ui_theme.refresh_colors)
+    app.root.update_idletasks()
+
+    timings = []
+    for theme_id in app.ui_theme.list_available_themes():
+        timings.append(timed_ms(app.ui_theme.apply_theme, theme_id))
+        app.root.update_idletasks()
+
+    switches = []
+    languages = [code for code, _ in app.language.get_available_languages()]
+    for code in languages * 3:
+        switches.append(timed_ms(lambda: (app.language.set_language(code, True), app.root.update_idletasks())))
+
+    app.root.destroy()
+
+    rows = [
+        ("import", import_ms, ""),
+        ("build widgets", build_ms, ""),
+        ("first repaint", first_paint_ms, ""),
+        ("theme switch (mean)", sum(timings) / len(timings), f" over {len(timings)} themes"),
+        ("theme switch (worst)", max(timings), ""),
+        ("language switch (mean)", sum(switches) / len(switches), f" over {len(switches)} switches"),
+        ("language switch (worst)", max(switches), "")
+    ]
+    for label, value, note in rows:
+        print(f"{label:<25}{value:8.1f} ms{note}")
+
+    fast = max(switches) <= LANGUAGE_SWITCH_BUDGET_MS
+    print(f"\nLanguage switch budget {LANGUAGE_SWITCH_BUDGET_MS:.0f} ms: {'OK' if fast else 'FAILED'}")
+    return 0 if fast else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
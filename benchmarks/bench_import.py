@@ -0,0 +1,81 @@
+"""
+Import time of the library API, and a check that it stays free of tkinter.
+
+    python benchmarks/bench_import.py [--runs 15] [--budget 5]
+
+Each run is a fresh interpreter timing `import imfont_compressor.api` with
+-X importtime (cumulative, so Python's own startup isn't counted). Bytecode
+is written on the first run, as an installed package would have it. Then one
+interpreter with tkinter made unimportable compresses a font through
+compress_bytes. The run fails when the median is over --budget milliseconds,
+tkinter was imported, or the compression needed it.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from synthetic_fonts import generate
+
+MODULE = "imfont_compressor.api"
+NO_TK_JOB = (
+    "import sys; sys.modules['tkinter'] = None; "
+    "from imfont_compressor import compress_bytes; "
+    "sys.stdout.buffer.write(compress_bytes(sys.stdin.buffer.read(), encoding='base85', symbol='latin'))"
+)
+
+
+def _env():
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+
+def import_ms(env):
+    """(cumulative import time in ms, whether tkinter was loaded)"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c",
+                             f"import sys, {MODULE}; print('tkinter' in sys.modules)"],
+                            env=env, capture_output=True, text=True, check=True)
+    for line in reversed(result.stderr.splitlines()):
+        _, _, cumulative, name = (field.strip() for field in line.replace(":", "|", 1).split("|"))
+        if name == MODULE:
+            return int(cumulative) / 1000.0, result.stdout.strip() == "True"
+    raise RuntimeError(f"{MODULE} missing from -X importtime output")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the import time of the library API.")
+    parser.add_argument("--runs", type=int, default=15, help="interpreters to time (default 15)")
+    parser.add_argument("--budget", type=float, default=5.0, help="median import time allowed in ms (default 5)")
+    args = parser.parse_args()
+
+    env = _env()
+    import_ms(env)  # writes the bytecode
+    times, tk_loaded = [], False
+    for _ in range(args.runs):
+        ms, tk = import_ms(env)
+        times.append(ms)
+        tk_loaded |= tk
+    median = statistics.median(times)
+    print(f"import {MODULE}: median {median:.2f} ms, min {min(times):.2f} ms, max {max(times):.2f} ms "
+          f"over {args.runs} runs (budget {args.budget:g} ms)")
+    print(f"tkinter imported: {'yes' if tk_loaded else 'no'}")
+
+    job = subprocess.run([sys.executable, "-c", NO_TK_JOB], input=generate("latin", 0.1), env=env,
+                         capture_output=True)
+    no_tk = job.returncode == 0 and job.stdout.startswith(b"// File: 'data'")
+    print(f"compress_bytes without tkinter: {'OK' if no_tk else 'FAILED'}")
+    if job.returncode:
+        print(job.stderr.decode("utf-8", "replace"))
+
+    ok = median <= args.budget and not tk_loaded and no_tk
+    print("OK" if ok else "FAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
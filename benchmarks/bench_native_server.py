@@ -0,0 +1,109 @@
+"""
+Per-job latency of the native tool: a process per job against a pool of
+`binary_to_compressed_c -server` processes.
+
+    python benchmarks/bench_native_server.py [--jobs 50] [--pool 2] [--scale 0.25]
+                                             [--native path/to/binary_to_compressed_c]
+
+The tool is the bundled executable on Windows; elsewhere it is built from
+data/binary_to_compressed_c.cpp with the C++ compiler on the PATH, or given
+with --native. Each small synthetic font (benchmarks/synthetic_fonts.py) is
+compressed --jobs times to -u8 source:
+
+    spawn    subprocess.run per job, as run_compression does
+    path     NativeServerPool, the tool reading the font from disk
+    inline   NativeServerPool, the font bytes sent in the request
+    threads  NativeServerPool from --pool threads at once (time per job)
+
+The outputs of every mode must match the spawned tool's, or the run fails.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from bench_pipeline import find_native
+from synthetic_fonts import generate
+from imfont_compressor.core.native import NativeServerPool
+
+FONTS = ("latin", "icons")
+
+
+def _timed(func, jobs):
+    """(output of the last run, per-job milliseconds)"""
+    times = []
+    output = None
+    for _ in range(jobs):
+        start = time.perf_counter()
+        output = func()
+        times.append((time.perf_counter() - start) * 1000.0)
+    return output, times
+
+
+def _report(font, size, mode, times, baseline):
+    times = sorted(times)
+    median = statistics.median(times)
+    p90 = times[max(0, int(0.9 * len(times) + 0.5) - 1)]
+    print(f"{font:<8}{size:>9,}  {mode:<9}{median:>9.2f} ms{p90:>9.2f} ms{baseline / median:>9.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the native tool's -server mode against a process per job.")
+    parser.add_argument("--jobs", type=int, default=50, help="jobs per font and mode (default 50)")
+    parser.add_argument("--pool", type=int, default=2, help="server processes in the pool (default 2)")
+    parser.add_argument("--scale", type=float, default=0.25, help="size of the synthetic fonts (default 0.25)")
+    parser.add_argument("--native", help="binary_to_compressed_c executable to benchmark")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="imfont_native_server_") as directory:
+        native, _ = find_native(args.native, directory)
+        if native is None:
+            print("No native executable and no C++ compiler to build one.")
+            return 1
+
+        print(f"{args.jobs} jobs per mode, pool of {args.pool}\n")
+        print(f"{'Font':<8}{'Bytes':>9}  {'Mode':<9}{'Median':>12}{'p90':>12}{'Speedup':>10}")
+        ok = True
+        with NativeServerPool(args.pool, native) as pool:
+            for font in FONTS:
+                data = generate(font, args.scale)
+                path = os.path.join(directory, f"{font}.ttf")
+                with open(path, "wb") as f:
+                    f.write(data)
+
+                expected, spawn = _timed(lambda: subprocess.run(
+                    [native, "-u8", path, font], capture_output=True, text=True, check=True).stdout, args.jobs)
+                baseline = statistics.median(spawn)
+                _report(font, len(data), "spawn", spawn, baseline)
+
+                pool.compress("-u8", font, path=path)  # start the processes outside the timings
+                modes = {
+                    "path": lambda: pool.compress("-u8", font, path=path),
+                    "inline": lambda: pool.compress("-u8", font, data=data, name=path),
+                }
+                for mode, func in modes.items():
+                    output, times = _timed(func, args.jobs)
+                    ok &= output == expected
+                    _report(font, len(data), mode, times, baseline)
+
+                with ThreadPoolExecutor(args.pool) as threads:
+                    start = time.perf_counter()
+                    outputs = list(threads.map(lambda _: pool.compress("-u8", font, path=path), range(args.jobs)))
+                    per_job = (time.perf_counter() - start) * 1000.0 / args.jobs
+                ok &= all(output == expected for output in outputs)
+                _report(font, len(data), "threads", [per_job], baseline)
+
+    if not ok:
+        print("\nFAILED: the server's output differs from the spawned tool's")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
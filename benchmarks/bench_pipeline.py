@@ -0,0 +1,347 @@
+"""
+Throughput and peak memory of every stage of the compression pipeline.
+
+    python benchmarks/bench_pipeline.py run [--json results.json] [--repeat 3] [--scale 1.0]
+                                            [--fonts latin,cjk,...] [--backends python,native]
+                                            [--native path/to/binary_to_compressed_c]
+    python benchmarks/bench_pipeline.py compare baseline.json results.json
+                                                [--threshold 0.10] [--memory-threshold 0.10]
+
+`run` generates the synthetic corpus (benchmarks/synthetic_fonts.py) in a
+temporary directory and times each stage run_compression goes through:
+
+    python  read, compress (stb_compress), encode <encoding> for every
+            encoder, write <encoding> (the output written to disk)
+    native  pipeline <encoding>: the whole binary_to_compressed_c run,
+            reading the font and writing the output file
+
+Times are the best of --repeat runs. Peak memory is measured in a separate
+pass: tracemalloc's peak above the memory held when the stage starts for
+the Python backend, the peak RSS of the process for the native one (needs
+a C++ compiler to build a small launcher, so not measured on Windows). The native tool is the bundled executable on
+Windows; elsewhere it is built from data/binary_to_compressed_c.cpp when a
+C++ compiler is on the PATH, or given with --native. Backends that aren't
+available are skipped.
+
+With --json the results are written with the machine, Python version,
+commit and corpus hashes. `compare` matches two such files stage by stage
+and exits with 1 when throughput dropped, or peak memory grew, by more
+than the threshold.
+"""
+import argparse
+import hashlib
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from synthetic_fonts import CORPUS, generate
+from imfont_compressor.core.stb import stb_compress
+from imfont_compressor.core.encoders import ENCODERS, encode
+from imfont_compressor.core.utils import get_resource_path
+
+RESULTS_FORMAT = 1
+NATIVE_SOURCE = get_resource_path("data", "binary_to_compressed_c.cpp")
+NATIVE_EXE = get_resource_path("data", "binary_to_compressed_c.exe")
+# Peak memory growth below this is noise (allocator pools, interned objects)
+MEMORY_NOISE = 64 * 1024
+
+
+def machine_info():
+    info = {
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+    }
+    try:
+        info["commit"] = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        info["commit"] = None
+    return info
+
+
+# Runs a command and prints its peak RSS. The tool is started from this small
+# process rather than from Python: on Linux a child's peak RSS starts at the
+# size of the process it was forked from.
+PEAK_RSS_LAUNCHER = r"""
+#include <stdio.h>
+#include <sys/resource.h>
+#include <sys/wait.h>
+#include <unistd.h>
+int main(int argc, char** argv)
+{
+    pid_t pid = fork();
+    if (pid == 0) { execv(argv[1], argv + 1); _exit(127); }
+    int status = 0;
+    struct rusage usage;
+    if (pid < 0 || wait4(pid, &status, 0, &usage) < 0) return 126;
+    fprintf(stderr, "\npeak_rss=%ld\n", usage.ru_maxrss);
+    return WIFEXITED(status) ? WEXITSTATUS(status) : 125;
+}
+"""
+
+
+def _find_compiler():
+    return shutil.which("c++") or shutil.which("g++") or shutil.which("clang++")
+
+
+def _build(compiler, source_path, output_path):
+    try:
+        subprocess.run([compiler, "-O2", "-o", output_path, source_path], capture_output=True, check=True)
+        return output_path
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"Failed to build {os.path.basename(source_path)}: {e}")
+        return None
+
+
+def find_native(explicit, build_dir):
+    """
+    (path of a runnable binary_to_compressed_c or None, peak RSS launcher or None).
+    The launcher needs a C++ compiler and a POSIX system.
+    """
+    compiler = _find_compiler() if os.name != "nt" else None
+    launcher = None
+    if compiler is not None:
+        source_path = os.path.join(build_dir, "peak_rss.cpp")
+        with open(source_path, "w", encoding="utf-8") as f:
+            f.write(PEAK_RSS_LAUNCHER)
+        launcher = _build(compiler, source_path, os.path.join(build_dir, "peak_rss"))
+
+    if explicit:
+        return explicit, launcher
+    if os.name == "nt":
+        return (NATIVE_EXE if os.path.isfile(NATIVE_EXE) else None), None
+    if compiler is None:
+        return None, None
+    return _build(compiler, NATIVE_SOURCE, os.path.join(build_dir, "binary_to_compressed_c")), launcher
+
+
+def _best(func, repeat):
+    """(result, best seconds, median seconds) over `repeat` runs."""
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return result, min(times), statistics.median(times)
+
+
+def _peak(func):
+    """Bytes allocated by func at its peak, above what was allocated before it started."""
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        func()
+        return tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+
+
+def python_stages(path, output_path):
+    """Yield (stage, bytes processed, func) for the in-process pipeline of one font."""
+    def read():
+        with open(path, "rb") as f:
+            return f.read()
+
+    data = read()
+    yield "read", len(data), read
+
+    compressed = stb_compress(data)
+    yield "compress", len(data), lambda: stb_compress(data)
+
+    for encoding in ENCODERS:
+        def encode_stage(encoding=encoding):
+            return encode(compressed, encoding, "data", path, len(data))
+        text = encode_stage()
+        yield f"encode {encoding}", len(compressed), encode_stage
+
+        def write(text=text):
+            with open(output_path, "w", encoding="utf-8", newline="") as f:
+                f.write(text)
+        yield f"write {encoding}", len(text), write
+
+
+def _run_native(native, launcher, encoding, path, output_path):
+    """Run the tool once. :return: its peak RSS in bytes, or None without the launcher"""
+    args = [native, encoding, path, "-output", output_path, "data"]
+    if launcher is not None:
+        args.insert(0, launcher)
+    result = subprocess.run(args, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"{native} failed: {result.stderr.strip()}")
+    if launcher is None:
+        return None
+    peak = int(result.stderr.rsplit("peak_rss=", 1)[1])
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return peak * (1 if sys.platform == "darwin" else 1024)
+
+
+def native_stages(native, launcher, path, output_path):
+    """Yield (stage, bytes processed, func) for the native tool; func returns the peak RSS or None."""
+    size = os.path.getsize(path)
+    for encoding in ENCODERS:
+        def pipeline(encoding=encoding):
+            return _run_native(native, launcher, encoding, path, output_path)
+        yield f"pipeline {encoding}", size, pipeline
+
+
+def run(args):
+    fonts = args.fonts.split(",") if args.fonts else list(CORPUS)
+    backends = args.backends.split(",")
+    for name in fonts:
+        if name not in CORPUS:
+            print(f"Unknown font '{name}', choose from {', '.join(CORPUS)}")
+            return 2
+
+    directory = tempfile.mkdtemp(prefix="imfont_pipeline_")
+    try:
+        native, launcher = find_native(args.native, directory) if "native" in backends else (None, None)
+        if "native" in backends and native is None:
+            print("Skipping the native backend: no executable and no C++ compiler")
+            backends.remove("native")
+
+        corpus = {}
+        paths = {}
+        for name in fonts:
+            data = generate(name, args.scale)
+            paths[name] = os.path.join(directory, f"{name}.ttf")
+            with open(paths[name], "wb") as f:
+                f.write(data)
+            corpus[name] = {"size": len(data), "sha256": hashlib.sha256(data).hexdigest(),
+                            "description": CORPUS[name][2]}
+        output_path = os.path.join(directory, "output.cpp")
+
+        results = {}
+        print(f"{'Backend':<8}{'Font':<7}{'Stage':<18}{'Bytes':>10}{'Best':>11}{'Median':>11}"
+              f"{'MB/s':>9}{'Peak':>11}")
+        for backend in backends:
+            for name in fonts:
+                path = paths[name]
+                if backend == "python":
+                    stages = python_stages(path, output_path)
+                else:
+                    stages = native_stages(native, launcher, path, output_path)
+
+                for stage, size, func in stages:
+                    value, best, median = _best(func, args.repeat)
+                    peak = value if backend == "native" else _peak(func)
+                    row = {
+                        "bytes": size,
+                        "best_s": round(best, 6),
+                        "median_s": round(median, 6),
+                        "mb_per_s": round(size / best / 1e6, 3) if best > 0 else None,
+                        "peak_bytes": peak
+                    }
+                    results[f"{backend}/{name}/{stage}"] = row
+                    peak_text = f"{peak / 1024:>8.0f} KB" if peak is not None else f"{'-':>11}"
+                    print(f"{backend:<8}{name:<7}{stage:<18}{size:>10}{best * 1000:>8.1f} ms"
+                          f"{median * 1000:>8.1f} ms{row['mb_per_s']:>9.2f}{peak_text}")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "format": RESULTS_FORMAT,
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "machine": machine_info(),
+                "settings": {"repeat": args.repeat, "scale": args.scale, "backends": backends},
+                "corpus": corpus,
+                "results": results
+            }, f, indent=2)
+        print(f"Results written to {args.json}")
+    return 0
+
+
+def compare(args):
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(args.current, "r", encoding="utf-8") as f:
+        current = json.load(f)
+
+    for key in ("machine", "settings"):
+        if baseline.get(key) != current.get(key):
+            differences = sorted(k for k in set(baseline.get(key, {})) | set(current.get(key, {}))
+                                 if baseline.get(key, {}).get(k) != current.get(key, {}).get(k))
+            print(f"Warning: {key} differs ({', '.join(differences)}), numbers may not be comparable")
+    for name, entry in current.get("corpus", {}).items():
+        if name in baseline.get("corpus", {}) and baseline["corpus"][name]["sha256"] != entry["sha256"]:
+            print(f"Warning: the '{name}' corpus font changed, its numbers are not comparable")
+
+    regressions = 0
+    print(f"{'Stage':<40}{'Baseline':>15}{'Current':>15}{'Change':>9}{'Peak change':>13}")
+    for key, row in current["results"].items():
+        old = baseline["results"].get(key)
+        if old is None:
+            print(f"{key:<40}{'new':>15}")
+            continue
+
+        flags = []
+        change = None
+        if old["mb_per_s"] and row["mb_per_s"]:
+            change = row["mb_per_s"] / old["mb_per_s"] - 1.0
+            if change < -args.threshold:
+                flags.append("slower")
+        peak_change = None
+        if old["peak_bytes"] and row["peak_bytes"] is not None:
+            peak_change = row["peak_bytes"] / old["peak_bytes"] - 1.0
+            if peak_change > args.memory_threshold and row["peak_bytes"] - old["peak_bytes"] > MEMORY_NOISE:
+                flags.append("more memory")
+
+        regressions += bool(flags)
+        change_text = f"{change:>+9.1%}" if change is not None else f"{'-':>9}"
+        peak_text = f"{peak_change:>+13.1%}" if peak_change is not None else f"{'-':>13}"
+        print(f"{key:<40}{old['mb_per_s'] or 0:>10.2f} MB/s{row['mb_per_s'] or 0:>10.2f} MB/s"
+              f"{change_text}{peak_text}" + (f"  REGRESSION: {', '.join(flags)}" if flags else ""))
+
+    for key in baseline["results"]:
+        if key not in current["results"]:
+            print(f"{key:<40}{'missing':>15}")
+
+    print(f"{regressions} regression(s) beyond {args.threshold:.0%} throughput / "
+          f"{args.memory_threshold:.0%} peak memory")
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the compression pipeline stage by stage.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmark")
+    run_parser.add_argument("--json", help="write the results to this file")
+    run_parser.add_argument("--repeat", type=int, default=3, help="timed runs per stage (default 3)")
+    run_parser.add_argument("--scale", type=float, default=1.0, help="corpus size multiplier (default 1.0)")
+    run_parser.add_argument("--fonts", help=f"comma-separated subset of: {', '.join(CORPUS)}")
+    run_parser.add_argument("--backends", default="python,native", help="comma-separated backends")
+    run_parser.add_argument("--native", help="binary_to_compressed_c executable to benchmark")
+
+    compare_parser = commands.add_parser("compare", help="flag regressions against a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10,
+                                help="allowed throughput drop (default 0.10)")
+    compare_parser.add_argument("--memory-threshold", type=float, default=0.10,
+                                help="allowed peak memory growth (default 0.10)")
+
+    args = parser.parse_args()
+    return run(args) if args.command == "run" else compare(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+Time the preview's paged reads on a large output.
+
+    python benchmarks/bench_preview.py [size in MB]
+
+Writes a synthetic -u8 style output of the given size (100 MB by default)
+and times what the preview tab does with it: indexing the lines once, then
+reading a screenful at the start, the end and random places, and searching
+for text near the end and for text that isn't there. Everything except
+indexing runs on the Tk thread, so those should stay well below a frame.
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from imfont_compressor.core.preview import OutputDocument
+
+SCREEN_LINES = 40
+
+
+def write_output(path, size):
+    row = "    " + ",".join(f"0x{i:02x}" for i in range(24)) + ",\n"
+    rows = size // len(row)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write("static const unsigned char data[] = {\n")
+        for _ in range(rows // 1000):
+            f.write(row * 1000)
+        f.write("    0xff // needle\n};\n")
+
+
+def timed_ms(func, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000.0 / repeat
+
+
+def main():
+    size = int(sys.argv[1]) * 1024 * 1024 if len(sys.argv) > 1 else 100 * 1024 * 1024
+    fd, path = tempfile.mkstemp(suffix=".cpp")
+    os.close(fd)
+    try:
+        write_output(path, size)
+        document = OutputDocument(path)
+        index_ms = timed_ms(document.index)
+        lines = document.line_count
+
+        rows = [
+            ("index (background)", index_ms),
+            ("screen at start", timed_ms(lambda: document.read_lines(0, SCREEN_LINES), 100)),
+            ("screen at end", timed_ms(lambda: document.read_lines(lines - SCREEN_LINES, SCREEN_LINES), 100)),
+            ("screen at random line", timed_ms(lambda: document.read_lines(random.randrange(lines), SCREEN_LINES), 100)),
+            ("find near end (background)", timed_ms(lambda: document.find("NEEDLE"))),
+            ("find missing (background)", timed_ms(lambda: document.find("not there")))
+        ]
+        print(f"{document.size / 1024 / 1024:.0f} MB, {lines:,} lines")
+        for label, ms in rows:
+            print(f"  {label:<28}{ms:9.2f} ms")
+    finally:
+        os.remove(path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""
+Per-job latency and throughput of the compression daemon against a fresh
+process per job, and its back-pressure.
+
+    python benchmarks/bench_server.py [--jobs 32] [--workers N] [--scale 0.25]
+
+Everything runs on localhost with the Python engine (the native tool isn't
+needed). Each job is the synthetic Latin font (benchmarks/synthetic_fonts.py)
+with a few unique trailing bytes, so no two jobs share a cache entry:
+
+    spawn    one new Python process per job, as separate build steps do
+    daemon   all jobs uploaded at once to `serve`, then waited for
+    repeat   the same uploads again, answered from the result cache
+
+Latency is submission to finished as the client sees it, so in the daemon
+phases it includes waiting in the queue behind the other jobs; the rate
+is the figure to compare. Then a server with one worker and a queue of 2
+is flooded: the surplus must be refused with 503 and every accepted job
+must still finish.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from synthetic_fonts import generate
+from imfont_compressor.core.server import JobServer, make_server
+
+SPAWN_JOB = (
+    "import sys; from imfont_compressor.core.compressor import run_compression; "
+    "r = run_compression({'font_path': sys.argv[1], 'symbol_name': '', 'encoding': '-u8', "
+    "'disable_compression': False, 'no_static': False, 'header_output': False}, None, in_process=True); "
+    "sys.exit(not r['success'])"
+)
+
+
+def _request(url, data=None, content_type="application/octet-stream"):
+    request = urllib.request.Request(url, data=data, headers={"Content-Type": content_type} if data else {})
+    try:
+        with urllib.request.urlopen(request, timeout=600) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def _fonts(count, scale):
+    base = generate("latin", scale)
+    return [base + i.to_bytes(4, "little") for i in range(count)]
+
+
+def _run_job(url, index, font):
+    start = time.perf_counter()
+    code, job = _request(f"{url}/jobs?name=Job{index}.ttf&in_process=1", font)
+    if code != 202:
+        raise RuntimeError(f"submission refused with {code}: {job}")
+    while job["status"] not in ("done", "failed"):
+        _, job = _request(f"{url}/jobs/{job['id']}?wait=30")
+    if job["status"] != "done":
+        raise RuntimeError(job["error"])
+    return (time.perf_counter() - start) * 1000.0
+
+
+def _report(name, latencies, wall_s):
+    latencies = sorted(latencies)
+    p90 = latencies[max(0, int(0.9 * len(latencies) + 0.5) - 1)]
+    print(f"{name:<8}{len(latencies):>6}{statistics.median(latencies):>11.1f} ms{p90:>11.1f} ms"
+          f"{len(latencies) / wall_s:>11.1f}/s")
+
+
+def bench_spawn(directory, fonts):
+    env = dict(os.environ, PYTHONPATH=ROOT, IMFONT_TELEMETRY="")
+    latencies = []
+    start = time.perf_counter()
+    for i, font in enumerate(fonts):
+        path = os.path.join(directory, f"Spawn{i}.ttf")
+        with open(path, "wb") as f:
+            f.write(font)
+        job_start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", SPAWN_JOB, path], env=env, check=True)
+        latencies.append((time.perf_counter() - job_start) * 1000.0)
+    _report("spawn", latencies, time.perf_counter() - start)
+
+
+def _start(workers, queue_size):
+    jobs = JobServer(workers, queue_size, in_process=True).start()
+    httpd = make_server(jobs, port=0)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return jobs, httpd, f"http://127.0.0.1:{httpd.server_address[1]}"
+
+
+def _stop(jobs, httpd):
+    httpd.shutdown()
+    httpd.server_close()
+    jobs.close()
+
+
+def bench_daemon(fonts, workers):
+    jobs, httpd, url = _start(workers, len(fonts))
+    try:
+        for name in ("daemon", "repeat"):
+            start = time.perf_counter()
+            with ThreadPoolExecutor(len(fonts)) as pool:
+                latencies = list(pool.map(lambda args: _run_job(url, *args), enumerate(fonts)))
+            _report(name, latencies, time.perf_counter() - start)
+        _, status = _request(f"{url}/status")
+        print(f"\nServer status: {status['jobs']['completed']} jobs done, result cache "
+              f"{status['result_cache']['hits']} hits / {status['result_cache']['misses']} misses, "
+              f"run p50 {status['run_ms']['p50']:.1f} ms")
+    finally:
+        _stop(jobs, httpd)
+
+
+def bench_back_pressure(fonts):
+    jobs, httpd, url = _start(1, 2)
+    try:
+        accepted, refused = [], 0
+        for i, font in enumerate(fonts):
+            code, job = _request(f"{url}/jobs?name=Flood{i}.ttf&in_process=1", font)
+            if code == 202:
+                accepted.append(job["id"])
+            elif code == 503:
+                refused += 1
+            else:
+                raise RuntimeError(f"unexpected {code}: {job}")
+        finished = [_request(f"{url}/jobs/{job_id}?wait=60")[1]["status"] for job_id in accepted]
+        _, status = _request(f"{url}/status")
+    finally:
+        _stop(jobs, httpd)
+
+    ok = refused > 0 and finished.count("done") == len(accepted) and status["jobs"]["rejected"] == refused
+    print(f"Back-pressure: {len(accepted)} accepted, {refused} refused with 503, "
+          f"{finished.count('done')} of the accepted finished: {'OK' if ok else 'FAILED'}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the compression daemon against a process per job.")
+    parser.add_argument("--jobs", type=int, default=32, help="jobs per phase (default 32)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="daemon worker processes")
+    parser.add_argument("--scale", type=float, default=0.25, help="size of the Latin font (default 0.25)")
+    args = parser.parse_args()
+
+    os.environ["IMFONT_TELEMETRY"] = ""  # workers inherit it: keep the benchmark out of the job log
+    fonts = _fonts(args.jobs, args.scale)
+    print(f"{args.jobs} jobs of {len(fonts[0]) / 1024:.1f} KB, {args.workers} daemon workers\n")
+    print(f"{'Mode':<8}{'Jobs':>6}{'Median':>14}{'p90':>14}{'Rate':>13}")
+
+    with tempfile.TemporaryDirectory(prefix="imfont_bench_server_") as directory:
+        bench_spawn(directory, fonts)
+    bench_daemon(fonts, args.workers)
+    print()
+    return 0 if bench_back_pressure(fonts[:16]) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""
+Time GUI startup phase by phase.
+
+    python benchmarks/bench_startup.py [runs] [--json results.json]
+
+Needs a display. Starts the application in a fresh interpreter `runs` times
+(5 by default) with --profile-startup --exit-after-startup, so the window
+closes as soon as its first frame is painted, and prints the median of each
+phase. Interpreter start-up is included in "process". With --json the
+medians are also written to a file, to compare startup across releases.
+"""
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+PHASE_LINE = re.compile(r"^\s+(.+?)\s+([\d.]+) ms")
+
+
+def run_once():
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-m", "imfont_compressor", "--profile-startup", "--exit-after-startup"],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    process_ms = (time.perf_counter() - start) * 1000.0
+
+    phases = {}
+    for line in output.splitlines():
+        match = PHASE_LINE.match(line)
+        if match:
+            phases[match.group(1)] = float(match.group(2))
+    if not phases:
+        raise RuntimeError(f"No startup profile in the output:\n{output}")
+    phases["process"] = process_ms
+    return phases
+
+
+def main():
+    args = sys.argv[1:]
+    json_path = None
+    if "--json" in args:
+        index = args.index("--json")
+        json_path = args[index + 1]
+        del args[index:index + 2]
+    runs = int(args[0]) if args else 5
+
+    samples = [run_once() for _ in range(runs)]
+    medians = {name: statistics.median(run[name] for run in samples) for name in samples[0]}
+
+    print(f"median of {runs} runs")
+    for name, ms in medians.items():
+        print(f"  {name:<16}{ms:8.1f} ms")
+
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump({"runs": runs, "python": sys.version.split()[0], "phases_ms": medians}, f, indent=4)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+Time theme listing and switching with a large theme pack.
+
+    python benchmarks/bench_themes.py [theme count]
+
+Copies the bundled themes into a temporary directory until it holds the
+requested number of files (500 by default), then times what the options
+tab does: the initial scan, listing themes for the combobox and switching
+themes, plus a re-scan after one file was edited. The "full parse" column
+is the cost of reading every file, what each call did before the registry.
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from imfont_compressor.core.ui_theme import UITheme
+from imfont_compressor.core.utils import get_resource_path
+
+
+def build_theme_pack(directory, count):
+    bundled = []
+    source_dir = get_resource_path("assets", "themes")
+    for filename in sorted(os.listdir(source_dir)):
+        with open(os.path.join(source_dir, filename), "r", encoding="utf-8") as f:
+            bundled.append(json.load(f))
+
+    for index in range(count):
+        theme = dict(bundled[index % len(bundled)])
+        theme["id"] = f"{theme['id']}_{index}"
+        theme["name"] = f"{theme.get('name', theme['id'])} {index}"
+        with open(os.path.join(directory, f"theme_{index:04}.json"), "w", encoding="utf-8") as f:
+            json.dump(theme, f, indent=4)
+
+
+def full_parse(directory):
+    for filename in os.listdir(directory):
+        with open(os.path.join(directory, filename), "r", encoding="utf-8") as f:
+            json.load(f)
+
+
+def timed_ms(func, repeat=20):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, (time.perf_counter() - start) * 1000.0)
+    return best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    directory = tempfile.mkdtemp(prefix="imfont_themes_")
+    try:
+        build_theme_pack(directory, count)
+        app = SimpleNamespace(initialized=False, main_window=None)
+
+        start = time.perf_counter()
+        theme = UITheme(app, default_theme="dark_0", theme_dir=directory)
+        cold_ms = (time.perf_counter() - start) * 1000.0
+
+        names = list(theme.get_theme_display_map())
+        switch = iter(names * 100)
+
+        def switch_theme():
+            # What on_theme_changed does: resolve the display name, then load
+            display = theme.get_theme_display_map()
+            theme.load_theme(*display[next(switch)])
+
+        parse_ms = timed_ms(lambda: full_parse(directory), repeat=3)
+        list_ms = timed_ms(theme.get_theme_display_list)
+        switch_ms = timed_ms(switch_theme)
+
+        edited = os.path.join(directory, "theme_0000.json")
+
+        def edit_and_list():
+            os.utime(edited, ns=(time.time_ns(), time.time_ns()))
+            theme.get_theme_display_list()
+
+        edit_ms = timed_ms(edit_and_list)
+
+        print(f"{count} theme files")
+        print(f"  full parse (old per-call cost) {parse_ms:8.2f} ms")
+        print(f"  cold scan + first load         {cold_ms:8.2f} ms")
+        print(f"  list themes (warm)             {list_ms:8.2f} ms")
+        print(f"  switch theme (warm)            {switch_ms:8.2f} ms")
+        print(f"  re-scan after one edit         {edit_ms:8.2f} ms")
+    finally:
+        shutil.rmtree(directory)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
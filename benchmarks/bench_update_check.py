@@ -0,0 +1,109 @@
+"""
+Exercise the update check against a local stand-in for the GitHub API.
+
+    python benchmarks/bench_update_check.py
+
+Starts an HTTP server on 127.0.0.1 that serves a release with an ETag and
+answers conditional requests with 304, then times the checks the Options
+tab makes and counts how many reach the server: first check, repeated
+checks within the TTL, a check after the TTL (conditional, 304), a new
+release (200), and a server slower than the timeout. The cache goes to a
+temporary directory; a fake clock stands in for waiting out the TTL.
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from imfont_compressor.core.updates import UpdateChecker, UpdateCheckError
+
+
+class StandIn:
+    def __init__(self):
+        self.tag = "v1.0.2"
+        self.delay = 0.0
+        self.hits = []  # status code of every request served
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                time.sleep(stand_in.delay)
+                etag = f'"{stand_in.tag}"'
+                if self.headers.get("If-None-Match") == etag:
+                    stand_in.hits.append(304)
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                body = json.dumps({"tag_name": stand_in.tag, "html_url": f"https://example.invalid/{stand_in.tag}"}).encode()
+                stand_in.hits.append(200)
+                self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/releases/latest"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+
+def main():
+    stand_in = StandIn()
+    directory = tempfile.mkdtemp(prefix="imfont_updates_")
+    now = [1_000_000.0]
+    try:
+        def checker():
+            # A new checker per step, like a new app session reading the cache from disk
+            return UpdateChecker(stand_in.url, os.path.join(directory, "update_cache.json"),
+                                 ttl=3600, timeout=0.5, current_version="1.0.2", clock=lambda: now[0])
+
+        def step(label, func):
+            before = len(stand_in.hits)
+            start = time.perf_counter()
+            try:
+                result = func()
+                outcome = f"{result['source']}, update={result['is_update']}"
+            except UpdateCheckError as e:
+                outcome = f"error: {e}"
+            ms = (time.perf_counter() - start) * 1000.0
+            served = stand_in.hits[before:]
+            print(f"  {label:<34}{ms:8.2f} ms  requests={len(served)} {served}  {outcome}")
+
+        step("first check", lambda: checker().check())
+        session = checker()
+        start_hits = len(stand_in.hits)
+        for _ in range(100):
+            session.check()
+        print(f"  100 checks within the TTL          requests={len(stand_in.hits) - start_hits}")
+        step("new session within the TTL", lambda: checker().check())
+
+        now[0] += 3601
+        step("after the TTL (unchanged)", lambda: checker().check())
+        step("forced check", lambda: checker().check(force=True))
+
+        stand_in.tag = "v1.1.0"
+        now[0] += 3601
+        step("after the TTL (new release)", lambda: checker().check())
+
+        stand_in.delay = 2.0
+        now[0] += 3601
+        step("server slower than the timeout", lambda: checker().check())
+    finally:
+        stand_in.server.shutdown()
+        shutil.rmtree(directory)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,270 @@
+"""
+Deterministic synthetic fonts for benchmarks.
+
+    python benchmarks/synthetic_fonts.py output_dir [--scale 1.0]
+
+Each font is a structurally valid sfnt file (table directory, head, hhea,
+maxp, name, cmap, hmtx and glyf/loca or CFF) generated from a fixed seed,
+so every machine benchmarks exactly the same bytes without shipping
+third-party fonts:
+
+    latin   small TrueType font, ~100 unique outlines
+    cjk     large TrueType font whose glyphs are built from a shared set of
+            strokes, like the radicals of real CJK fonts
+    icons   TrueType icon font with few, large and detailed outlines
+    cff     CFF-flavoured font whose charstrings are high-entropy, standing
+            in for data that is already compressed and barely shrinks
+
+Importing the module gives CORPUS and generate(name, scale).
+"""
+import hashlib
+import os
+import random
+import struct
+import sys
+
+# name: (seed, target size in bytes at scale 1, description)
+CORPUS = {
+    "latin": (1, 64 * 1024, "small Latin TrueType font"),
+    "cjk": (2, 1024 * 1024, "large CJK-like TrueType font"),
+    "icons": (3, 160 * 1024, "icon font with large outlines"),
+    "cff": (4, 256 * 1024, "CFF font with already-compressed charstrings"),
+}
+
+_ON_CURVE = 0x01
+_X_SHORT = 0x02
+_Y_SHORT = 0x04
+_X_SAME_OR_POSITIVE = 0x10
+_Y_SAME_OR_POSITIVE = 0x20
+
+
+def _checksum(data):
+    data += b"\0" * (-len(data) % 4)
+    return sum(struct.unpack(f">{len(data) // 4}I", data)) & 0xFFFFFFFF
+
+
+def _sfnt(tables, flavor):
+    """Assemble an sfnt file from { tag: bytes }, with 4-byte aligned tables."""
+    tags = sorted(tables)
+    count = len(tags)
+    power = 1 << (count.bit_length() - 1)
+    header = struct.pack(">4sHHHH", flavor, count, power * 16, power.bit_length() - 1, count * 16 - power * 16)
+
+    offset = len(header) + count * 16
+    records = []
+    body = []
+    for tag in tags:
+        data = tables[tag]
+        records.append(struct.pack(">4sIII", tag.encode("ascii"), _checksum(data), offset, len(data)))
+        padded = data + b"\0" * (-len(data) % 4)
+        body.append(padded)
+        offset += len(padded)
+    return header + b"".join(records) + b"".join(body)
+
+
+def _head(units_per_em, long_loca):
+    return struct.pack(
+        ">IIIIHHqqhhhhHHhhh",
+        0x00010000, 0x00010000, 0, 0x5F0F3CF5, 0x000B, units_per_em,
+        0, 0, 0, -200, units_per_em, units_per_em, 0, 8, 2, 1 if long_loca else 0, 0
+    )
+
+
+def _hhea(units_per_em, glyph_count):
+    return struct.pack(
+        ">IhhhHhhhhhhhhhhhH",
+        0x00010000, int(units_per_em * 0.8), -int(units_per_em * 0.2), 0, units_per_em,
+        0, 0, units_per_em, 1, 0, 0, 0, 0, 0, 0, 0, glyph_count
+    )
+
+
+def _maxp(glyph_count, truetype):
+    if not truetype:
+        return struct.pack(">IH", 0x00005000, glyph_count)
+    return struct.pack(">IHHHHHHHHHHHHHH", 0x00010000, glyph_count, 512, 64, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0)
+
+
+def _name(family):
+    records = [(1, family), (2, "Regular"), (4, f"{family} Regular"), (6, family.replace(" ", ""))]
+    strings = b""
+    entries = b""
+    for name_id, text in records:
+        encoded = text.encode("utf-16-be")
+        entries += struct.pack(">HHHHHH", 3, 1, 0x409, name_id, len(encoded), len(strings))
+        strings += encoded
+    return struct.pack(">HHH", 0, len(records), 6 + len(entries)) + entries + strings
+
+
+def _cmap(first_code, glyph_count):
+    # Format 12, one group mapping a contiguous range of code points to glyphs 1..n
+    subtable = struct.pack(">HHIII", 12, 0, 28, 0, 1) + struct.pack(">III", first_code, first_code + glyph_count - 2, 1)
+    return struct.pack(">HHHHI", 0, 1, 3, 10, 12) + subtable
+
+
+def _hmtx(rng, advances):
+    return b"".join(struct.pack(">Hh", advance, rng.randint(0, 80)) for advance in advances)
+
+
+def _glyph(contours):
+    """Encode a simple glyph from a list of contours of (x, y, on_curve) points."""
+    points = [p for contour in contours for p in contour]
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+
+    end_points = []
+    total = 0
+    for contour in contours:
+        total += len(contour)
+        end_points.append(total - 1)
+
+    flags = bytearray()
+    x_data = bytearray()
+    y_data = bytearray()
+    last_x = last_y = 0
+    for x, y, on_curve in points:
+        flag = _ON_CURVE if on_curve else 0
+        for delta, data, short, same in ((x - last_x, x_data, _X_SHORT, _X_SAME_OR_POSITIVE),
+                                         (y - last_y, y_data, _Y_SHORT, _Y_SAME_OR_POSITIVE)):
+            if delta == 0:
+                flag |= same
+            elif -256 < delta < 256:
+                flag |= short | (same if delta > 0 else 0)
+                data.append(abs(delta))
+            else:
+                data += struct.pack(">h", delta)
+        flags.append(flag)
+        last_x, last_y = x, y
+
+    header = struct.pack(">hhhhh", len(contours), min(xs), min(ys), max(xs), max(ys))
+    glyph = header + struct.pack(f">{len(end_points)}H", *end_points) + b"\0\0" + flags + x_data + y_data
+    return glyph + b"\0" * (-len(glyph) % 2)
+
+
+def _random_contour(rng, x0, y0, size, point_count, step):
+    """A closed random walk around (x0, y0), mixing on- and off-curve points."""
+    points = []
+    x, y = x0, y0
+    for i in range(point_count):
+        x = max(0, min(x0 + size, x + rng.randint(-step, step)))
+        y = max(-size // 5, min(y0 + size, y + rng.randint(-step, step)))
+        points.append((x, y, i % 3 != 1))
+    return points
+
+
+def _truetype(rng, family, target_size, units_per_em, first_code, make_glyph):
+    glyphs = [b""]  # .notdef
+    size = 0
+    while size < target_size:
+        glyph = make_glyph(len(glyphs))
+        glyphs.append(glyph)
+        size += len(glyph)
+
+    offsets = [0]
+    for glyph in glyphs:
+        offsets.append(offsets[-1] + len(glyph))
+    long_loca = offsets[-1] > 0x1FFFE
+    loca = struct.pack(f">{len(offsets)}{'I' if long_loca else 'H'}",
+                       *(offsets if long_loca else [o // 2 for o in offsets]))
+
+    count = len(glyphs)
+    return _sfnt({
+        "head": _head(units_per_em, long_loca),
+        "hhea": _hhea(units_per_em, count),
+        "maxp": _maxp(count, True),
+        "name": _name(family),
+        "cmap": _cmap(first_code, count),
+        "hmtx": _hmtx(rng, [units_per_em // 2 + rng.randint(0, 200) for _ in range(count)]),
+        "loca": loca,
+        "glyf": b"".join(glyphs),
+    }, b"\0\1\0\0")
+
+
+def _latin(rng, target_size):
+    # A Latin font has about a hundred distinct shapes; extra glyphs repeat them
+    # with accents, the way accented letters reuse their base outline
+    bases = [
+        [_random_contour(rng, 50, 0, 600, rng.randint(12, 40), 60) for _ in range(rng.randint(1, 3))]
+        for _ in range(100)
+    ]
+    accents = [_random_contour(rng, 150, 650, 200, rng.randint(6, 12), 30) for _ in range(12)]
+
+    def make_glyph(index):
+        if index <= len(bases):
+            return _glyph(bases[index - 1])
+        return _glyph(rng.choice(bases) + [rng.choice(accents)])
+
+    return _truetype(rng, "Synthetic Latin", target_size, 1000, 0x20, make_glyph)
+
+
+def _cjk(rng, target_size):
+    strokes = [_random_contour(rng, 0, 0, 400, rng.randint(8, 24), 40) for _ in range(400)]
+
+    def make_glyph(index):
+        contours = []
+        for _ in range(rng.randint(4, 12)):
+            dx, dy = rng.randint(0, 6) * 100, rng.randint(0, 6) * 100
+            contours.append([(x + dx, y + dy, on) for x, y, on in rng.choice(strokes)])
+        return _glyph(contours)
+
+    return _truetype(rng, "Synthetic CJK", target_size, 1000, 0x4E00, make_glyph)
+
+
+def _icons(rng, target_size):
+    def make_glyph(index):
+        return _glyph([
+            _random_contour(rng, rng.randint(0, 8) * 100, rng.randint(0, 8) * 100, 1200, rng.randint(40, 160), 90)
+            for _ in range(rng.randint(2, 8))
+        ])
+
+    return _truetype(rng, "Synthetic Icons", target_size, 2048, 0xF000, make_glyph)
+
+
+def _cff(rng, target_size):
+    count = max(16, target_size // 180)
+    header = b"\1\0\4\4" + b"\0\1\1\1" + b"Synthetic CFF\0"
+    charstrings = rng.randbytes(target_size - len(header))
+    return _sfnt({
+        "head": _head(1000, False),
+        "hhea": _hhea(1000, count),
+        "maxp": _maxp(count, False),
+        "name": _name("Synthetic CFF"),
+        "cmap": _cmap(0x20, count),
+        "hmtx": _hmtx(rng, [500 + rng.randint(0, 200) for _ in range(count)]),
+        "CFF ": header + charstrings,
+    }, b"OTTO")
+
+
+_GENERATORS = {"latin": _latin, "cjk": _cjk, "icons": _icons, "cff": _cff}
+
+
+def generate(name, scale=1.0) -> bytes:
+    """Bytes of a corpus font; the same name and scale always give the same bytes."""
+    seed, target_size, _ = CORPUS[name]
+    return _GENERATORS[name](random.Random(seed), max(1024, int(target_size * scale)))
+
+
+def write_corpus(directory, scale=1.0):
+    """Write every corpus font to `directory`. :return: { name: (path, sha256) }"""
+    os.makedirs(directory, exist_ok=True)
+    written = {}
+    for name in CORPUS:
+        data = generate(name, scale)
+        path = os.path.join(directory, f"synthetic_{name}.{'otf' if name == 'cff' else 'ttf'}")
+        with open(path, "wb") as f:
+            f.write(data)
+        written[name] = (path, hashlib.sha256(data).hexdigest())
+    return written
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        return 1
+    scale = float(sys.argv[sys.argv.index("--scale") + 1]) if "--scale" in sys.argv else 1.0
+    for name, (path, digest) in write_corpus(sys.argv[1], scale).items():
+        print(f"{name:<8}{os.path.getsize(path):>10} bytes  {digest[:16]}  {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
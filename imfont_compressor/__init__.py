@@ -1,7 +1,8 @@
 from .main import run_app
+from .api import compress_bytes, compress_file
 
 __version__ = "1.0.2"
-__all__ = ["run_app"]
+__all__ = ["run_app", "compress_bytes", "compress_file"]
 
 AUTHOR = "!D4RK"
 CURRENT_VERSION = __version__
@@ -0,0 +1,4 @@
+import sys
+from imfont_compressor.cli import main
+
+sys.exit(main())
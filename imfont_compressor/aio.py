@@ -0,0 +1,169 @@
+"""
+asyncio front end to the library API, for async build and asset servers.
+
+    from imfont_compressor.aio import AsyncCompressor, compress_file_async
+
+    source = await compress_file_async("Roboto.ttf", encoding="base85", symbol="roboto")
+
+    async with AsyncCompressor(max_workers=4) as compressor:
+        await compressor.compress_file("Roboto.ttf", writer=stream_writer)  # streamed in chunks
+        async for result in compressor.compress_batch(paths, encoding="base85"):
+            print(result["path"], result["success"])
+
+The work runs in a process pool on the same engine as compress_bytes and
+compress_file (imfont_compressor.api), which take the same options. A
+semaphore keeps at most `concurrency` jobs submitted at once. Cancelling the
+awaiting task cancels a job still waiting for its turn; one already running
+in a worker finishes there and its result is dropped.
+
+This module isn't imported by `imfont_compressor`, so the sync API doesn't
+pay for importing asyncio.
+"""
+import asyncio
+import functools
+import inspect
+import os
+import weakref
+from imfont_compressor.api import compress_bytes, compress_file
+
+STREAM_CHUNK = 64 * 1024
+
+
+async def write_chunks(writer, data, chunk_size=STREAM_CHUNK):
+    """
+    Write `data` to an async writer `chunk_size` bytes at a time.
+
+    :param writer: an asyncio.StreamWriter (write() then drain() per chunk), or
+                   any object with a binary write() that returns an awaitable
+    """
+    view = memoryview(data)
+    for start in range(0, len(view), chunk_size):
+        result = writer.write(view[start:start + chunk_size])
+        if inspect.isawaitable(result):
+            await result
+        elif hasattr(writer, "drain"):
+            await writer.drain()
+
+
+class AsyncCompressor:
+    """
+    A process pool and a concurrency limit shared by async compression jobs.
+    The pool starts with the first job; close it with aclose() or `async with`.
+    """
+
+    def __init__(self, max_workers=None, concurrency=None, executor=None):
+        """
+        :param max_workers: worker processes (default: one per CPU)
+        :param concurrency: jobs submitted at once, per event loop (default: max_workers)
+        :param executor: a concurrent.futures executor to use instead of a pool of our own
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.concurrency = concurrency or self.max_workers
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._semaphores = weakref.WeakKeyDictionary()  # event loop -> asyncio.Semaphore
+
+    def _pool(self):
+        if self._executor is None:
+            from concurrent.futures import ProcessPoolExecutor
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    async def _run(self, func, *args, **options):
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.concurrency)
+        async with semaphore:
+            return await loop.run_in_executor(self._pool(), functools.partial(func, *args, **options))
+
+    async def _deliver(self, source, writer, chunk_size):
+        if writer is None:
+            return source
+        await write_chunks(writer, source, chunk_size)
+        return None
+
+    async def compress_bytes(self, data, writer=None, chunk_size=STREAM_CHUNK, **options):
+        """
+        compress_bytes in a worker process.
+
+        :param writer: async writer to stream the source to (see write_chunks)
+        :param options: encoding, compress, static, symbol, name, goal
+        :return: the source as bytes, or None when streamed to `writer`
+        :raises ValueError: on an unknown encoding or goal
+        """
+        source = await self._run(compress_bytes, bytes(data), **options)
+        return await self._deliver(source, writer, chunk_size)
+
+    async def compress_file(self, path, writer=None, chunk_size=STREAM_CHUNK, **options):
+        """
+        compress_file in a worker process, which reads the font itself.
+
+        :param writer: async writer to stream the source to (see write_chunks)
+        :param options: encoding, compress, static, symbol, goal, name
+        :return: the source as bytes, or None when streamed to `writer`
+        :raises OSError: when the font can't be read
+        """
+        source = await self._run(compress_file, os.fspath(path), **options)
+        return await self._deliver(source, writer, chunk_size)
+
+    async def compress_batch(self, paths, **options):
+        """
+        Compress several fonts, yielding a result for each as soon as it is
+        done: {"path", "success", "source"} or {"path", "success", "error"}.
+        A font that fails doesn't stop the others. Jobs not finished when the
+        generator is closed (the task is cancelled, or after a break, by
+        contextlib.aclosing or garbage collection) are cancelled.
+        """
+        async def job(path):
+            try:
+                return {"path": path, "success": True, "source": await self.compress_file(path, **options)}
+            except (OSError, ValueError) as e:
+                return {"path": path, "success": False, "error": str(e)}
+
+        tasks = [asyncio.ensure_future(job(path)) for path in paths]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def aclose(self):
+        """Shut the pool down, cancelling queued jobs, without blocking the event loop."""
+        if self._executor is not None and self._owns_executor:
+            executor, self._executor = self._executor, None
+            await asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(executor.shutdown, wait=True, cancel_futures=True))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+
+_default_compressor = None
+
+
+def get_default_compressor():
+    """The AsyncCompressor used by the module-level functions, created on first use."""
+    global _default_compressor
+    if _default_compressor is None:
+        _default_compressor = AsyncCompressor()
+    return _default_compressor
+
+
+async def compress_bytes_async(data, writer=None, compressor=None, **options):
+    """AsyncCompressor.compress_bytes on `compressor`, or on the default one."""
+    return await (compressor or get_default_compressor()).compress_bytes(data, writer, **options)
+
+
+async def compress_file_async(path, writer=None, compressor=None, **options):
+    """AsyncCompressor.compress_file on `compressor`, or on the default one."""
+    return await (compressor or get_default_compressor()).compress_file(path, writer, **options)
+
+
+def compress_batch(paths, compressor=None, **options):
+    """AsyncCompressor.compress_batch on `compressor`, or on the default one: use with `async for`."""
+    return (compressor or get_default_compressor()).compress_batch(paths, **options)
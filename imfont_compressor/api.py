@@ -0,0 +1,96 @@
+"""
+Library API for build scripts: turn a font (or any binary data) into C/C++
+source without the GUI.
+
+    from imfont_compressor import compress_bytes, compress_file
+
+    source = compress_bytes(data, encoding="base85", symbol="roboto")  # -> bytes
+    compress_file("Roboto.ttf", output="roboto.h", symbol="roboto")    # writes roboto.h
+    compress_file("Roboto.ttf", output=sys.stdout)                     # any text or binary stream
+
+The output is what the GUI, the `compress` command and
+binary_to_compressed_c produce for the same options. Nothing imported here
+needs tkinter or a display, and importing it takes a few milliseconds
+(benchmarks/bench_import.py checks both).
+"""
+import io
+import os
+from imfont_compressor.core.stb import stb_compress
+from imfont_compressor.core.encoders import ENCODERS, encode
+
+ENCODINGS = ("u8", "u32", "base85", "auto")
+GOALS = ("binary", "source", "load")
+
+
+def _generate(data, encoding, compress, static, symbol, name, goal):
+    data = bytes(data)
+    flag = encoding if encoding.startswith("-") else f"-{encoding}"
+    if encoding == "auto":
+        if goal not in GOALS:
+            raise ValueError(f"Unknown goal '{goal}', expected one of {', '.join(GOALS)}.")
+        # Measures every variant: only imported when asked for
+        from imfont_compressor.core.compressor import choose_variant, evaluate_variants
+        compressed = stb_compress(data)
+        chosen, _ = choose_variant(*evaluate_variants(data, compressed), goal)
+        flag, compress = chosen["encoding"], chosen["compressed"]
+        payload = compressed if compress else data
+    elif flag not in ENCODERS:
+        raise ValueError(f"Unknown encoding '{encoding}', expected one of {', '.join(ENCODINGS)}.")
+    else:
+        payload = stb_compress(data) if compress else data
+    return encode(payload, flag, symbol or "data", name, len(data), compress, static)
+
+
+def _write(text, output):
+    if isinstance(output, io.TextIOBase):
+        output.write(text)
+    else:
+        output.write(text.encode("utf-8"))
+
+
+def compress_bytes(data, encoding="u8", compress=True, static=True, symbol="data", name="data", goal="binary",
+                   output=None):
+    """
+    Generate the C/C++ source embedding `data`.
+
+    :param data: bytes, bytearray or memoryview
+    :param encoding: "u8", "u32", "base85" (or the tool's "-u8", ...), or "auto"
+                     to choose compression and encoding for `goal`
+    :param compress: stb-compress the data (ignored with "auto")
+    :param static: mark the generated symbols 'static'
+    :param symbol: C symbol prefix
+    :param name: input name printed in the header comment
+    :param goal: what "auto" optimises for: "binary", "source" or "load"
+    :param output: text or binary stream to write the source to instead of returning it
+    :return: the UTF-8 source as bytes, or None when written to `output`
+    :raises ValueError: on an unknown encoding or goal
+    """
+    text = _generate(data, encoding, compress, static, symbol, name, goal)
+    if output is None:
+        return text.encode("utf-8")
+    _write(text, output)
+    return None
+
+
+def compress_file(path, output=None, encoding="u8", compress=True, static=True, symbol="data", goal="binary",
+                  name=None):
+    """
+    Generate the C/C++ source embedding the file at `path`, like compress_bytes.
+
+    :param output: None to return the source as bytes, a path to write it to
+                   (atomically), or a text or binary stream
+    :param name: input name printed in the header comment (default: `path`)
+    :return: the source as bytes, or None when written to `output`
+    :raises OSError: when the file can't be read or the output written
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    text = _generate(data, encoding, compress, static, symbol, name or os.fspath(path), goal)
+    if output is None:
+        return text.encode("utf-8")
+    if isinstance(output, (str, os.PathLike)):
+        from imfont_compressor.core.preview import save_output
+        save_output(os.fspath(output), text=text)
+    else:
+        _write(text, output)
+    return None
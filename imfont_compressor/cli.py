@@ -0,0 +1,284 @@
+import argparse
+import json
+import os
+import sys
+import time
+from imfont_compressor import CURRENT_VERSION
+
+ENCODING_CHOICES = {
+    "u8": "-u8",
+    "u32": "-u32",
+    "base85": "-base85",
+    "auto": "auto"
+}
+
+
+def _add_output_options(parser, encodings=ENCODING_CHOICES):
+    parser.add_argument("-s", "--symbol", default="", help="C symbol name (default: 'data')")
+    parser.add_argument("-e", "--encoding", choices=list(encodings), default="u8", help="Source encoding")
+    if "auto" in encodings:
+        parser.add_argument("--goal", choices=["binary", "source", "load"], default="binary",
+                            help="What '-e auto' optimises for: smallest binary, smallest source or fastest load")
+    parser.add_argument("--nocompress", action="store_true", help="Disable stb compression")
+    parser.add_argument("--nostatic", action="store_true", help="Do not mark generated symbols as 'static'")
+    parser.add_argument("--header", action="store_true", help="Write a .h file instead of .cpp")
+    parser.add_argument("-o", "--output", help="Output file (default: next to the first font)")
+
+
+def _params_from_args(args):
+    encoding = ENCODING_CHOICES[args.encoding]
+    if encoding == "auto":
+        encoding = f"auto:{args.goal}"
+
+    return {
+        "symbol_name": args.symbol,
+        "encoding": encoding,
+        "disable_compression": args.nocompress,
+        "no_static": args.nostatic,
+        "header_output": args.header
+    }
+
+
+def _write_result(result, output, quiet=False):
+    path = output or result["output_file"]
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(result["output_text"])
+    if not quiet:
+        print(f"Wrote {path}")
+    return path
+
+
+def _print_status(text, *_):
+    print(text)
+
+
+def _print_status_stderr(text, *_):
+    print(text, file=sys.stderr)
+
+
+def cmd_compress(args):
+    from imfont_compressor.core.compressor import run_compression
+    from imfont_compressor.core.metrics import StageTimer, add_stages, format_metrics, format_stages
+
+    params = _params_from_args(args)
+    params["font_path"] = args.font
+
+    def job(on_stage=None, memory_pass=False):
+        # With --json, stdout holds only the JSON document
+        result = run_compression(params, _print_status_stderr if args.json else _print_status,
+                                 on_stage=on_stage, in_process=args.profile, log=not memory_pass)
+        if not result["success"]:
+            return result, None
+        timer = StageTimer(on_stage)
+        with timer.stage("write"):
+            path = _write_result(result, args.output, quiet=args.json or memory_pass)
+        add_stages(result["metrics"], timer.stages)
+        return result, path
+
+    profiler = None
+    if args.profile:
+        from imfont_compressor.core.profiling import JobProfiler
+        profiler = JobProfiler(args.profile_top)
+        result, path = profiler.run(job)
+    else:
+        result, path = job()
+
+    if not result["success"]:
+        if args.json:
+            print(json.dumps({"success": False, "error": result["error"]}, indent=2))
+        else:
+            print(f"Error: {result['error']}", file=sys.stderr)
+        return 1
+
+    metrics = result["metrics"]
+    profile_paths = profiler.save(path, os.path.basename(args.font)) if profiler else None
+
+    if args.json:
+        report = {"success": True, "output_file": path, "metrics": metrics}
+        if "auto" in result:
+            report["auto"] = result["auto"]
+        if profile_paths:
+            report["profile"] = {"stats": profile_paths[0], "summary": profile_paths[1]}
+        print(json.dumps(report, indent=2))
+        return 0
+
+    if "auto" in result:
+        from imfont_compressor.core.compressor import format_auto_summary
+        print(f"Auto ({result['auto']['goal']}): {format_auto_summary(result['auto'])}")
+        print(f"Reason: {result['auto']['reason']}")
+    print(format_metrics(metrics))
+    if args.stages:
+        print(format_stages(metrics))
+    if profile_paths:
+        print(f"Profile written to {profile_paths[0]} and {profile_paths[1]}")
+    return 0
+
+
+def cmd_compare(args):
+    from imfont_compressor.core.compressor import compare_encodings, format_comparison
+
+    params = _params_from_args(args)
+    params["font_path"] = args.font
+    result = compare_encodings(params)
+    if not result["success"]:
+        print(f"Error: {result['error']}", file=sys.stderr)
+        return 1
+
+    print(format_comparison(result))
+    return 0
+
+
+def cmd_family(args):
+    from imfont_compressor.core.family import run_family_compression
+
+    params = _params_from_args(args)
+    params["font_paths"] = args.fonts
+    result = run_family_compression(params, _print_status)
+    if not result["success"]:
+        print(f"Error: {result['error']}", file=sys.stderr)
+        return 1
+
+    for line in result["report"]:
+        print(line)
+    for font in result["fonts"]:
+        if not font["exact"]:
+            print(f"Note: {font['name']} rebuilds as a valid font but not byte-identical (non-zero padding).")
+    _write_result(result, args.output)
+    return 0
+
+
+def cmd_stats(args):
+    from imfont_compressor.core.telemetry import TelemetryLog, aggregate, format_stats, get_telemetry_path
+
+    path = args.log or get_telemetry_path()
+    if not path:
+        print("Job logging is disabled (IMFONT_TELEMETRY is empty).", file=sys.stderr)
+        return 1
+
+    since = time.time() - args.days * 86400 if args.days else None
+    stats = aggregate(TelemetryLog(path).records(), top=args.top, since=since)
+    if args.json:
+        print(json.dumps(stats, indent=2))
+    else:
+        print(f"Log: {path}")
+        print(format_stats(stats))
+    return 0
+
+
+def cmd_serve(args):
+    from imfont_compressor.core.server import serve
+
+    def ready(url):
+        print(f"Serving on {url} with {args.workers or os.cpu_count() or 1} workers (Ctrl+C to stop)", flush=True)
+
+    serve(args.host, args.port, args.workers, args.queue, args.cache_mb * 1024 * 1024, args.in_process, ready)
+    return 0
+
+
+def cmd_build(args):
+    from imfont_compressor.core.build import build, format_build, load_manifest, select_targets
+
+    try:
+        if args.list:
+            # For build systems, e.g. data/ImFontCompressor.cmake: absolute paths, one per line
+            for target in select_targets(load_manifest(args.manifest), args.only):
+                print(os.path.abspath(target["output"]).replace(os.sep, "/"))
+            return 0
+        report = build(args.manifest, args.state_dir, args.only, args.force, args.depfiles, args.jobs)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    elif not args.quiet or report["failed"]:
+        print(format_build(report), file=sys.stderr if report["failed"] else sys.stdout)
+    return 1 if report["failed"] else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="imfont_compressor",
+        description="Compress TTF/OTF fonts into C/C++ source for Dear ImGui. Runs the GUI when no command is given."
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {CURRENT_VERSION}")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Print a per-phase timing breakdown of GUI startup")
+    parser.add_argument("--watch-stalls", nargs="?", type=int, const=200, metavar="MS",
+                        help="Report GUI event-loop stalls longer than MS milliseconds (default 200) "
+                             "with the blocking handler and its stack, logged to stalls.jsonl")
+    # Used by benchmarks/bench_startup.py: close the window once the first frame is painted
+    parser.add_argument("--exit-after-startup", action="store_true", help=argparse.SUPPRESS)
+    commands = parser.add_subparsers(dest="command")
+
+    compress = commands.add_parser("compress", help="Compress a single font")
+    compress.add_argument("font", help="Path to a .ttf/.otf file")
+    _add_output_options(compress)
+    compress.add_argument("--json", action="store_true",
+                          help="Print the result and its metrics (sizes, backend, time per stage) as JSON")
+    compress.add_argument("--stages", action="store_true", help="Print the wall and CPU time of every stage")
+    compress.add_argument("--profile", action="store_true",
+                          help="Run the job in-process under cProfile and tracemalloc and write <output>.prof "
+                               "and <output>.profile.txt (top functions, peak memory, allocation sites)")
+    compress.add_argument("--profile-top", type=int, default=25, metavar="N",
+                          help="Functions and allocation sites listed in the profile summary (default 25)")
+    compress.set_defaults(handler=cmd_compress)
+
+    compare = commands.add_parser("compare", help="Compare the size of every encoding, with and without compression")
+    compare.add_argument("font", help="Path to a .ttf/.otf file")
+    compare.add_argument("-s", "--symbol", default="", help="C symbol name (default: 'data')")
+    compare.add_argument("--nostatic", action="store_true", help="Do not mark generated symbols as 'static'")
+    compare.set_defaults(handler=cmd_compare, encoding="u8", nocompress=False, header=False)
+
+    family = commands.add_parser("family", help="Compress a font family, sharing identical tables")
+    family.add_argument("fonts", nargs="+", help="Paths to the .ttf/.otf files of the family")
+    _add_output_options(family, {k: v for k, v in ENCODING_CHOICES.items() if k in ("u8", "u32")})
+    family.set_defaults(handler=cmd_family)
+
+    stats = commands.add_parser("stats", help="Summarise the job log: slowest fonts, ratios, cache hits, time per day")
+    stats.add_argument("--log", help="Job log to read (default: telemetry.jsonl in the settings folder)")
+    stats.add_argument("--days", type=int, help="Only count jobs from the last N days")
+    stats.add_argument("--top", type=int, default=10, help="Number of slowest fonts to list (default 10)")
+    stats.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    stats.set_defaults(handler=cmd_stats)
+
+    serve = commands.add_parser("serve", help="Run a compression daemon with a local HTTP/JSON API")
+    serve.add_argument("--host", default="127.0.0.1", help="Address to listen on (default 127.0.0.1)")
+    serve.add_argument("--port", type=int, default=8765, help="Port to listen on, 0 for any free port (default 8765)")
+    serve.add_argument("-j", "--workers", type=int, help="Worker processes (default: one per CPU)")
+    serve.add_argument("--queue", type=int, default=64,
+                       help="Jobs waiting for a worker before new ones are refused with 503 (default 64)")
+    serve.add_argument("--cache-mb", type=int, default=256,
+                       help="Memory for generated sources kept for repeated jobs, in MB (default 256)")
+    serve.add_argument("--in-process", action="store_true",
+                       help="Compress with the Python engine instead of the native tool")
+    serve.set_defaults(handler=cmd_serve)
+
+    build = commands.add_parser("build", help="Regenerate the outputs of a manifest whose font, options or tool "
+                                              "version changed")
+    build.add_argument("manifest", help="Manifest (.toml or .json) listing the fonts, their options and outputs")
+    build.add_argument("--only", nargs="+", metavar="OUTPUT", help="Build only these outputs")
+    build.add_argument("--force", action="store_true", help="Regenerate every output")
+    build.add_argument("--depfiles", action="store_true",
+                       help="Write a Makefile-style <output>.d listing each output's font and the manifest")
+    build.add_argument("--state-dir",
+                       help="Where to keep the build stamps (default: .imfont_build next to the manifest)")
+    build.add_argument("-j", "--jobs", type=int, default=1, help="Outputs to generate in parallel (default 1)")
+    build.add_argument("--list", action="store_true", help="Print the absolute path of every output and exit")
+    build.add_argument("-q", "--quiet", action="store_true", help="Print nothing unless an output fails")
+    build.add_argument("--json", action="store_true", help="Print the build report as JSON")
+    build.set_defaults(handler=cmd_build)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command is None:
+        from imfont_compressor.main import run_app
+        run_app(args.profile_startup, args.exit_after_startup, args.watch_stalls)
+        return 0
+
+    return args.handler(args)
@@ -1,5 +1,27 @@
-from .app import ImFontCompressorApp
-from .events import *
-from .utils import *
+"""
+The compression engine (stb, encoders, compressor, cache, ...) and the GUI
+plumbing (app, events, ui_theme, ...).
 
-__all__ = ['ImFontCompressorApp']
\ No newline at end of file
+Importing the package itself loads neither: engine modules never import
+tkinter, so build scripts can use them without a display, and the GUI
+names this package used to re-export are imported on first use.
+"""
+import importlib
+
+__all__ = ['ImFontCompressorApp']
+
+
+def __getattr__(name):
+    if name.startswith("__"):
+        raise AttributeError(name)
+    if name == "ImFontCompressorApp":
+        from .app import ImFontCompressorApp
+        return ImFontCompressorApp
+    for module_name in ("utils", "events"):
+        try:
+            module = importlib.import_module(f".{module_name}", __name__)
+        except ImportError:  # no tkinter
+            continue
+        if hasattr(module, name):
+            return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
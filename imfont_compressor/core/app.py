@@ -5,21 +5,50 @@ from imfont_compressor.core.language import Language
 from imfont_compressor.core.utils import get_encoding_key, get_resource_path
 
 class ImFontCompressorApp:
-    def __init__(self):
+    def __init__(self, startup_profile=None):
+        from imfont_compressor.core.startup import StartupProfile
+        self.startup_profile = startup_profile or StartupProfile()
         self.initialized = False
-        self.language = Language(self)
-        self.ui_theme = UITheme(self)
+        profile = self.startup_profile
+
+        with profile.phase("language load"):
+            self.language = Language(self)
+        with profile.phase("theme load"):
+            self.ui_theme = UITheme(self)
 
         self.root = None
         self.last_output_text = None
         self.last_output_file = None
-
-        self._create_root_window()
-        self._init_widget_references()
-        self._init_theme_settings()
-
-        from imfont_compressor.core.config import load_config
-        load_config(self, True)
+        self.last_output_spool = None  # the output written to disk for the preview, once ready
+        self.output_ready = False  # the output matches the current options, see events.update_save_button
+        self.saves_in_progress = 0
+        self.spool_readers = {}  # spool path -> saves copying from it
+        self.discarded_spools = set()  # replaced in the preview, deleted once no save reads them
+
+        from imfont_compressor.core.cache import CompressionCache
+        self.compression_cache = CompressionCache()
+        self.font_cache_keys = {}  # font path -> (size, mtime_ns, cache key), filled by start_precompute
+        self.derive_generation = 0
+        self.derive_after_id = None
+        self.estimate_generation = 0
+        self.preview_generation = 0
+        self.update_checker = None  # created on the first update check
+        self.stall_watchdog = None  # opt-in, see setup_gui
+        self.profile_jobs = False   # hidden toggle, see events.toggle_job_profiling
+
+        # Widgets that accept dropped files, registered once tkdnd is loaded
+        self.dnd_targets = []
+        self.dnd_loaded = False
+
+        with profile.phase("root window"):
+            self._create_root_window()
+            self._init_widget_references()
+            self._init_theme_settings()
+
+        with profile.phase("config preload"):
+            from imfont_compressor.core.config import ConfigStore, load_config
+            self.config_store = ConfigStore()
+            load_config(self, True)
 
     def _init_widget_references(self):
         self.font_input = None
@@ -30,7 +59,9 @@ class ImFontCompressorApp:
         self.btn_copy = None
         self.btn_save = None
         self.btn_compress = None
+        self.btn_compare = None
         self.status_label = None
+        self.estimate_label = None
 
     def _init_theme_settings(self):
         self.pad_x = 10
@@ -45,11 +76,8 @@ class ImFontCompressorApp:
         self.var_header = tk.BooleanVar()
 
     def _create_root_window(self):
-        try:
-            from tkinterdnd2 import TkinterDnD
-            self.root = TkinterDnD.Tk()
-        except ImportError:
-            self.root = tk.Tk()
+        # tkinterdnd2 is loaded into this interpreter after the window is shown
+        self.root = tk.Tk()
 
         self.root.withdraw()
         self.root.title("ImFont Compressor")
@@ -77,9 +105,11 @@ class ImFontCompressorApp:
         self.splash.geometry(f"{width}x{height}+{x}+{y}")
 
         try:
-            from PIL import Image, ImageTk
-            image = Image.open(get_resource_path("assets/logo.png")).resize((80, 80))
-            self.splash_img = ImageTk.PhotoImage(image)
+            # Tk decodes PNG itself; subsampling 600px by 8 avoids importing PIL at startup
+            import base64
+            from imfont_compressor.core.assets import read_asset
+            logo = base64.b64encode(read_asset("assets", "logo.png"))
+            self.splash_img = tk.PhotoImage(data=logo).subsample(8)
             image_label = tk.Label(self.splash, image=self.splash_img, bg=self.ui_theme.get_color(ColorKeys.BG_MAIN_FRAME), borderwidth=0)
             image_label.pack(pady=(20, 10))
         except Exception as e:
@@ -107,21 +137,46 @@ class ImFontCompressorApp:
         self._animate_loading_text()
         self.splash.update()
 
-    def setup_gui(self):
-        self._create_splash_screen()
-        self.root.after(100, self._continue_gui_setup)
+    def setup_gui(self, exit_after_startup=False, stall_threshold_ms=None):
+        """
+        Build the window and run the event loop.
+
+        :param stall_threshold_ms: report event-loop stalls longer than this (--watch-stalls);
+                                   IMFONT_WATCH_STALLS enables it too
+        """
+        profile = self.startup_profile
+        with profile.phase("splash"):
+            self._create_splash_screen()
+
+        # The splash is already drawn; build and show the window right away
+        self._continue_gui_setup()
+        profile.report()
+
+        from imfont_compressor.core.watchdog import get_stall_threshold, start_watchdog
+        stall_threshold_ms = get_stall_threshold(stall_threshold_ms)
+        if stall_threshold_ms:
+            self.stall_watchdog = start_watchdog(self.root, stall_threshold_ms)
+
+        if exit_after_startup:
+            self.root.after_idle(self.root.destroy)
+        else:
+            self.root.after_idle(self._load_deferred)
         self.root.mainloop()
 
     def _continue_gui_setup(self):
-        self._init_theme_settings()
+        profile = self.startup_profile
+        with profile.phase("widget build"):
+            self._init_theme_settings()
 
-        from imfont_compressor.gui.main_window import MainWindow
-        self.main_window = MainWindow(self)
+            from imfont_compressor.gui.main_window import MainWindow
+            self.main_window = MainWindow(self)
 
-        from imfont_compressor.core.config import load_config
-        load_config(self)
+        with profile.phase("config"):
+            from imfont_compressor.core.config import load_config
+            load_config(self)
 
-        self.root.after(800, self._finalize_gui_setup)
+        with profile.phase("first paint"):
+            self._finalize_gui_setup()
 
     def _finalize_gui_setup(self):
         self.root.grid_rowconfigure(0, weight=1)
@@ -133,13 +188,20 @@ class ImFontCompressorApp:
         self.ui_theme.refresh_colors()
 
         if hasattr(self, "splash") and self.splash.winfo_exists():
+            self.splash.after_cancel(self._loading_after_id)
             self.splash.destroy()
 
         self.root.update_idletasks()
-        self.root.update()
         self.root.deiconify()
+        self.root.update()
         self.main_window.update()
 
+    def _load_deferred(self):
+        """Work that isn't needed for the first frame: drag-and-drop and decorative images."""
+        from imfont_compressor.core.utils import load_drag_and_drop
+        load_drag_and_drop(self)
+        self.main_window.options_tab.load_background()
+
     def _animate_loading_text(self):
         from imfont_compressor.core.language import TextAlignment
         dots = "." * (self._loading_dot_count % 4)
@@ -147,9 +209,15 @@ class ImFontCompressorApp:
         text = f"{self.language.get('ui.loading')}{dots}" if align == TextAlignment.LTR else f"{dots}{self.language.get('ui.loading')}"
         self.loading_label.config(text=text)
         self._loading_dot_count += 1
-        self.splash.after(500, self._animate_loading_text)
+        self._loading_after_id = self.splash.after(500, self._animate_loading_text)
 
     def on_close(self):
         from imfont_compressor.core.config import save_config
         save_config(self)
+        self.config_store.flush()
+        from imfont_compressor.core.preview import remove_spool
+        remove_spool()
+        if self.stall_watchdog is not None:
+            self.stall_watchdog.stop()
+            print(f"[Stall] {self.stall_watchdog.summary()}")
         self.root.destroy()
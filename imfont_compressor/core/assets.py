@@ -0,0 +1,182 @@
+import os
+import json
+import mmap
+import marshal
+import struct
+import threading
+from imfont_compressor.core.utils import get_resource_path
+
+# File layout: header, JSON index { name: [offset, size] }, then the entries back to back.
+# Offsets are relative to the end of the index.
+BUNDLE_MAGIC = b"IMFA"
+BUNDLE_FORMAT_VERSION = 1
+BUNDLE_FILENAME = "assets.bin"
+# Overrides the bundle location, or disables the bundle when set to an empty string
+BUNDLE_ENV = "IMFONT_ASSET_BUNDLE"
+
+_HEADER = struct.Struct("<4sHHI")  # magic, format version, marshal version, index size
+
+# Entries holding marshalled Python objects rather than file contents
+THEMES_ENTRY = "themes"              # [[filename, theme data, flattened color map], ...]
+LANGUAGES_ENTRY = "languages"        # { code: {"name", "alignment"} }
+LANGUAGE_ENTRY = "languages/%s"      # parsed catalog of one language
+
+# Loose files stored byte for byte, by their path under the resource root.
+# icon.ico stays a loose file: iconbitmap() only accepts a path.
+RAW_ASSETS = ("assets/logo.png",)
+
+
+class AssetBundleError(ValueError):
+    pass
+
+
+class AssetBundle:
+    """
+    Read-only view of a packed asset bundle.
+
+    The file is memory-mapped, so opening it reads only the index; entries
+    are sliced out on demand and marshalled ones are decoded once.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if len(self._mmap) < _HEADER.size:
+                raise AssetBundleError(f"Truncated asset bundle: {path}")
+            magic, format_version, marshal_version, index_size = _HEADER.unpack_from(self._mmap)
+            if magic != BUNDLE_MAGIC:
+                raise AssetBundleError(f"Not an asset bundle: {path}")
+            if format_version != BUNDLE_FORMAT_VERSION or marshal_version > marshal.version:
+                raise AssetBundleError(
+                    f"Unsupported asset bundle {path} (format {format_version}, marshal {marshal_version})"
+                )
+
+            index_end = _HEADER.size + index_size
+            self._index = json.loads(bytes(self._mmap[_HEADER.size:index_end]))
+            self._data_start = index_end
+        except Exception:
+            self._mmap.close()
+            raise
+
+        self._decoded = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def names(self):
+        return list(self._index)
+
+    def read(self, name) -> bytes:
+        """Raw bytes of an entry. :raises KeyError: if the bundle has no such entry"""
+        offset, size = self._index[name]
+        start = self._data_start + offset
+        return self._mmap[start:start + size]
+
+    def load(self, name):
+        """Decoded value of a marshalled entry, shared between callers; do not modify it."""
+        with self._lock:
+            if name not in self._decoded:
+                self._decoded[name] = marshal.loads(self.read(name))
+            return self._decoded[name]
+
+    def close(self):
+        self._mmap.close()
+
+
+_bundle = None
+_bundle_loaded = False
+_bundle_lock = threading.Lock()
+
+
+def get_bundle_path():
+    return os.environ.get(BUNDLE_ENV, get_resource_path(BUNDLE_FILENAME))
+
+
+def get_asset_bundle():
+    """
+    Return the packed asset bundle, or None to use the loose files.
+
+    Development trees have no bundle (it is written by utils/build_assets.py
+    for frozen builds); a bundle that can't be read is reported once and ignored.
+    """
+    global _bundle, _bundle_loaded
+    with _bundle_lock:
+        if not _bundle_loaded:
+            _bundle_loaded = True
+            path = get_bundle_path()
+            if path and os.path.isfile(path):
+                try:
+                    _bundle = AssetBundle(path)
+                except (OSError, ValueError) as e:
+                    print(f"[Assets] Ignoring asset bundle: {e}")
+        return _bundle
+
+
+def read_asset(*path_parts) -> bytes:
+    """Contents of a resource file, from the bundle when it has it."""
+    bundle = get_asset_bundle()
+    name = "/".join(path_parts)
+    if bundle is not None and name in bundle:
+        return bundle.read(name)
+    with open(get_resource_path(*path_parts), "rb") as f:
+        return f.read()
+
+
+def build_bundle(output_path, root=None):
+    """
+    Pack the themes, languages and images under `root` into a bundle.
+
+    Themes are stored validated and with their flattened color maps, and
+    language files parsed (duplicate keys fail the build), so loading them
+    at startup is a single unmarshal instead of JSON parsing.
+
+    :return: { entry name: size in bytes }
+    :raises DuplicateKeysError: if a language file repeats a key
+    """
+    from imfont_compressor.core.language import load_catalog, TextAlignment
+    from imfont_compressor.core.theme_registry import ThemeRegistry
+
+    root = root or get_resource_path()
+    entries = {}
+
+    registry = ThemeRegistry(os.path.join(root, "assets", "themes"))
+    entries[THEMES_ENTRY] = marshal.dumps(registry.entries())
+
+    language_dir = os.path.join(root, "assets", "languages")
+    index = {}
+    for filename in sorted(os.listdir(language_dir)):
+        if not filename.endswith(".json"):
+            continue
+        code = filename[:-5]
+        data = load_catalog(os.path.join(language_dir, filename))
+        index[code] = {
+            "name": data.get("name", code),
+            "alignment": TextAlignment.from_string(data.get("alignment", "ltr")).value
+        }
+        entries[LANGUAGE_ENTRY % code] = marshal.dumps(data)
+    entries[LANGUAGES_ENTRY] = marshal.dumps(index)
+
+    for name in RAW_ASSETS:
+        with open(os.path.join(root, *name.split("/")), "rb") as f:
+            entries[name] = f.read()
+
+    layout = {}
+    offset = 0
+    for name, blob in entries.items():
+        layout[name] = [offset, len(blob)]
+        offset += len(blob)
+    index_bytes = json.dumps(layout, separators=(",", ":")).encode("utf-8")
+
+    temp_path = output_path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(_HEADER.pack(BUNDLE_MAGIC, BUNDLE_FORMAT_VERSION, marshal.version, len(index_bytes)))
+        f.write(index_bytes)
+        for blob in entries.values():
+            f.write(blob)
+    os.replace(temp_path, output_path)
+
+    return {name: len(blob) for name, blob in entries.items()}
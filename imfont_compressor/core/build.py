@@ -0,0 +1,361 @@
+"""
+Manifest builds: regenerate only the outputs whose font, options or tool
+version changed.
+
+A manifest (TOML or JSON, with the same structure) lists the fonts:
+
+    [defaults]                  # optional, applies to every font
+    encoding = "base85"
+
+    [[fonts]]
+    input = "fonts/Roboto-Regular.ttf"
+    output = "generated/roboto.h"
+    symbol = "roboto"           # symbol, encoding, goal, compress, static
+
+Relative paths are relative to the manifest. Each output has a stamp in the
+state directory (.imfont_build next to the manifest by default) with the key
+it was generated from: a hash of the font's contents, the options and the
+tool version. An output whose key matches its stamp and which is unchanged
+on disk is left alone. Fonts are only hashed again when their size or
+modification time changed, so a build with nothing to do takes a few
+milliseconds.
+
+With depfiles, `<output>.d` lists the font and the manifest in Makefile
+syntax for make and ninja; data/ImFontCompressor.cmake wires this into
+CMake. Those run the command again whenever the font or the manifest is
+newer than the output, so an output found up to date then gets its time
+stamp refreshed, or they would keep running it.
+"""
+import hashlib
+import json
+import os
+import time
+from imfont_compressor import CURRENT_VERSION
+from imfont_compressor.api import ENCODINGS, GOALS, compress_file
+
+STATE_DIR = ".imfont_build"
+HASH_CHUNK = 1024 * 1024
+
+DEFAULT_OPTIONS = {
+    "symbol": "data",
+    "encoding": "u8",
+    "goal": "binary",
+    "compress": True,
+    "static": True
+}
+OPTION_TYPES = {"symbol": str, "encoding": str, "goal": str, "compress": bool, "static": bool}
+
+
+def _read_manifest(path):
+    try:
+        if path.lower().endswith(".toml"):
+            try:
+                import tomllib
+            except ImportError:
+                raise ValueError("[Build] TOML manifests need Python 3.11 or later; use a .json manifest.")
+            with open(path, "rb") as f:
+                return tomllib.load(f)
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except OSError as e:
+        raise ValueError(f"[Build] Can't read the manifest: {e}")
+    except ValueError as e:  # TOMLDecodeError and JSONDecodeError
+        if str(e).startswith("[Build]"):
+            raise
+        raise ValueError(f"[Build] Invalid manifest {os.path.basename(path)}: {e}")
+
+
+def _check_options(options, where):
+    unknown = set(options) - set(OPTION_TYPES)
+    if unknown:
+        raise ValueError(f"[Build] Unknown option(s) in {where}: {', '.join(sorted(unknown))}")
+    for key, value in options.items():
+        if not isinstance(value, OPTION_TYPES[key]):
+            raise ValueError(f"[Build] '{key}' in {where} must be a {OPTION_TYPES[key].__name__}.")
+    if options.get("encoding", "u8") not in ENCODINGS:
+        raise ValueError(f"[Build] Unknown encoding '{options['encoding']}' in {where}, "
+                         f"expected one of {', '.join(ENCODINGS)}.")
+    if options.get("goal", "binary") not in GOALS:
+        raise ValueError(f"[Build] Unknown goal '{options['goal']}' in {where}, expected one of {', '.join(GOALS)}.")
+
+
+def _normpath(path):
+    return os.path.normcase(os.path.abspath(path))
+
+
+def load_manifest(path, state=None):
+    """
+    Read and validate a manifest.
+
+    :param state: BuildState to keep the parsed manifest in while the file is
+                  unchanged (importing tomllib alone takes longer than the rest
+                  of a build with nothing to do)
+
+    :return: list of targets, dicts with the absolute 'input' and 'output'
+             paths, the input as written in the manifest ('name', which the
+             generated header prints), the output as written ('label') and
+             the resolved 'options'
+    :raises ValueError: when the manifest can't be read or is invalid
+    """
+    cached = state.load_manifest(path) if state else None
+    manifest = cached if cached is not None else _read_manifest(path)
+    if not isinstance(manifest, dict):
+        raise ValueError("[Build] The manifest must be a table/object with a 'fonts' list.")
+    unknown = set(manifest) - {"defaults", "fonts"}
+    if unknown:
+        raise ValueError(f"[Build] Unknown manifest key(s): {', '.join(sorted(unknown))}")
+
+    defaults = manifest.get("defaults", {})
+    if not isinstance(defaults, dict):
+        raise ValueError("[Build] 'defaults' must be a table/object.")
+    _check_options(defaults, "defaults")
+    fonts = manifest.get("fonts")
+    if not isinstance(fonts, list) or not fonts:
+        raise ValueError("[Build] The manifest lists no fonts.")
+
+    base = os.path.dirname(os.path.abspath(path))
+    targets = []
+    outputs = set()
+    for n, font in enumerate(fonts, 1):
+        where = f"font {n}"
+        if not isinstance(font, dict):
+            raise ValueError(f"[Build] {where} must be a table/object.")
+        for key in ("input", "output"):
+            if not isinstance(font.get(key), str) or not font[key]:
+                raise ValueError(f"[Build] {where} has no '{key}' path.")
+        options = {k: v for k, v in font.items() if k not in ("input", "output")}
+        _check_options(options, where)
+
+        resolved = {**DEFAULT_OPTIONS, **defaults, **options}
+        if resolved["encoding"] != "auto":
+            resolved.pop("goal")  # only "auto" reads it: changing it mustn't rebuild anything else
+        output = os.path.normpath(os.path.join(base, font["output"]))
+        if _normpath(output) in outputs:
+            raise ValueError(f"[Build] Output '{font['output']}' is listed twice.")
+        outputs.add(_normpath(output))
+        targets.append({
+            "input": os.path.normpath(os.path.join(base, font["input"])),
+            "output": output,
+            "name": font["input"],
+            "label": font["output"],
+            "options": resolved
+        })
+
+    if state and cached is None:
+        state.save_manifest(path, manifest)
+    return targets
+
+
+def tool_version():
+    """
+    The package version, plus a digest of the engine's sources so that an
+    edited encoder counts as a new version during development.
+    """
+    from imfont_compressor import api
+    from imfont_compressor.core import encoders, stb
+
+    digest = hashlib.sha256()
+    try:
+        for module in (stb, encoders, api):
+            with open(module.__file__, "rb") as f:
+                digest.update(f.read())
+    except (OSError, TypeError):  # frozen build: the version alone
+        return CURRENT_VERSION
+    return f"{CURRENT_VERSION}+{digest.hexdigest()[:12]}"
+
+
+def _stat(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def _hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BuildState:
+    """The stamps of a manifest's outputs: one small JSON file per output, so parallel builds never share one."""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _path(self, output):
+        return os.path.join(self.directory, hashlib.sha1(_normpath(output).encode("utf-8")).hexdigest()[:16] + ".json")
+
+    def _read(self, path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, path, value):
+        os.makedirs(self.directory, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(value, f)
+        os.replace(temp_path, path)
+
+    def load(self, output):
+        return self._read(self._path(output))
+
+    def save(self, output, stamp):
+        self._write(self._path(output), stamp)
+
+    def load_manifest(self, path):
+        """The parsed manifest kept by save_manifest, if the file's size and mtime are unchanged, else None."""
+        cached = self._read(self._path(path) + ".manifest")
+        if cached and cached.get("stat") == _stat(path):
+            return cached["manifest"]
+        return None
+
+    def save_manifest(self, path, manifest):
+        self._write(self._path(path) + ".manifest", {"stat": _stat(path), "manifest": manifest})
+
+
+def _font_digest(target, stamp):
+    """(sha256 of the font, its stat), reusing the stamp's hash while the font's size and mtime are unchanged"""
+    font = _stat(target["input"])
+    if font is None:
+        raise OSError(f"Can't read the font {target['name']}.")
+    previous = stamp and stamp.get("font")
+    if previous and previous["size"] == font["size"] and previous["mtime_ns"] == font["mtime_ns"]:
+        return previous["sha256"], font
+    return _hash_file(target["input"]), font
+
+
+def build_key(font_sha256, target, version):
+    blob = json.dumps({"font": font_sha256, "name": target["name"], "options": target["options"], "tool": version},
+                      sort_keys=True)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _depfile_path(path):
+    # Makefile syntax: spaces, '#' and '$' are special
+    return path.replace(os.sep, "/").replace(" ", "\\ ").replace("#", "\\#").replace("$", "$$")
+
+
+def write_depfile(target, manifest_path):
+    path = target["output"] + ".d"
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        f.write(f"{_depfile_path(target['output'])}: {_depfile_path(target['input'])} "
+                f"{_depfile_path(os.path.abspath(manifest_path))}\n")
+    return path
+
+
+def generate(target):
+    """Write one target's output (atomically). Runs in the build's worker processes with -j."""
+    start = time.perf_counter()
+    directory = os.path.dirname(target["output"])
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    options = target["options"]
+    compress_file(target["input"], target["output"], options["encoding"], options["compress"], options["static"],
+                  options["symbol"], options.get("goal", "binary"), name=target["name"])
+    return (time.perf_counter() - start) * 1000.0
+
+
+def select_targets(targets, only):
+    """The targets whose output is one of `only` (paths as written in the manifest, or absolute)."""
+    if not only:
+        return targets
+    by_output = {_normpath(target["output"]): target for target in targets}
+    selected = []
+    for output in only:
+        target = by_output.get(_normpath(output))
+        if target is None:
+            raise ValueError(f"[Build] '{output}' is not an output of the manifest.")
+        selected.append(target)
+    return selected
+
+
+def build(manifest_path, state_dir=None, only=None, force=False, depfiles=False, jobs=1):
+    """
+    Bring the outputs of a manifest up to date.
+
+    :param state_dir: where the stamps are kept (default: .imfont_build next to the manifest)
+    :param only: outputs to build, instead of all of them
+    :param force: regenerate every output regardless of its stamp
+    :param depfiles: write `<output>.d` next to every output
+    :param jobs: outputs generated in parallel, in worker processes
+    :return: dict with the 'built' outputs and their times in ms, the outputs
+             already 'up_to_date', the 'failed' ones with their errors, and
+             the total 'elapsed_ms'
+    :raises ValueError: when the manifest is invalid
+    """
+    start = time.perf_counter()
+    state = BuildState(state_dir or os.path.join(os.path.dirname(os.path.abspath(manifest_path)), STATE_DIR))
+    targets = select_targets(load_manifest(manifest_path, state), only)
+    manifest_mtime = os.stat(manifest_path).st_mtime_ns
+    version = tool_version()
+    report = {"built": [], "up_to_date": [], "failed": []}
+
+    dirty = []
+    for target in targets:
+        stamp = state.load(target["output"])
+        try:
+            font_sha256, font = _font_digest(target, stamp)
+        except OSError as e:
+            report["failed"].append((target["label"], str(e)))
+            continue
+        key = build_key(font_sha256, target, version)
+        written = _stat(target["output"])
+        if force or not stamp or stamp.get("key") != key or written != stamp.get("written"):
+            dirty.append((target, {"key": key, "font": dict(font, sha256=font_sha256)}))
+            continue
+
+        changed = stamp["font"] != dict(font, sha256=font_sha256)  # touched, same contents: don't hash it again
+        if depfiles:
+            if not os.path.exists(target["output"] + ".d"):
+                write_depfile(target, manifest_path)
+            if written["mtime_ns"] < max(manifest_mtime, font["mtime_ns"]):
+                os.utime(target["output"])
+                stamp["written"] = _stat(target["output"])
+                changed = True
+        if changed:
+            stamp["font"] = dict(font, sha256=font_sha256)
+            state.save(target["output"], stamp)
+        report["up_to_date"].append(target["label"])
+
+    def finish(target, stamp, run):
+        try:
+            ms = run()
+        except Exception as e:
+            report["failed"].append((target["label"], str(e)))
+            return
+        stamp["output"] = target["output"]
+        stamp["written"] = _stat(target["output"])
+        state.save(target["output"], stamp)
+        if depfiles:
+            write_depfile(target, manifest_path)
+        report["built"].append((target["label"], ms))
+
+    if jobs > 1 and len(dirty) > 1:
+        from concurrent.futures import ProcessPoolExecutor  # a third of a no-op build's time if imported up front
+        with ProcessPoolExecutor(max_workers=min(jobs, len(dirty))) as executor:
+            futures = [(target, stamp, executor.submit(generate, target)) for target, stamp in dirty]
+            for target, stamp, future in futures:
+                finish(target, stamp, future.result)
+    else:
+        for target, stamp in dirty:
+            finish(target, stamp, lambda: generate(target))
+
+    report["elapsed_ms"] = (time.perf_counter() - start) * 1000.0
+    return report
+
+
+def format_build(report):
+    lines = [f"Built {label} ({ms:.1f} ms)" for label, ms in report["built"]]
+    lines += [f"Failed {label}: {error}" for label, error in report["failed"]]
+    summary = f"{len(report['built'])} built, {len(report['up_to_date'])} up to date"
+    if report["failed"]:
+        summary += f", {len(report['failed'])} failed"
+    lines.append(f"{summary} in {report['elapsed_ms']:.1f} ms")
+    return "\n".join(lines)
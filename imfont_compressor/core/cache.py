@@ -0,0 +1,86 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from imfont_compressor.core.stb import stb_compress
+
+
+class CompressionCache:
+    """
+    Thread-safe LRU of stb-compressed streams, keyed by the SHA-256 of the input.
+
+    The compressed stream is independent of encoding, 'static' and output
+    options, so one entry serves every variant of the same font.
+    """
+
+    def __init__(self, max_entries=8):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._pending = {}  # key -> Future of a compression in progress
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(data) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def get(self, key):
+        """Return the cached stream for `key`, or None."""
+        with self._lock:
+            compressed = self._entries.get(key)
+            if compressed is not None:
+                self._entries.move_to_end(key)
+            return compressed
+
+    def put(self, key, compressed):
+        with self._lock:
+            self._entries[key] = compressed
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_compress(self, data, key=None):
+        """
+        Return (compressed, hit). Concurrent calls for the same input share one compression.
+
+        :param data: input bytes
+        :param key: precomputed key_for(data), if the caller already has it
+        """
+        key = key or self.key_for(data)
+        with self._lock:
+            compressed = self._entries.get(key)
+            if compressed is not None:
+                self._entries.move_to_end(key)
+                return compressed, True
+            future = self._pending.get(key)
+            owner = future is None
+            if owner:
+                future = self._pending[key] = Future()
+
+        if not owner:
+            return future.result(), True
+
+        try:
+            compressed = stb_compress(data)
+        except Exception as e:
+            with self._lock:
+                self._pending.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        self.put(key, compressed)
+        with self._lock:
+            self._pending.pop(key, None)
+        future.set_result(compressed)
+        return compressed, False
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
@@ -1,11 +1,303 @@
 import subprocess
 import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 from imfont_compressor.core.utils import get_resource_path
+from imfont_compressor.core.stb import stb_compress, stb_decompress
+from imfont_compressor.core.cache import CompressionCache
+from imfont_compressor.core.metrics import StageTimer, build_metrics
+from imfont_compressor.core.telemetry import log_job
+from imfont_compressor.core.native import NativeError
+from imfont_compressor.core.encoders import (
+    ENCODERS, encode, binary_size, estimate_source_size, base85_chars, base85_decode
+)
 
-def run_compression(params, status_callback):
+# "auto:<goal>" lets run_compression pick compression and encoding itself
+AUTO_PREFIX = "auto"
+AUTO_GOALS = {
+    "binary": "smallest binary",
+    "source": "smallest source",
+    "load": "fastest load"
+}
+# Compression has to save at least this much to be worth decompressing at startup
+AUTO_MIN_SAVING = 0.10
+
+# Stream size as written by the native tool; base85 output only gives the padded size
+_NATIVE_COMPRESSED_SIZE = re.compile(r"_compressed_size = (\d+);")
+_NATIVE_BASE85_SIZE = re.compile(r"_compressed_data_base85\[(\d+)\+1\]")
+
+def parse_encoding(encoding):
+    """
+    Split an encoding value into (encoding, goal).
+
+    Regular flags return (flag, None); "auto:<goal>" returns ("auto", goal).
+    """
+    if encoding and encoding.startswith(AUTO_PREFIX):
+        _, _, goal = encoding.partition(":")
+        return AUTO_PREFIX, goal if goal in AUTO_GOALS else "binary"
+    return encoding, None
+
+def _time_ms(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, (time.perf_counter() - start) * 1000.0
+
+def evaluate_variants(data, compressed):
+    """
+    Measure every compressed/raw x encoding combination for `data`.
+
+    Decompression and base85 decoding are timed with the Python decoders;
+    native decoders are much faster, but the relative cost is what matters.
+
+    :return: (list of candidate dicts, measurements dict)
+    """
+    _, decompress_ms = _time_ms(stb_decompress, compressed)
+    _, decode85_ms = _time_ms(base85_decode, base85_chars(compressed))
+    # base85 decoding is linear in size, scale it for the raw payload
+    decode85_raw_ms = decode85_ms * len(data) / max(len(compressed), 1)
+
+    candidates = []
+    for use_compression, payload in ((True, compressed), (False, data)):
+        for encoding in ENCODERS:
+            load_ms = decompress_ms if use_compression else 0.0
+            if encoding == "-base85":
+                load_ms += decode85_ms if use_compression else decode85_raw_ms
+            candidates.append({
+                "encoding": encoding,
+                "compressed": use_compression,
+                "binary_size": binary_size(len(payload), encoding),
+                "source_size": estimate_source_size(payload, encoding),
+                "load_ms": round(load_ms, 3)
+            })
+
+    measurements = {
+        "input_size": len(data),
+        "compressed_size": len(compressed),
+        "ratio": round(len(compressed) / max(len(data), 1), 4),
+        "decompress_ms": round(decompress_ms, 3),
+        "decode85_ms": round(decode85_ms, 3)
+    }
+    return candidates, measurements
+
+def choose_variant(candidates, measurements, goal):
+    """
+    Pick the candidate that best fits `goal` ("binary", "source" or "load").
+
+    :return: (chosen candidate, human readable reason)
+    """
+    pays_off = measurements["ratio"] <= 1.0 - AUTO_MIN_SAVING
+    pool = [c for c in candidates if pays_off or not c["compressed"]]
+
+    keys = {
+        "binary": lambda c: (c["binary_size"], c["load_ms"], c["source_size"]),
+        "source": lambda c: (c["source_size"], c["load_ms"], c["binary_size"]),
+        "load": lambda c: (c["load_ms"], c["binary_size"], c["source_size"])
+    }
+    chosen = min(pool, key=keys[goal])
+
+    saving = max(1.0 - measurements["ratio"], 0.0)
+    if not pays_off:
+        reason = (f"compression saves only {saving:.0%} (minimum {AUTO_MIN_SAVING:.0%}), "
+                  f"keeping raw data to skip decompression at load")
+    elif chosen["compressed"]:
+        reason = (f"compression saves {saving:.0%} for ~{measurements['decompress_ms']:.0f} ms "
+                  f"of decompression (Python decoder)")
+    else:
+        reason = f"raw data fits the '{AUTO_GOALS[goal]}' goal best"
+    return chosen, reason
+
+def format_auto_summary(auto):
+    """Short one-line description of an automatic decision for the status bar."""
+    text = auto["encoding"]
+    if auto["compressed"]:
+        return f"{text}, compressed to {auto['ratio']:.0%}, ~{auto['decompress_ms']:.0f} ms decode"
+    return f"{text} -nocompress, {auto['ratio']:.0%} if compressed"
+
+def _run_auto_compression(data, compressed, font_path, symbol_name, goal, no_static, output_file, timer):
+    with timer.stage("evaluate"):
+        candidates, measurements = evaluate_variants(data, compressed)
+        chosen, reason = choose_variant(candidates, measurements, goal)
+
+    payload = compressed if chosen["compressed"] else data
+    with timer.stage("encode"):
+        output_text = encode(payload, chosen["encoding"], symbol_name, font_path, len(data),
+                             chosen["compressed"], not no_static)
+
+    auto = dict(measurements)
+    auto.update({
+        "goal": goal,
+        "encoding": chosen["encoding"],
+        "compressed": chosen["compressed"],
+        "reason": reason,
+        "candidates": candidates
+    })
+
+    return {
+        "success": True,
+        "output_text": output_text,
+        "output_file": output_file,
+        "auto": auto
+    }
+
+def _encode_variant(payload, encoding, use_compression, symbol_name, input_name, input_size, use_static):
+    output_text, encode_ms = _time_ms(encode, payload, encoding, symbol_name, input_name, input_size,
+                                      use_compression, use_static)
+    return {
+        "encoding": encoding,
+        "compressed": use_compression,
+        "payload_size": len(payload),
+        "source_size": len(output_text.encode("utf-8")),
+        "binary_size": binary_size(len(payload), encoding),
+        "encode_ms": round(encode_ms, 3)
+    }
+
+def compare_encodings(params, executor=None):
+    """
+    Compress the font once and encode every compressed/raw x encoding variant concurrently.
+
+    :param params: same keys as run_compression (encoding and disable_compression are ignored)
+    :param executor: optional concurrent.futures executor, a process pool is created otherwise
+    :return: result dict with one row per variant
+    """
     font_path = params["font_path"]
     symbol_name = params["symbol_name"] or "data"
-    encoding = params["encoding"]
+    no_static = params["no_static"]
+
+    if not os.path.isfile(font_path):
+        return {"success": False, "error": "Font file not found."}
+
+    try:
+        with open(font_path, "rb") as f:
+            data = f.read()
+
+        # The compressed stream is shared by the three compressed variants
+        compressed, compress_ms = _time_ms(stb_compress, data)
+        variants = [(compressed, encoding, True) for encoding in ENCODERS]
+        variants += [(data, encoding, False) for encoding in ENCODERS]
+
+        own_executor = executor is None
+        if own_executor:
+            executor = ProcessPoolExecutor(max_workers=min(len(variants), os.cpu_count() or 1))
+        try:
+            futures = [
+                executor.submit(_encode_variant, payload, encoding, use_compression,
+                                symbol_name, font_path, len(data), not no_static)
+                for payload, encoding, use_compression in variants
+            ]
+            rows = [future.result() for future in futures]
+        finally:
+            if own_executor:
+                executor.shutdown()
+
+        return {
+            "success": True,
+            "input_size": len(data),
+            "compressed_size": len(compressed),
+            "compress_ms": round(compress_ms, 3),
+            "rows": rows
+        }
+
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+def format_comparison(result):
+    """Render a compare_encodings() result as a fixed-width text table."""
+    lines = [
+        f"Input {result['input_size']} bytes, compressed once to {result['compressed_size']} bytes "
+        f"in {result['compress_ms']:.0f} ms",
+        "",
+        f"{'Variant':<22}{'Payload':>10}{'Source':>11}{'Binary':>10}{'Encode':>11}",
+    ]
+    for row in result["rows"]:
+        variant = row["encoding"] + ("" if row["compressed"] else " -nocompress")
+        lines.append(f"{variant:<22}{row['payload_size']:>10}{row['source_size']:>11}"
+                     f"{row['binary_size']:>10}{row['encode_ms']:>8.1f} ms")
+    return "\n".join(lines)
+
+def _run_cached_compression(params, cache, goal, output_file, timer, in_process=False):
+    """
+    In-process path: encode from the cached stream, or compress when auto mode
+    (or `in_process`) needs it.
+
+    Returns None when the stream isn't cached and the native tool should run instead.
+    """
+    font_path = params["font_path"]
+    with timer.stage("read"):
+        with open(font_path, "rb") as f:
+            data = f.read()
+
+    with timer.stage("cache"):
+        key = CompressionCache.key_for(data)
+        compressed = cache.get(key) if cache is not None else None
+    cached = compressed is not None
+    symbol_name = params["symbol_name"] or "data"
+    encoding, _ = parse_encoding(params["encoding"])
+
+    use_compression = goal is not None or not params["disable_compression"]
+    if use_compression and compressed is None:
+        if goal is None and not in_process:
+            return None
+        with timer.stage("compress"):
+            compressed = cache.get_or_compress(data, key)[0] if cache is not None else stb_compress(data)
+
+    if goal is not None:
+        result = _run_auto_compression(data, compressed, font_path, symbol_name, goal, params["no_static"],
+                                       output_file, timer)
+        result["metrics"] = build_metrics(timer, "python", len(data), len(compressed), result["output_text"],
+                                          cached, key)
+        return result
+
+    with timer.stage("encode"):
+        output_text = encode(compressed if use_compression else data, encoding, symbol_name, font_path,
+                             len(data), use_compression, not params["no_static"])
+    return {
+        "success": True,
+        "output_text": output_text,
+        "output_file": output_file,
+        "metrics": build_metrics(timer, "python", len(data), len(compressed) if use_compression else None,
+                                 output_text, cached, key)
+    }
+
+def _native_compressed_size(output_text, use_compression):
+    if not use_compression:
+        return None
+    match = _NATIVE_COMPRESSED_SIZE.search(output_text)
+    if match:
+        return int(match.group(1))
+    match = _NATIVE_BASE85_SIZE.search(output_text)
+    return int(match.group(1)) // 5 * 4 if match else None
+
+def run_compression(params, status_callback, cache=None, on_stage=None, in_process=False, log=True,
+                    native_pool=None):
+    """
+    Compress a font into C source.
+
+    The result carries a "metrics" record (see core.metrics.build_metrics):
+    input, compressed and output sizes, ratio, lines, the backend used and
+    the wall/CPU time of every stage.
+
+    :param params: font_path, symbol_name, encoding, disable_compression, no_static, header_output
+    :param status_callback: callable(text, color) for progress messages
+    :param cache: optional CompressionCache; cached streams are encoded in-process
+                  instead of spawning the native tool
+    :param on_stage: optional callable(name, event, record) told when each stage
+                     starts and ends, see core.metrics.StageTimer
+    :param in_process: compress with the Python engine instead of the native tool
+    :param log: append the job to the job log (core.telemetry)
+    :param native_pool: optional core.native.NativeServerPool; the native tool
+                        then runs in a long-lived -server process instead of
+                        one process per job
+    """
+    result = _run_compression(params, cache, StageTimer(on_stage), in_process, native_pool)
+    if log:
+        log_job(params, result)
+    return result
+
+def _run_compression(params, cache, timer, in_process, native_pool=None):
+    font_path = params["font_path"]
+    symbol_name = params["symbol_name"] or "data"
+    encoding, goal = parse_encoding(params["encoding"])
     disable_compression = params["disable_compression"]
     no_static = params["no_static"]
     header_output = params["header_output"]
@@ -17,12 +309,36 @@ def run_compression(params, status_callback):
     if not os.path.isdir(output_dir):
         return {"success": False, "error": "Output folder is invalid."}
 
-    exe_path = get_resource_path("data", "binary_to_compressed_c.exe")
+    filename = os.path.splitext(os.path.basename(font_path))[0]
+    output_file = os.path.join(output_dir, filename + (".h" if header_output else ".cpp"))
+
+    if goal is not None or cache is not None or in_process:
+        try:
+            result = _run_cached_compression(params, cache, goal, output_file, timer, in_process)
+            if result is not None:
+                return result
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    exe_path = native_pool.exe_path if native_pool and native_pool.exe_path else \
+        get_resource_path("data", "binary_to_compressed_c.exe")
     if not os.path.isfile(exe_path):
         return {"success": False, "error": "Compressor executable not found."}
 
-    filename = os.path.splitext(os.path.basename(font_path))[0]
-    output_file = os.path.join(output_dir, filename + (".h" if header_output else ".cpp"))
+    if native_pool is not None:
+        try:
+            with timer.stage("native"):
+                output_text = native_pool.compress(encoding, symbol_name, not disable_compression, not no_static,
+                                                   path=font_path)
+        except NativeError as e:
+            return {"success": False, "error": str(e)}
+        return {
+            "success": True,
+            "output_text": output_text,
+            "output_file": output_file,
+            "metrics": build_metrics(timer, "native", os.path.getsize(font_path),
+                                     _native_compressed_size(output_text, not disable_compression), output_text)
+        }
 
     args = [exe_path, encoding]
     if disable_compression:
@@ -34,7 +350,9 @@ def run_compression(params, status_callback):
     args.append(symbol_name)
 
     try:
-        result = subprocess.run(args, capture_output=True, text=True, check=True)
+        # The tool reads, compresses and encodes in one go
+        with timer.stage("native"):
+            result = subprocess.run(args, capture_output=True, text=True, check=True)
         output_text = result.stdout
 
         if not output_text.strip():
@@ -43,11 +361,13 @@ def run_compression(params, status_callback):
         return {
             "success": True,
             "output_text": output_text,
-            "output_file": output_file
+            "output_file": output_file,
+            "metrics": build_metrics(timer, "native", os.path.getsize(font_path),
+                                     _native_compressed_size(output_text, not disable_compression), output_text)
         }
 
     except subprocess.CalledProcessError as e:
         err_msg = e.stderr.strip() if e.stderr else e.stdout.strip() if e.stdout else "Compression failed."
         return {"success": False, "error": err_msg}
     except Exception as e:
-        return {"success": False, "error": str(e)}
\ No newline at end of file
+        return {"success": False, "error": str(e)}
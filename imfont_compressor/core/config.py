@@ -1,61 +1,241 @@
+import copy
 import json
 import os
+import sys
+import threading
 from typing import TYPE_CHECKING
-from imfont_compressor.core.utils import get_encoding_key, get_valid_symbol_name
+from imfont_compressor.core.utils import encoding_map, get_encoding_key, get_valid_symbol_name
 
 if TYPE_CHECKING:
     from imfont_compressor.core.app import ImFontCompressorApp  # Only used for type hints
 
 CONFIG_FILE = "user_config.json"
+CONFIG_DIR_NAME = "ImFontCompressor"
+# Overrides the directory the configuration is stored in
+CONFIG_DIR_ENV = "IMFONT_CONFIG_DIR"
 
-def save_config(app: "ImFontCompressorApp"):
-    prefs = {
-        "lang": app.language.lang_code,
-        "theme": app.ui_theme.theme_name,
+SAVE_DELAY = 0.5  # seconds without changes before the file is written
+MAX_RECENT_FILES = 10
+MAX_PRESETS = 100
+
+# Options remembered per font, by the keys save_config uses
+PRESET_KEYS = ("symbol_name", "encoding", "disable_compression", "no_static", "header_output")
+
+
+def get_config_dir():
+    """Platform directory for user settings (%APPDATA%, ~/Library/Application Support or XDG)."""
+    override = os.environ.get(CONFIG_DIR_ENV)
+    if override:
+        return override
+    if sys.platform == "win32":
+        base = os.environ.get("APPDATA") or os.path.expanduser("~")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Application Support")
+    else:
+        base = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+    return os.path.join(base, CONFIG_DIR_NAME)
+
+
+def get_config_path():
+    return os.path.join(get_config_dir(), CONFIG_FILE)
+
+
+def _font_key(font_path):
+    return os.path.normcase(os.path.abspath(font_path))
+
+
+class ConfigStore:
+    """
+    User settings kept in memory and written to disk in the background.
+
+    The file is read once; later reads come from the snapshot. Changes are
+    coalesced: each one restarts a short timer and only the last state is
+    written, atomically (temporary file + rename), from a worker thread.
+    Call flush() before exiting to write pending changes immediately.
+    """
+
+    def __init__(self, path=None, delay=SAVE_DELAY):
+        self.path = path or get_config_path()
+        self.delay = delay
+        self._data = None
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()  # keeps writes in order without blocking readers
+        self._timer = None
+        self._dirty = False
+
+    def _load(self):
+        if self._data is not None:
+            return self._data
+
+        data = {}
+        # Older versions wrote the file to the working directory
+        for path in (self.path, CONFIG_FILE):
+            if os.path.isfile(path):
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                    if not isinstance(data, dict):
+                        raise ValueError("not a JSON object")
+                except (OSError, ValueError) as e:
+                    print(f"Failed to load preferences from {path}: {e}")
+                    data = {}
+                break
+
+        data.setdefault("recent_files", [])
+        data.setdefault("presets", {})
+        self._data = data
+        return data
+
+    def snapshot(self) -> dict:
+        """Copy of the current settings."""
+        with self._lock:
+            return copy.deepcopy(self._load())
+
+    def get(self, key, default=None):
+        with self._lock:
+            return copy.deepcopy(self._load().get(key, default))
+
+    def update(self, **prefs):
+        """Change settings and schedule a write."""
+        with self._lock:
+            self._load().update(prefs)
+            self._schedule()
+
+    def recent_files(self) -> list:
+        """Recently used fonts, most recent first."""
+        return self.get("recent_files", [])
+
+    def add_recent_file(self, font_path):
+        path = os.path.abspath(font_path)
+        with self._lock:
+            recent = [p for p in self._load()["recent_files"] if _font_key(p) != _font_key(path)]
+            self._data["recent_files"] = [path] + recent[:MAX_RECENT_FILES - 1]
+            self._schedule()
+
+    def get_preset(self, font_path):
+        """Options last used for a font, or None."""
+        with self._lock:
+            preset = self._load()["presets"].get(_font_key(font_path))
+            return dict(preset) if preset else None
+
+    def set_preset(self, font_path, options):
+        key = _font_key(font_path)
+        with self._lock:
+            presets = self._load()["presets"]
+            # Re-inserting keeps the dict ordered from least to most recently used
+            presets.pop(key, None)
+            presets[key] = {k: options[k] for k in PRESET_KEYS if k in options}
+            while len(presets) > MAX_PRESETS:
+                del presets[next(iter(presets))]
+            self._schedule()
+
+    def _schedule(self):
+        self._dirty = True
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(self.delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self):
+        """Write pending changes now. Safe to call from any thread."""
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not self._dirty:
+                    return
+                self._dirty = False
+                text = json.dumps(self._data, indent=2)
+
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                temp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    f.write(text)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.path)
+            except OSError as e:
+                print(f"Failed to save preferences: {e}")
+
+
+def _current_options(app: "ImFontCompressorApp"):
+    return {
         "symbol_name": app.symbol_name_input.get(),
         "encoding": app.var_encoding.get(),
         "disable_compression": app.var_nocompress.get(),
         "no_static": app.var_nostatic.get(),
         "header_output": app.var_header.get()
     }
+
+
+def save_config(app: "ImFontCompressorApp"):
+    """Record the current preferences; the file is written shortly after, off the UI thread."""
     try:
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(prefs, f, indent=2)
+        app.config_store.update(
+            lang=app.language.lang_code,
+            theme=app.ui_theme.theme_name,
+            **_current_options(app)
+        )
     except Exception as e:
         print(f"Failed to save preferences: {e}")
 
+
+def _apply_options(app: "ImFontCompressorApp", prefs):
+    symbol_name = get_valid_symbol_name(prefs.get("symbol_name"))
+    app.symbol_name_input.delete(0, "end")
+    app.symbol_name_input.insert(0, symbol_name)
+
+    # Stored as the combobox entry; older files may hold the flag itself
+    encoding = prefs.get("encoding")
+    app.var_encoding.set(encoding if encoding in encoding_map else get_encoding_key(encoding))
+    app.var_nocompress.set(prefs.get("disable_compression", False))
+    app.var_nostatic.set(prefs.get("no_static", False))
+    app.var_header.set(prefs.get("header_output", False))
+
+
 def load_config(app: "ImFontCompressorApp", ignore=False):
-    if os.path.isfile(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, "r") as f:
-                prefs = json.load(f)
-
-            # Load language before anything UI-related
-            lang_code = prefs.get("lang")
-            if lang_code:
-                app.language.set_language(lang_code, ignore)
-
-            # Load theme
-            theme_name = prefs.get("theme", "")
-            if theme_name:
-                if "@" in theme_name:
-                    theme_id, version = theme_name.split("@", 1)
-                else:
-                    theme_id, version = theme_name, None
-                app.ui_theme.load_theme(theme_id, version)
-
-            # Load other preferences
-            symbol_name = get_valid_symbol_name(prefs.get("symbol_name"))
-            app.symbol_name_input.delete(0, "end")
-            app.symbol_name_input.insert(0, symbol_name)
-
-            encoding_key = get_encoding_key(prefs.get("encoding"))
-            app.var_encoding.set(encoding_key)
-            app.var_nocompress.set(prefs.get("disable_compression", False))
-            app.var_nostatic.set(prefs.get("no_static", False))
-            app.var_header.set(prefs.get("header_output", False))
-
-        except Exception as e:
-            if not ignore:
-                print(f"Failed to load preferences: {e}")
+    prefs = app.config_store.snapshot()
+    if not any(key in prefs for key in ("lang", "theme", "encoding")):
+        return  # Nothing saved yet
+
+    try:
+        # Load language before anything UI-related
+        lang_code = prefs.get("lang")
+        if lang_code:
+            app.language.set_language(lang_code, ignore)
+
+        # Load theme
+        theme_name = prefs.get("theme", "")
+        if theme_name:
+            if "@" in theme_name:
+                theme_id, version = theme_name.split("@", 1)
+            else:
+                theme_id, version = theme_name, None
+            app.ui_theme.load_theme(theme_id, version)
+
+        # Load other preferences
+        _apply_options(app, prefs)
+
+    except Exception as e:
+        if not ignore:
+            print(f"Failed to load preferences: {e}")
+
+
+def remember_font(app: "ImFontCompressorApp", font_path):
+    """Add a compressed font to the recent files and store its options as its preset."""
+    app.config_store.add_recent_file(font_path)
+    app.config_store.set_preset(font_path, _current_options(app))
+
 
+def apply_font_preset(app: "ImFontCompressorApp", font_path) -> bool:
+    """Restore the options last used for a font. :return: True if it had a preset"""
+    preset = app.config_store.get_preset(font_path)
+    if not preset:
+        return False
+    _apply_options(app, preset)
+    return True
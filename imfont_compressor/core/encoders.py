@@ -0,0 +1,203 @@
+"""
+Source encoders matching the output of data/binary_to_compressed_c.cpp.
+
+Each encoder takes the (optionally stb-compressed) payload and renders the
+C/C++ source the native tool would print for the same options.
+"""
+import math
+import struct
+
+# Byte values with one and two decimal digits, for the -u8 size estimate
+_BELOW_10 = bytes(range(10))
+_BELOW_100 = bytes(range(100))
+
+def _pad4(payload):
+    # The native tool reads whole 32-bit words past the end of the payload,
+    # which is zero-filled there.
+    return bytes(payload) + b"\0" * (-len(payload) % 4)
+
+
+def _words(payload):
+    padded = _pad4(payload)
+    return struct.unpack(f"<{len(padded) // 4}I", padded)
+
+
+def _escape_trigraphs(line):
+    # Escape every '?' that follows another, so '??' can't form a trigraph.
+    # Done without `re`, which would triple the time to import the encoders.
+    if "??" not in line:
+        return line
+    parts = line.split("?")
+    out = [parts[0]]
+    for i in range(1, len(parts)):
+        out.append("\\?" if i > 1 and not parts[i - 1] else "?")
+        out.append(parts[i])
+    return "".join(out)
+
+
+def _encode85_byte(x):
+    x = (x % 85) + 35
+    return chr(x + 1 if x >= ord("\\") else x)
+
+
+def _decode85_byte(c):
+    return ord(c) - 36 if c >= "\\" else ord(c) - 35
+
+
+def base85_chars(payload):
+    """Base85 characters for `payload`, without C escaping or line breaks."""
+    chars = []
+    for d in _words(payload):
+        for _ in range(5):
+            chars.append(_encode85_byte(d))
+            d //= 85
+    return "".join(chars)
+
+
+def base85_decode(text):
+    """Decode base85 characters the way ImGui's Decode85() does."""
+    out = bytearray()
+    for i in range(0, len(text) - len(text) % 5, 5):
+        d = 0
+        for c in reversed(text[i:i + 5]):
+            d = d * 85 + _decode85_byte(c)
+        out += (d & 0xFFFFFFFF).to_bytes(4, "little")
+    return bytes(out)
+
+
+def _header(encoding, input_name, input_size, symbol_name):
+    return (
+        f"// File: '{input_name}' ({input_size} bytes)\n"
+        f"// Exported using binary_to_compressed_c {encoding} \"{input_name}\" {symbol_name}\n"
+    )
+
+
+def encode_u8(payload, symbol_name, input_name, input_size, use_compression=True, use_static=True):
+    static_str = "static " if use_static else ""
+    compressed_str = "compressed_" if use_compression else ""
+    size = len(payload)
+
+    parts = [
+        _header("-u8", input_name, input_size, symbol_name),
+        f"{static_str}const unsigned int {symbol_name}_{compressed_str}size = {size};\n",
+        f"{static_str}const unsigned char {symbol_name}_{compressed_str}data[{size}] =\n{{",
+    ]
+
+    column = 0
+    line = []
+    for value in bytes(payload):
+        token = f"{value},"
+        line.append(token)
+        column += len(token)
+        if column >= 180:
+            parts.append("\n    " + "".join(line))
+            line = []
+            column = 0
+    if line:
+        parts.append("\n    " + "".join(line))
+
+    parts.append("\n};\n\n")
+    return "".join(parts)
+
+
+def encode_u32(payload, symbol_name, input_name, input_size, use_compression=True, use_static=True):
+    static_str = "static " if use_static else ""
+    compressed_str = "compressed_" if use_compression else ""
+    size = len(payload)
+
+    parts = [
+        _header("-u32", input_name, input_size, symbol_name),
+        f"{static_str}const unsigned int {symbol_name}_{compressed_str}size = {size};\n",
+        f"{static_str}const unsigned int {symbol_name}_{compressed_str}data[{((size + 3) // 4) * 4}/4] =\n{{",
+    ]
+
+    words = _words(payload)
+    for start in range(0, len(words), 14):
+        parts.append("\n    " + "".join(f"0x{d:08x}, " for d in words[start:start + 14]))
+
+    parts.append("\n};\n\n")
+    return "".join(parts)
+
+
+def encode_base85(payload, symbol_name, input_name, input_size, use_compression=True, use_static=True):
+    static_str = "static " if use_static else ""
+    compressed_str = "compressed_" if use_compression else ""
+    size = len(payload)
+
+    parts = [
+        _header("-base85", input_name, input_size, symbol_name),
+        f"{static_str}const char {symbol_name}_{compressed_str}data_base85[{((size + 3) // 4) * 5}+1] =\n    \"",
+    ]
+
+    chars = base85_chars(payload)
+    for start in range(0, len(chars), 140):
+        line = _escape_trigraphs(chars[start:start + 140])
+        if start and line.startswith("?") and chars[start - 1] == "?":
+            line = "\\" + line
+        parts.append(line)
+        if start + 140 <= len(chars):
+            parts.append("\"\n    \"")
+
+    parts.append("\";\n\n")
+    return "".join(parts)
+
+
+ENCODERS = {
+    "-u8": encode_u8,
+    "-u32": encode_u32,
+    "-base85": encode_base85,
+}
+
+
+def encode(payload, encoding, symbol_name, input_name, input_size, use_compression=True, use_static=True):
+    """
+    Render `payload` as C source using the given encoding flag.
+
+    :param payload: bytes to embed (already compressed when use_compression is set)
+    :param encoding: one of "-u8", "-u32", "-base85"
+    :param symbol_name: C symbol prefix
+    :param input_name: input path echoed in the header comment
+    :param input_size: size of the original input in bytes
+    :raises ValueError: If the encoding is unknown
+    """
+    encoder = ENCODERS.get(encoding)
+    if encoder is None:
+        raise ValueError(f"[Encoder] Unknown encoding '{encoding}'.")
+    return encoder(payload, symbol_name, input_name, input_size, use_compression, use_static)
+
+
+def binary_size(payload_size, encoding):
+    """Bytes the embedded array occupies in the compiled binary."""
+    if encoding == "-base85":
+        return ((payload_size + 3) // 4) * 5 + 1
+    if encoding == "-u32":
+        return ((payload_size + 3) // 4) * 4
+    return payload_size
+
+
+def estimate_source_size(payload, encoding):
+    """
+    Approximate size of the generated source, from the encoding formulas.
+
+    `payload` may be the payload bytes or just its length. Passing the bytes
+    makes the -u8 figure exact up to line breaks, since its digit count
+    depends on the byte values.
+    """
+    size = payload if isinstance(payload, int) else len(payload)
+    words = (size + 3) // 4
+
+    if encoding == "-u32":
+        # "0x%08x, " per word, a line break every 14 words
+        return words * 12 + math.ceil(words / 14) * 5
+    if encoding == "-base85":
+        # 5 chars per word, '"\n    "' every 28 words
+        return words * 5 + (words // 28) * 6
+
+    if isinstance(payload, int):
+        chars = size * 3.57  # average of "%d," over uniformly distributed bytes
+    else:
+        # "%d," is 2 characters, plus one for bytes from 10 and another from 100
+        chars = (2 * size + len(payload.translate(None, _BELOW_10))
+                 + len(payload.translate(None, _BELOW_100)))
+    # "\n    " each time a line passes 180 columns
+    return int(chars + chars / 180 * 5)
@@ -0,0 +1,146 @@
+"""
+Fast output size estimates for the compressor tab.
+
+A few long contiguous runs spread across the font are compressed with zlib's
+match finder, at C speed, and the result is extrapolated to the whole file.
+Each run is primed with the 32 KB before it, so matches reaching back into
+the font are found as the full compressor would find them. Deflate with
+fixed Huffman codes costs literals and matches much like stb's opcodes do,
+except for matches shorter than 6 bytes, which stb codes at a much higher
+cost; their saving is measured separately and added back. Both coefficients
+were fitted on the synthetic corpus (benchmarks/synthetic_fonts.py) and a set
+of Latin, monospace and icon fonts, on which estimates fall within
+ESTIMATE_TOLERANCE of the real compressed size (benchmarks/bench_estimator.py
+checks accuracy and latency).
+"""
+import os
+import time
+import zlib
+from imfont_compressor.core.stb import stb_compress
+from imfont_compressor.core.encoders import binary_size, estimate_source_size
+
+ESTIMATE_RUNS = 4
+ESTIMATE_RUN_SIZE = 128 * 1024
+ESTIMATE_SHORT_SAMPLE_SIZE = 16 * 1024  # per run, for the saving of short matches
+ESTIMATE_EXACT_SIZE = 16 * 1024  # compressed with stb outright up to this size
+ESTIMATE_FIXED_SCALE = 1.105  # stb bytes per byte of fixed-Huffman deflate
+ESTIMATE_SHORT_SCALE = 1.54  # stb bytes per byte saved by short matches
+ESTIMATE_TOLERANCE = 0.10
+
+# Deflate's window: how much history primes each run
+_HISTORY_SIZE = 32 * 1024
+# Share of the -u8 digit density of a compressed payload that follows uniformly
+# spread bytes rather than the font's own, fitted on the same corpus
+_OPCODE_DENSITY_SHARE = 0.22
+# Header, end opcode and checksum of an stb stream
+_STB_OVERHEAD = 22
+
+
+def _deflate_size(data, history=b"", strategy=zlib.Z_FIXED):
+    """Size of `data` as raw deflate, after `history`."""
+    if history:
+        compressor = zlib.compressobj(6, zlib.DEFLATED, -15, 9, strategy, history)
+    else:
+        compressor = zlib.compressobj(6, zlib.DEFLATED, -15, 9, strategy)
+    return len(compressor.compress(data)) + len(compressor.flush())
+
+
+def _deflate_sizes(data, history=b""):
+    """
+    Deflate size of `data` with fixed Huffman codes, and the bytes its
+    matches shorter than 6 save (Z_FILTERED leaves exactly those out),
+    measured on the start of `data` and scaled to its length.
+    """
+    short = data[:ESTIMATE_SHORT_SAMPLE_SIZE]
+    saved = _deflate_size(short, history, zlib.Z_FILTERED) - _deflate_size(short, history, zlib.Z_DEFAULT_STRATEGY)
+    return _deflate_size(data, history), saved * len(data) / len(short)
+
+
+def _sample_runs(f, size):
+    """
+    Yield (history, run) pairs: the whole file in consecutive runs when it
+    fits in ESTIMATE_RUNS of them, else ESTIMATE_RUNS runs spread evenly
+    from start to end.
+    """
+    if size <= ESTIMATE_RUNS * ESTIMATE_RUN_SIZE:
+        starts = range(0, size, ESTIMATE_RUN_SIZE)
+    else:
+        span = size - ESTIMATE_RUN_SIZE
+        starts = [span * index // (ESTIMATE_RUNS - 1) for index in range(ESTIMATE_RUNS)]
+    for start in starts:
+        history_start = max(0, start - _HISTORY_SIZE)
+        f.seek(history_start)
+        data = f.read(start - history_start + ESTIMATE_RUN_SIZE)
+        yield data[:start - history_start], data[start - history_start:]
+
+
+def estimate_compressed_size(font_path):
+    """
+    Estimate the stb-compressed size of a file.
+
+    :return: (estimated size, sample for the -u8 digit density, exact flag); the
+             sample is the payload when exact, else the sampled runs of the font
+    """
+    size = os.path.getsize(font_path)
+
+    with open(font_path, "rb") as f:
+        # Small inputs are cheap enough to compress outright
+        if size <= ESTIMATE_EXACT_SIZE:
+            compressed = stb_compress(f.read())
+            return len(compressed), compressed, True
+
+        deflated = saved = raw = 0
+        runs = list(_sample_runs(f, size))
+        for history, run in runs:
+            run_deflated, run_saved = _deflate_sizes(run, history)
+            deflated += run_deflated
+            saved += run_saved
+            raw += len(run)
+
+    ratio = (deflated * ESTIMATE_FIXED_SCALE + saved * ESTIMATE_SHORT_SCALE) / raw
+    # Incompressible data is stored as literals, with little more than their size
+    estimate = int(size * min(ratio, 1.0)) + _STB_OVERHEAD
+    return estimate, b"".join(run for _, run in runs), False
+
+
+def estimate_output(font_path, encoding, use_compression=True):
+    """
+    Estimate payload, binary and source size for one set of options.
+
+    :param font_path: input font
+    :param encoding: "-u8", "-u32" or "-base85"
+    :param use_compression: False for -nocompress
+    :return: dict with input_size, payload_size, binary_size, source_size, exact, elapsed_ms
+    """
+    start = time.perf_counter()
+    input_size = os.path.getsize(font_path)
+
+    if use_compression:
+        payload_size, sample, exact = estimate_compressed_size(font_path)
+    elif encoding == "-u8" and input_size:
+        # The payload is the font: the same runs as above, or all of it
+        with open(font_path, "rb") as f:
+            sample = b"".join(run for _, run in _sample_runs(f, input_size))
+        payload_size, exact = input_size, len(sample) == input_size
+    else:
+        payload_size, sample, exact = input_size, b"", True
+
+    if encoding == "-u8" and sample:
+        # digit count depends on byte values, scale the sample's density
+        per_byte = estimate_source_size(sample, encoding) / len(sample)
+        if use_compression and not exact:
+            # The payload keeps part of the font's bytes as literals; its opcodes are spread wider
+            uniform = estimate_source_size(len(sample), encoding) / len(sample)
+            per_byte += (uniform - per_byte) * _OPCODE_DENSITY_SHARE
+        source_size = int(per_byte * payload_size)
+    else:
+        source_size = estimate_source_size(payload_size, encoding)
+
+    return {
+        "input_size": input_size,
+        "payload_size": payload_size,
+        "binary_size": binary_size(payload_size, encoding),
+        "source_size": source_size,
+        "exact": exact,
+        "elapsed_ms": round((time.perf_counter() - start) * 1000.0, 3)
+    }
@@ -1,32 +1,16 @@
-import json
+import os
 import tkinter as tk
 from tkinter import messagebox, filedialog
-import webbrowser
-import threading
-import urllib.request
 import re
-from imfont_compressor.core.config import save_config
+from imfont_compressor.core.config import save_config, remember_font, apply_font_preset
 from imfont_compressor.core.ui_theme import ColorKeys
 from imfont_compressor.core.app import ImFontCompressorApp
-from imfont_compressor.core.utils import encoding_map, get_encoding_value
-from imfont_compressor import CURRENT_VERSION, DISCORD_URL, RELEASE_API, GITHUB_URL
+from imfont_compressor.core.utils import encoding_map, get_encoding_value, run_in_background, format_size
+from imfont_compressor.core.metrics import format_metrics
+from imfont_compressor import DISCORD_URL, GITHUB_URL
 
 def on_theme_changed(app: ImFontCompressorApp):
-    themes = app.ui_theme.list_available_themes()
-    display_to_id_version = {}
-
-    for theme_id, versions in themes.items():
-        if len(versions) == 1:
-            theme = versions[0]
-            name = theme.get("name", theme_id)
-            # Map display name to (id, version)
-            display_to_id_version[name] = (theme_id, theme.get("version", "1.0"))
-        else:
-            for theme in versions:
-                name = theme.get("name", theme_id)
-                version = theme.get("version", "1.0")
-                display_name = f"{name} (v{version})"
-                display_to_id_version[display_name] = (theme_id, version)
+    display_to_id_version = app.ui_theme.get_theme_display_map()
 
     selected_display = app.theme_combo.get()
     if selected_display not in display_to_id_version:
@@ -36,10 +20,7 @@ def on_theme_changed(app: ImFontCompressorApp):
     theme_id, version = display_to_id_version[selected_display]
 
     try:
-        if hasattr(app.ui_theme, "apply_theme_with_version"):
-            app.ui_theme.apply_theme_with_version(theme_id, version)
-        else:
-            app.ui_theme.apply_theme(theme_id)
+        app.ui_theme.apply_theme(theme_id, version)
         save_config(app)
     except Exception as e:
         print(f"[Theme] Failed to apply theme '{theme_id}' version '{version}': {e}")
@@ -56,40 +37,38 @@ def on_language_changed(app: ImFontCompressorApp):
     if selected_code is None or selected_code == app.language.lang_code:
         return
 
+    # Bound widgets are re-labelled and layouts re-flowed in place, no restart needed
     app.language.set_language(selected_code, True)
+    app.root.update_idletasks()
     save_config(app)
 
-    messagebox.showinfo(
-        title=app.language.get("options.message.restart"),
-        message=app.language.get("options.message.restart.language")
-    )
+def set_status(app: ImFontCompressorApp, status_key, color_key, *args):
+    """Show a translated status message that follows language changes."""
+    app.language.bind_text(app.status_label, "compressor.status", app.language.component(status_key, *args))
+    app.status_label.config(fg=app.ui_theme.get_color(color_key))
+
+def set_status_text(app: ImFontCompressorApp, text, color_key):
+    """Show a literal status message, e.g. an error from the compressor."""
+    app.language.unbind_text(app.status_label)
+    app.status_label.config(text=text, fg=app.ui_theme.get_color(color_key))
 
 def browse_font(app: ImFontCompressorApp):
-    file = filedialog.askopenfilename(filetypes=[("Font Files", "*.ttf *.otf")])
+    recent = app.config_store.recent_files()
+    initial_dir = os.path.dirname(recent[0]) if recent else None
+    file = filedialog.askopenfilename(filetypes=[("Font Files", "*.ttf *.otf")], initialdir=initial_dir)
     if file:
-        app.font_input.delete(0, tk.END)
-        app.font_input.insert(0, file)
-        app.status_label.config(
-            text=app.language.get("compressor.status", app.language.get("compressor.status.idle")), 
-            fg=app.ui_theme.get_color(ColorKeys.STATUS_IDLE)
-        )
-
-def on_option_changed(app: ImFontCompressorApp):
-    if not app.initialized:
-        return
+        select_font(app, file)
 
-    app.btn_compress.config(state="normal")
-    app.btn_copy.config(state="disabled")
-    app.btn_save.config(state="disabled")
-    app.status_label.config(
-        text=app.language.get("compressor.status", app.language.get("compressor.status.idle")), 
-        fg=app.ui_theme.get_color(ColorKeys.STATUS_IDLE)
-    )
+def select_font(app: ImFontCompressorApp, font_path):
+    """Use a font picked by Browse or drag-and-drop, restoring the options it was last compressed with."""
+    app.font_input.delete(0, tk.END)
+    app.font_input.insert(0, font_path)
+    apply_font_preset(app, font_path)
+    set_status(app, "compressor.status.idle", ColorKeys.STATUS_IDLE)
+    start_precompute(app)
 
-def compress_font(app: ImFontCompressorApp):
-    from imfont_compressor.core.compressor import run_compression
-    
-    params = {
+def _get_compression_params(app: ImFontCompressorApp):
+    return {
         "font_path": app.font_input.get().strip(),
         "symbol_name": app.symbol_name_input.get().strip(),
         "encoding": get_encoding_value(app.var_encoding.get()),
@@ -98,48 +77,434 @@ def compress_font(app: ImFontCompressorApp):
         "header_output": app.var_header.get()
     }
 
+def start_precompute(app: ImFontCompressorApp):
+    """Compress the selected font in the background so every variant can be derived from the cache."""
+    font_path = app.font_input.get().strip()
+    if not os.path.isfile(font_path):
+        return
+
+    def _compress():
+        with open(font_path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            data = f.read()
+        key = app.compression_cache.key_for(data)
+        app.compression_cache.get_or_compress(data, key)
+        app.font_cache_keys[font_path] = (stat.st_size, stat.st_mtime_ns, key)
+
+    def _done(_, error):
+        if error is not None:
+            print(f"[Precompute] Failed to compress '{font_path}': {error}")
+            return
+        if app.font_input.get().strip() == font_path:
+            derive_output(app)
+
+    set_status(app, "compressor.status.precomputing", ColorKeys.STATUS_WARNING)
+    update_estimate(app)
+    run_in_background(app, _compress, _done)
+
+def is_font_cached(app: ImFontCompressorApp, font_path):
+    """Whether the compressed stream of `font_path`, as it is on disk now, is in the cache."""
+    entry = app.font_cache_keys.get(font_path)
+    if entry is None:
+        return False
+    try:
+        stat = os.stat(font_path)
+    except OSError:
+        return False
+    size, mtime_ns, key = entry
+    return stat.st_size == size and stat.st_mtime_ns == mtime_ns and key in app.compression_cache
+
+def update_estimate(app: ImFontCompressorApp):
+    """Show the estimated output size for the current options next to the encoding box."""
+    from imfont_compressor.core.compressor import parse_encoding
+    from imfont_compressor.core.estimator import estimate_output
+
+    params = _get_compression_params(app)
+    app.estimate_generation += 1
+    generation = app.estimate_generation
+
+    if not os.path.isfile(params["font_path"]):
+        clear_estimate(app)
+        return
+
+    encoding, goal = parse_encoding(params["encoding"])
+    if goal is not None:
+        # Auto mode picks the encoding later, only the compressed size is known up front
+        encoding = "-u8"
+
+    def _done(estimate, error):
+        if generation != app.estimate_generation:
+            return
+        if error is not None:
+            clear_estimate(app)
+            return
+
+        if goal is not None:
+            app.language.bind_text(app.estimate_label, "compressor.label.estimate.auto",
+                                   format_size(estimate["payload_size"]))
+        else:
+            app.language.bind_text(app.estimate_label, "compressor.label.estimate",
+                                   format_size(estimate["binary_size"]), format_size(estimate["source_size"]))
+
+    use_compression = goal is not None or not params["disable_compression"]
+    run_in_background(app, lambda: estimate_output(params["font_path"], encoding, use_compression), _done,
+                      interval=10)
+
+def clear_estimate(app: ImFontCompressorApp):
+    app.language.unbind_text(app.estimate_label)
+    app.estimate_label.config(text="")
+
+def derive_output(app: ImFontCompressorApp):
+    """Encode the current options from the cached stream and make Copy/Save available."""
+    from imfont_compressor.core.compressor import run_compression
+
+    params = _get_compression_params(app)
+    if not os.path.isfile(params["font_path"]):
+        return
+
+    # Older derivations finishing late must not overwrite the newest options
+    app.derive_generation += 1
+    generation = app.derive_generation
+
+    def _done(result, error):
+        if generation != app.derive_generation:
+            return
+        if error is not None or not result["success"]:
+            return
+
+        app.last_output_text = result["output_text"]
+        app.last_output_file = result["output_file"]
+        app.output_ready = True
+        app.ui_theme.set_state(app.btn_copy, "normal")
+        update_save_button(app)
+        set_status(app, "compressor.status.ready", ColorKeys.STATUS_SUCCESS,
+                   format_metrics(result["metrics"]))
+        update_preview(app)
+
+    # Re-derivations follow every option change, the job log only records explicit compressions
+    run_in_background(app, lambda: run_compression(params, None, app.compression_cache, log=False), _done)
+
+def update_preview(app: ImFontCompressorApp):
+    """Spool the latest output to disk and index it for the preview tab, off the UI thread."""
+    from imfont_compressor.core.preview import OutputDocument, get_spool_path, write_spool, remove_spool
+
+    text = app.last_output_text
+    app.last_output_spool = None
+    app.preview_generation += 1
+    generation = app.preview_generation
+    path = get_spool_path(generation)
+    preview_tab = app.main_window.preview_tab
+
+    def _done(document, error):
+        if generation != app.preview_generation:
+            remove_spool(path)
+            return
+        if error is not None:
+            print(f"[Preview] Failed to load the output: {error}")
+            return
+
+        app.last_output_spool = document.path
+        previous = preview_tab.document
+        preview_tab.show_document(document)
+        if previous is not None:
+            _discard_spool(app, previous.path)
+
+    run_in_background(app, lambda: OutputDocument(write_spool(text, path)).index(), _done)
+
+def _discard_spool(app: ImFontCompressorApp, path):
+    """Delete a spool file the preview no longer shows, or once the saves copying it are done."""
+    from imfont_compressor.core.preview import remove_spool
+
+    if app.spool_readers.get(path):
+        app.discarded_spools.add(path)
+    else:
+        remove_spool(path)
+
+def _release_spool(app: ImFontCompressorApp, path):
+    """A save finished copying `path`: delete it if it was discarded meanwhile."""
+    from imfont_compressor.core.preview import remove_spool
+
+    app.spool_readers[path] -= 1
+    if app.spool_readers[path]:
+        return
+    del app.spool_readers[path]
+    if path in app.discarded_spools:
+        app.discarded_spools.discard(path)
+        remove_spool(path)
+
+def update_save_button(app: ImFontCompressorApp):
+    """Save is available while the output matches the current options and no save is still writing."""
+    enabled = app.output_ready and not app.saves_in_progress
+    app.ui_theme.set_state(app.btn_save, "normal" if enabled else "disabled")
+
+def on_option_changed(app: ImFontCompressorApp):
+    if not app.initialized:
+        return
+
+    app.ui_theme.set_state(app.btn_compress, "normal")
+    app.output_ready = False
+    app.ui_theme.set_state(app.btn_copy, "disabled")
+    update_save_button(app)
+    set_status(app, "compressor.status.idle", ColorKeys.STATUS_IDLE)
+
+    # Re-derive from the cached stream instead of discarding the result,
+    # debounced so typing a symbol name doesn't queue an encode per key
+    if app.derive_after_id is not None:
+        app.root.after_cancel(app.derive_after_id)
+    app.derive_after_id = app.root.after(150, _on_options_settled, app)
+
+def _on_options_settled(app: ImFontCompressorApp):
+    app.derive_after_id = None
+    update_estimate(app)
+    font_path = app.font_input.get().strip()
+    if is_font_cached(app, font_path):
+        derive_output(app)
+
+def compress_font(app: ImFontCompressorApp):
+    from imfont_compressor.core.compressor import run_compression
+    
+    params = _get_compression_params(app)
+
     def status_set(text, fg):
+        app.language.unbind_text(app.status_label)
         app.status_label.config(text=text, fg=fg)
         app.root.update_idletasks()
 
-    status_set(app.language.get("compressor.status", app.language.get("compressor.status.compressing")), app.ui_theme.get_color(ColorKeys.STATUS_WARNING))
+    set_status(app, "compressor.status.compressing", ColorKeys.STATUS_WARNING)
+    app.root.update_idletasks()
 
-    result = run_compression(params, status_set)
+    if app.profile_jobs:
+        _profile_compression(app, params)
+        return
 
+    result = run_compression(params, status_set, app.compression_cache)
+    _on_compressed(app, params, result)
+
+def _on_compressed(app: ImFontCompressorApp, params, result):
     if result["success"]:
         app.last_output_text = result["output_text"]
         app.last_output_file = result["output_file"]
 
-        app.btn_copy.config(state="normal")
-        app.btn_save.config(state="normal")
+        app.output_ready = True
+        app.ui_theme.set_state(app.btn_copy, "normal")
+        update_save_button(app)
+        update_preview(app)
 
-        status_set(app.language.get("compressor.status", app.language.get("compressor.status.compressed")), app.ui_theme.get_color(ColorKeys.STATUS_SUCCESS))
-        app.ui_theme.refresh_colors()
+        if "auto" in result:
+            from imfont_compressor.core.compressor import format_auto_summary
+            set_status(app, "compressor.status.auto", ColorKeys.STATUS_SUCCESS, format_auto_summary(result["auto"]))
+        else:
+            set_status(app, "compressor.status.compressed", ColorKeys.STATUS_SUCCESS,
+                       format_metrics(result["metrics"]))
+        remember_font(app, params["font_path"])
         save_config(app)
     else:
-        status_set(f"({app.language.get("message.error")}) {result['error']}", app.ui_theme.get_color(ColorKeys.STATUS_ERROR))
+        set_status_text(app, f"({app.language.get("message.error")}) {result['error']}", ColorKeys.STATUS_ERROR)
+
+def toggle_job_profiling(app: ImFontCompressorApp):
+    """Hidden switch (Ctrl+Shift+P): profile the next compressions like `compress --profile`."""
+    app.profile_jobs = not app.profile_jobs
+    set_status(app, "compressor.status.profiling_on" if app.profile_jobs else "compressor.status.profiling_off",
+               ColorKeys.STATUS_WARNING)
+
+def _profile_compression(app: ImFontCompressorApp, params):
+    """Compress in-process, uncached, under cProfile and tracemalloc, on a worker thread."""
+    from imfont_compressor.core.compressor import run_compression
+    from imfont_compressor.core.profiling import JobProfiler
+
+    profiler = JobProfiler()
+
+    def _job(on_stage, memory_pass):
+        return run_compression(params, None, None, on_stage, in_process=True, log=not memory_pass)
+
+    def _profile():
+        result = profiler.run(_job)
+        paths = None
+        if result["success"]:
+            paths = profiler.save(result["output_file"], os.path.basename(params["font_path"]))
+        return result, paths
+
+    def _done(value, error):
+        if error is not None:
+            set_status_text(app, f"({app.language.get("message.error")}) {error}", ColorKeys.STATUS_ERROR)
+            return
+        result, paths = value
+        _on_compressed(app, params, result)
+        if paths is not None:
+            set_status(app, "compressor.status.profiled", ColorKeys.STATUS_SUCCESS, paths[1])
+
+    set_status(app, "compressor.status.profiling", ColorKeys.STATUS_WARNING)
+    run_in_background(app, _profile, _done)
+
+def compare_encodings(app: ImFontCompressorApp):
+    from imfont_compressor.core.compressor import compare_encodings as run_comparison
+
+    params = {
+        "font_path": app.font_input.get().strip(),
+        "symbol_name": app.symbol_name_input.get().strip(),
+        "no_static": app.var_nostatic.get()
+    }
+
+    app.ui_theme.set_state(app.btn_compare, "disabled")
+    set_status(app, "compressor.status.comparing", ColorKeys.STATUS_WARNING)
+
+    # Encoding runs in a process pool; the Tk side only gets the finished result
+    def _done(result, error):
+        app.ui_theme.set_state(app.btn_compare, "normal")
+        if error is not None:
+            result = {"success": False, "error": str(error)}
+        if not result["success"]:
+            set_status_text(app, f"({app.language.get("message.error")}) {result['error']}", ColorKeys.STATUS_ERROR)
+            return
+
+        set_status(app, "compressor.status.compared", ColorKeys.STATUS_SUCCESS)
+        show_comparison(app, result)
+
+    run_in_background(app, lambda: run_comparison(params), _done)
+
+def show_comparison(app: ImFontCompressorApp, result):
+    from imfont_compressor.core.compressor import format_comparison
+
+    window = tk.Toplevel(app.root)
+    window.title(app.language.get("compressor.compare.title"))
+    window.transient(app.root)
+    window.resizable(False, False)
+    app.ui_theme.apply_colors(window, bg=ColorKeys.BG_MAIN_FRAME)
+
+    table = format_comparison(result)
+    lines = table.splitlines()
+    text = tk.Text(
+        window,
+        width=max(len(line) for line in lines) + 1,
+        height=len(lines),
+        wrap="none",
+        font=("Courier New", 9),
+        padx=8,
+        pady=8,
+        borderwidth=0
+    )
+    text.insert("1.0", table)
+    text.configure(state="disabled")
+    text.pack(padx=app.pad_x, pady=app.pad_y)
+    app.ui_theme.apply_colors(
+        text,
+        bg=ColorKeys.BG_CHILD_FRAME,
+        fg=ColorKeys.LABEL,
+        disabled_bg=ColorKeys.BG_CHILD_FRAME,
+        disabled_fg=ColorKeys.LABEL
+    )
+
+# Larger outputs are offered as an #include of the saved file instead of raw text
+CLIPBOARD_INLINE_LIMIT = 8 * 1024 * 1024
+CLIPBOARD_CHUNK = 256 * 1024
 
 def copy_result(app: ImFontCompressorApp):
-    if app.last_output_text:
-        app.root.clipboard_clear()
-        app.root.clipboard_append(app.last_output_text)
+    text = app.last_output_text
+    if not text:
+        return
+
+    if len(text) > CLIPBOARD_INLINE_LIMIT and app.last_output_file:
+        choice = messagebox.askyesnocancel(
+            app.language.get("compressor.message.copy_large_title"),
+            app.language.get("compressor.message.copy_large", format_size(len(text)), app.last_output_file)
+        )
+        if choice is None:
+            return
+        if choice:
+            _copy_include(app)
+            return
+
+    _stream_to_clipboard(app, text)
+
+def _stream_to_clipboard(app: ImFontCompressorApp, text):
+    """Append the text to the clipboard in slices, yielding to the event loop between them."""
+    app.root.clipboard_clear()
+    app.ui_theme.set_state(app.btn_copy, "disabled")
+
+    def _append(offset):
+        app.root.clipboard_append(text[offset:offset + CLIPBOARD_CHUNK])
+        offset += CLIPBOARD_CHUNK
+        if offset < len(text):
+            set_status(app, "compressor.status.copying", ColorKeys.STATUS_WARNING, offset * 100 // len(text))
+            app.root.after(1, _append, offset)
+            return
+
+        app.ui_theme.set_state(app.btn_copy, "normal")
+        set_status(app, "compressor.status.copied", ColorKeys.STATUS_SUCCESS)
         messagebox.showinfo(
             app.language.get("compressor.message.copy"),
             app.language.get("compressor.message.copy_compressed_font")
         )
 
+    _append(0)
+
+def _copy_include(app: ImFontCompressorApp):
+    from imfont_compressor.core.preview import include_snippet
+
+    path = app.last_output_file
+
+    def _saved():
+        snippet = include_snippet(path)
+        app.root.clipboard_clear()
+        app.root.clipboard_append(snippet)
+        set_status(app, "compressor.status.copied", ColorKeys.STATUS_SUCCESS)
+        messagebox.showinfo(
+            app.language.get("compressor.message.copy"),
+            app.language.get("compressor.message.copy_include", path, snippet)
+        )
+
+    _save_output(app, path, _saved)
+
 def save_result(app: ImFontCompressorApp):
     if app.last_output_text:
         ext = ".h" if app.var_header.get() else ".cpp"
         filetypes = [("Header File", "*.h")] if ext == ".h" else [("CPP File", "*.cpp")]
-        f = filedialog.asksaveasfile(mode='w', defaultextension=ext, filetypes=filetypes)
-        if f:
-            f.write(app.last_output_text)
-            f.close()
-            messagebox.showinfo(
-                app.language.get("compressor.message.save"), 
-                app.language.get("compressor.message.save_compressed_font", f.name)
+        suggested = app.last_output_file or ""
+        path = filedialog.asksaveasfilename(
+            defaultextension=ext,
+            filetypes=filetypes,
+            initialdir=os.path.dirname(suggested) or None,
+            initialfile=os.path.basename(suggested) or None
+        )
+        if path:
+            _save_output(app, path, lambda: messagebox.showinfo(
+                app.language.get("compressor.message.save"),
+                app.language.get("compressor.message.save_compressed_font", path)
+            ))
+
+def _save_output(app: ImFontCompressorApp, path, on_saved):
+    """Write the current output on a worker, copying the preview's spool file when it is ready."""
+    from imfont_compressor.core.preview import save_output
+
+    source = app.last_output_spool
+    text = None if source else app.last_output_text
+
+    # Keep the spool file until the copy is done, even if the preview moves on
+    if source:
+        app.spool_readers[source] = app.spool_readers.get(source, 0) + 1
+    app.saves_in_progress += 1
+    update_save_button(app)
+    set_status(app, "compressor.status.saving", ColorKeys.STATUS_WARNING, 0)
+
+    def _progress(fraction):
+        set_status(app, "compressor.status.saving", ColorKeys.STATUS_WARNING, int(fraction * 100))
+
+    def _done(_, error):
+        if source:
+            _release_spool(app, source)
+        app.saves_in_progress -= 1
+        update_save_button(app)
+        if error is not None:
+            set_status_text(app, f"({app.language.get("message.error")}) {error}", ColorKeys.STATUS_ERROR)
+            messagebox.showerror(
+                app.language.get("message.error"),
+                app.language.get("compressor.message.save_failed", error)
             )
+            return
+        set_status(app, "compressor.status.saved", ColorKeys.STATUS_SUCCESS)
+        on_saved()
+
+    run_in_background(app, lambda report: save_output(path, source, text, report), _done, on_progress=_progress)
 
 def reset_to_defaults(app: ImFontCompressorApp):
     app.var_encoding.set(list(encoding_map.keys())[0])
@@ -149,13 +514,12 @@ def reset_to_defaults(app: ImFontCompressorApp):
     app.font_input.delete(0, tk.END)
     app.symbol_name_input.delete(0, tk.END)
     app.symbol_name_input.insert(0, "example")
-    app.status_label.config(
-        text=app.language.get("compressor.status", app.language.get("compressor.status.reset")), 
-        fg=app.ui_theme.get_color(ColorKeys.STATUS_SUCCESS)
-    )
+    clear_estimate(app)
+    set_status(app, "compressor.status.reset", ColorKeys.STATUS_SUCCESS)
     save_config(app)
 
 def open_discord(app: ImFontCompressorApp):
+    import webbrowser
     try:
         webbrowser.open(DISCORD_URL)
     except Exception as e:
@@ -165,6 +529,7 @@ def open_discord(app: ImFontCompressorApp):
         )
 
 def open_github(app: ImFontCompressorApp):
+    import webbrowser
     try:
         webbrowser.open(GITHUB_URL)
     except Exception as e:
@@ -173,46 +538,17 @@ def open_github(app: ImFontCompressorApp):
             app.language.get("options.message.error.opening_github", e)
         )
 
-def compare_versions(v1, v2):
-    def parse_version(version):
-        return [int(num) for num in re.sub(r'[^0-9.]', '', version).split('.')]
-    
-    v1_parts = parse_version(v1)
-    v2_parts = parse_version(v2)
-    
-    for i in range(max(len(v1_parts), len(v2_parts))):
-        v1_part = v1_parts[i] if i < len(v1_parts) else 0
-        v2_part = v2_parts[i] if i < len(v2_parts) else 0
-        
-        if v1_part < v2_part:
-            return -1
-        elif v1_part > v2_part:
-            return 1
-    
-    return 0
+def get_update_status(app: ImFontCompressorApp, force=False):
+    """
+    Latest release info from the update checker (cached on disk, see core/updates.py).
+    Blocks on the network at most once per TTL; call it off the Tk thread.
 
-def get_update_status():
-    try:
-        with urllib.request.urlopen(RELEASE_API + "/latest") as response:
-            data = json.load(response)
-            latest_version = data["tag_name"].lstrip("v")
-            download_url = data["html_url"]
-            
-            comparison = compare_versions(CURRENT_VERSION, latest_version)
-            is_update = comparison < 0
-            
-            return {
-                "is_update": is_update,
-                "latest_version": latest_version,
-                "download_url": download_url
-            }
-    except Exception as e:
-        print(f"Error checking for updates: {str(e)}")
-        return {
-            "is_update": False,
-            "latest_version": "",
-            "download_url": ""
-        }
+    :raises UpdateCheckError: if the release could not be looked up
+    """
+    from imfont_compressor.core.updates import UpdateChecker
+    if app.update_checker is None:
+        app.update_checker = UpdateChecker()
+    return app.update_checker.check(force)
 
 def get_update_message(app: ImFontCompressorApp, status):
     if status["is_update"]:
@@ -223,28 +559,28 @@ def get_update_message(app: ImFontCompressorApp, status):
         return app.language.get("options.message.update.up_to_date"), app.language.get("options.message.update.latest"), False
 
 def check_and_notify_update(app: ImFontCompressorApp):
-    def _check():
-        try:
-            app.update_btn.configure(state="disabled")
-            status = get_update_status()
-            title, message, is_update = get_update_message(app, status)
-        
-            if is_update:
-                if messagebox.askyesno(title, message):
-                    webbrowser.open(status["download_url"])
-            else:
-                messagebox.showinfo(title, message)
-
-            app.update_btn.configure(state="normal")
-
-        except Exception as e:
-            app.update_btn.configure(state="normal")
+    # The lookup runs on a worker; the dialogs are shown from the Tk thread once it is done
+    app.ui_theme.set_state(app.update_btn, "disabled")
+
+    def _done(status, error):
+        import webbrowser
+
+        app.ui_theme.set_state(app.update_btn, "normal")
+        if error is not None:
             messagebox.showerror(
-                app.language.get("message.error"), 
-                app.language.get("options.message.error.check_for_updates", str(e))
+                app.language.get("message.error"),
+                app.language.get("options.message.error.check_for_updates", str(error))
             )
+            return
+
+        title, message, is_update = get_update_message(app, status)
+        if is_update:
+            if messagebox.askyesno(title, message):
+                webbrowser.open(status["download_url"])
+        else:
+            messagebox.showinfo(title, message)
 
-    threading.Thread(target=_check, daemon=True).start()
+    run_in_background(app, lambda: get_update_status(app), _done)
 
 def parse_version(version):
     main, *pre = re.sub(r'[^0-9A-Za-z.-]', '', version).split('-', 1)
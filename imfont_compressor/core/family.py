@@ -0,0 +1,334 @@
+"""
+Font family mode: share identical sfnt tables across several fonts.
+
+Weight families (Regular/Medium/Bold/...) usually carry byte-identical
+tables such as `cmap`, `name` or `post`. Instead of embedding every font
+separately, each distinct table is stored once in a single blob, and a
+small per-font manifest plus a C reconstructor rebuilds every sfnt on
+demand.
+"""
+import hashlib
+import os
+import struct
+from string import Template
+from imfont_compressor.core.stb import stb_compress
+from imfont_compressor.core.encoders import encode
+
+SFNT_HEADER_SIZE = 12
+SFNT_RECORD_SIZE = 16
+TAG_TTC = b"ttcf"
+
+FAMILY_ENCODINGS = ("-u8", "-u32")
+
+
+def read_table_directory(data):
+    """
+    Parse the table directory of a TrueType/OpenType font.
+
+    :param data: font file contents
+    :return: dict with the sfnt header fields and a list of table records
+    :raises ValueError: If the data is not a single sfnt font
+    """
+    if len(data) < SFNT_HEADER_SIZE:
+        raise ValueError("[Family] File is too small to be a font.")
+    if data[:4] == TAG_TTC:
+        raise ValueError("[Family] Font collections (.ttc) are not supported.")
+
+    sfnt_version, num_tables, search_range, entry_selector, range_shift = struct.unpack_from(">IHHHH", data, 0)
+    if SFNT_HEADER_SIZE + num_tables * SFNT_RECORD_SIZE > len(data):
+        raise ValueError("[Family] Truncated table directory.")
+
+    tables = []
+    for n in range(num_tables):
+        tag, checksum, offset, length = struct.unpack_from(">4sIII", data, SFNT_HEADER_SIZE + n * SFNT_RECORD_SIZE)
+        if offset + length > len(data):
+            raise ValueError(f"[Family] Table '{tag.decode('latin-1')}' lies outside the file.")
+        tables.append({
+            "tag": tag,
+            "checksum": checksum,
+            "offset": offset,
+            "length": length
+        })
+
+    return {
+        "sfnt_version": sfnt_version,
+        "search_range": search_range,
+        "entry_selector": entry_selector,
+        "range_shift": range_shift,
+        "tables": tables
+    }
+
+
+def build_family(fonts):
+    """
+    Deduplicate the tables of several fonts into one blob.
+
+    :param fonts: list of (name, data) tuples
+    :return: dict with the blob, the per-font manifests and size statistics
+    """
+    blob = bytearray()
+    blob_offsets = {}  # table digest -> offset in blob
+    manifests = []
+    raw_bytes = 0
+    table_count = 0
+
+    for name, data in fonts:
+        directory = read_table_directory(data)
+        for table in directory["tables"]:
+            table_data = data[table["offset"]:table["offset"] + table["length"]]
+            digest = hashlib.sha1(table_data).digest()
+            if digest not in blob_offsets:
+                blob_offsets[digest] = len(blob)
+                blob += table_data
+                blob += b"\0" * (-len(blob) % 4)  # keep tables 4-byte aligned
+            table["blob_offset"] = blob_offsets[digest]
+            raw_bytes += table["length"]
+            table_count += 1
+
+        manifest = dict(directory, name=name, size=len(data))
+        manifest["exact"] = rebuild_font(blob, manifest) == bytes(data)
+        manifests.append(manifest)
+
+    unique_bytes = sum(
+        t["length"] for t in {t["blob_offset"]: t for m in manifests for t in m["tables"]}.values()
+    )
+
+    return {
+        "blob": bytes(blob),
+        "fonts": manifests,
+        "table_count": table_count,
+        "unique_table_count": len(blob_offsets),
+        "raw_table_bytes": raw_bytes,
+        "unique_table_bytes": unique_bytes,
+        "saved_bytes": raw_bytes - unique_bytes,
+        "total_font_bytes": sum(m["size"] for m in manifests)
+    }
+
+
+def rebuild_font(blob, manifest):
+    """
+    Rebuild one sfnt from the shared blob, mirroring the generated C reconstructor.
+
+    :param blob: deduplicated table blob
+    :param manifest: per-font manifest from build_family()
+    :return: font file contents
+    """
+    out = bytearray(manifest["size"])
+    tables = manifest["tables"]
+    struct.pack_into(">IHHHH", out, 0, manifest["sfnt_version"], len(tables),
+                     manifest["search_range"], manifest["entry_selector"], manifest["range_shift"])
+    for n, table in enumerate(tables):
+        struct.pack_into(">4sIII", out, SFNT_HEADER_SIZE + n * SFNT_RECORD_SIZE,
+                         table["tag"], table["checksum"], table["offset"], table["length"])
+        out[table["offset"]:table["offset"] + table["length"]] = \
+            blob[table["blob_offset"]:table["blob_offset"] + table["length"]]
+    return bytes(out)
+
+
+_DECOMPRESSOR = Template("""\
+// stb_decompress (from stb.h), trimmed to what the blob needs
+static unsigned char* ${p}_dout;
+static void ${p}_match(const unsigned char* data, unsigned int length)
+{
+    while (length--) *${p}_dout++ = *data++;
+}
+static void ${p}_lit(const unsigned char* data, unsigned int length)
+{
+    memcpy(${p}_dout, data, length);
+    ${p}_dout += length;
+}
+#define ${P}_IN2(x) ((i[x] << 8) + i[(x) + 1])
+#define ${P}_IN3(x) ((i[x] << 16) + ${P}_IN2((x) + 1))
+static const unsigned char* ${p}_token(const unsigned char* i)
+{
+    if (*i >= 0x20) {
+        if (*i >= 0x80)      ${p}_match(${p}_dout - i[1] - 1, i[0] - 0x80 + 1), i += 2;
+        else if (*i >= 0x40) ${p}_match(${p}_dout - (${P}_IN2(0) - 0x4000 + 1), i[2] + 1), i += 3;
+        else                 ${p}_lit(i + 1, i[0] - 0x20 + 1), i += 1 + (i[0] - 0x20 + 1);
+    } else {
+        if (*i >= 0x18)      ${p}_match(${p}_dout - (${P}_IN3(0) - 0x180000 + 1), i[3] + 1), i += 4;
+        else if (*i >= 0x10) ${p}_match(${p}_dout - (${P}_IN3(0) - 0x100000 + 1), ${P}_IN2(3) + 1), i += 5;
+        else if (*i >= 0x08) ${p}_lit(i + 2, ${P}_IN2(0) - 0x0800 + 1), i += 2 + (${P}_IN2(0) - 0x0800 + 1);
+        else if (*i == 0x07) ${p}_lit(i + 3, ${P}_IN2(1) + 1), i += 3 + (${P}_IN2(1) + 1);
+        else if (*i == 0x06) ${p}_match(${p}_dout - (${P}_IN3(1) + 1), i[4] + 1), i += 5;
+        else if (*i == 0x04) ${p}_match(${p}_dout - (${P}_IN3(1) + 1), ${P}_IN2(4) + 1), i += 6;
+    }
+    return i;
+}
+#undef ${P}_IN2
+#undef ${P}_IN3
+
+// Decompress the shared blob into `out` (${p}_blob_size bytes)
+${static}void ${p}_unpack(unsigned char* out)
+{
+    const unsigned char* i = (const unsigned char*)${data} + 16;
+    ${p}_dout = out;
+    for (;;)
+    {
+        const unsigned char* old_i = i;
+        i = ${p}_token(i);
+        if (i == old_i)
+            break;
+    }
+}
+
+""")
+
+_UNPACK_RAW = Template("""\
+// Copy the shared blob into `out` (${p}_blob_size bytes)
+${static}void ${p}_unpack(unsigned char* out)
+{
+    memcpy(out, ${data}, ${p}_blob_size);
+}
+
+""")
+
+_RECONSTRUCTOR = Template("""\
+static void ${p}_put2(unsigned char* out, unsigned int v) { out[0] = (unsigned char)(v >> 8); out[1] = (unsigned char)v; }
+static void ${p}_put4(unsigned char* out, unsigned int v) { ${p}_put2(out, v >> 16); ${p}_put2(out + 2, v); }
+
+// Size in bytes of font `index` once rebuilt
+${static}unsigned int ${p}_font_size(int index)
+{
+    return ${p}_fonts[index][3];
+}
+
+// Rebuild font `index` from the unpacked blob into `out` (${p}_font_size(index) bytes)
+${static}unsigned int ${p}_rebuild(const unsigned char* blob, int index, unsigned char* out)
+{
+    const unsigned int* font = ${p}_fonts[index];
+    memset(out, 0, font[3]);
+    ${p}_put4(out, font[0]);
+    ${p}_put2(out + 4, font[1]);
+    ${p}_put2(out + 6, font[4]);
+    ${p}_put2(out + 8, font[5]);
+    ${p}_put2(out + 10, font[6]);
+    for (unsigned int n = 0; n < font[1]; n++)
+    {
+        const unsigned int* table = ${p}_tables[font[2] + n];
+        unsigned char* record = out + 12 + n * 16;
+        ${p}_put4(record, table[0]);
+        ${p}_put4(record + 4, table[1]);
+        ${p}_put4(record + 8, table[2]);
+        ${p}_put4(record + 12, table[3]);
+        memcpy(out + table[2], blob + table[4], table[3]);
+    }
+    return font[3];
+}
+
+""")
+
+
+def format_family_report(family):
+    """Summarise what deduplication saved, one line per statistic."""
+    lines = [
+        f"{len(family['fonts'])} fonts, {family['table_count']} tables ({family['unique_table_count']} unique)",
+        f"Tables: {family['raw_table_bytes']} bytes raw, {family['unique_table_bytes']} bytes after deduplication "
+        f"({family['saved_bytes']} bytes saved)",
+    ]
+    if "compressed_size" in family:
+        lines.append(f"Blob: {len(family['blob'])} bytes, {family['compressed_size']} bytes compressed "
+                     f"(fonts total {family['total_font_bytes']} bytes)")
+    return lines
+
+
+def generate_family_source(family, symbol_name, encoding="-u8", use_compression=True, use_static=True):
+    """
+    Render the deduplicated family as C source: blob, manifests and reconstructor.
+
+    :raises ValueError: If the encoding can't be decoded by the reconstructor
+    """
+    if encoding not in FAMILY_ENCODINGS:
+        raise ValueError(f"[Family] Encoding '{encoding}' is not supported in family mode, use -u8 or -u32.")
+
+    p = f"{symbol_name}_family"
+    static_str = "static " if use_static else ""
+    blob = family["blob"]
+    payload = stb_compress(blob) if use_compression else blob
+    family["compressed_size"] = len(payload)
+
+    names = ", ".join(m["name"] for m in family["fonts"])
+    parts = [f"// ImFont family '{symbol_name}': {names}\n"]
+    parts += [f"// {line}\n" for line in format_family_report(family)]
+    parts.append(
+        "//\n"
+        "// Usage:\n"
+        f"//   unsigned char* blob = (unsigned char*)malloc({p}_blob_size);\n"
+        f"//   {p}_unpack(blob);\n"
+        f"//   unsigned int size = {p}_font_size(i);\n"
+        "//   unsigned char* ttf = (unsigned char*)IM_ALLOC(size);\n"
+        f"//   {p}_rebuild(blob, i, ttf);\n"
+        "//   io.Fonts->AddFontFromMemoryTTF(ttf, (int)size, 16.0f); // atlas takes ownership of ttf\n"
+        "\n"
+        "#include <string.h>\n\n"
+    )
+
+    parts.append(encode(payload, encoding, f"{p}_pack", names, len(blob), use_compression, use_static))
+    parts.append(f"{static_str}const unsigned int {p}_blob_size = {len(blob)};\n")
+    parts.append(f"{static_str}const int {p}_font_count = {len(family['fonts'])};\n\n")
+
+    total_tables = sum(len(m["tables"]) for m in family["fonts"])
+    parts.append(f"// tag, checksum, offset, length, blob offset\n"
+                 f"static const unsigned int {p}_tables[{total_tables}][5] =\n{{\n")
+    for manifest in family["fonts"]:
+        for t in manifest["tables"]:
+            tag = int.from_bytes(t["tag"], "big")
+            parts.append(f"    {{ 0x{tag:08x}, 0x{t['checksum']:08x}, {t['offset']}, {t['length']}, {t['blob_offset']} }}, "
+                         f"// '{t['tag'].decode('latin-1')}'\n")
+    parts.append("};\n\n")
+
+    parts.append(f"// sfnt version, table count, first table, size, search range, entry selector, range shift\n"
+                 f"static const unsigned int {p}_fonts[{len(family['fonts'])}][7] =\n{{\n")
+    first = 0
+    for manifest in family["fonts"]:
+        parts.append(f"    {{ 0x{manifest['sfnt_version']:08x}, {len(manifest['tables'])}, {first}, {manifest['size']}, "
+                     f"{manifest['search_range']}, {manifest['entry_selector']}, {manifest['range_shift']} }}, "
+                     f"// {manifest['name']}\n")
+        first += len(manifest["tables"])
+    parts.append("};\n\n")
+
+    data_name = f"{p}_pack_{'compressed_' if use_compression else ''}data"
+    fields = {"p": p, "P": p.upper(), "static": static_str, "data": data_name}
+    parts.append((_DECOMPRESSOR if use_compression else _UNPACK_RAW).substitute(fields))
+    parts.append(_RECONSTRUCTOR.substitute(fields))
+    return "".join(parts)
+
+
+def run_family_compression(params, status_callback):
+    font_paths = params["font_paths"]
+    symbol_name = params["symbol_name"] or "data"
+    encoding = params["encoding"]
+    disable_compression = params["disable_compression"]
+    no_static = params["no_static"]
+    header_output = params["header_output"]
+
+    if len(font_paths) < 2:
+        return {"success": False, "error": "Family mode needs at least two fonts."}
+
+    for font_path in font_paths:
+        if not os.path.isfile(font_path):
+            return {"success": False, "error": f"Font file not found: {font_path}"}
+
+    output_dir = os.path.dirname(font_paths[0])
+    output_file = os.path.join(output_dir, symbol_name + (".h" if header_output else ".cpp"))
+
+    try:
+        fonts = []
+        for font_path in font_paths:
+            with open(font_path, "rb") as f:
+                fonts.append((os.path.splitext(os.path.basename(font_path))[0], f.read()))
+
+        family = build_family(fonts)
+        output_text = generate_family_source(family, symbol_name, encoding, not disable_compression, not no_static)
+
+        return {
+            "success": True,
+            "output_text": output_text,
+            "output_file": output_file,
+            "saved_bytes": family["saved_bytes"],
+            "report": format_family_report(family),
+            "fonts": [{"name": m["name"], "size": m["size"], "exact": m["exact"]} for m in family["fonts"]]
+        }
+
+    except Exception as e:
+        return {"success": False, "error": str(e)}
@@ -1,8 +1,10 @@
 import os
 import json
+import threading
+import weakref
 from enum import Enum
-from collections import Counter
 from imfont_compressor.core.utils import get_resource_path
+from imfont_compressor.core.assets import get_asset_bundle, LANGUAGES_ENTRY, LANGUAGE_ENTRY
 
 
 class TextAlignment(Enum):
@@ -24,9 +26,10 @@ class TextAlignment(Enum):
 
 
 class Component:
-    def __init__(self, key: str, value: str):
+    def __init__(self, key: str, value: str, args=()):
         self.key = key
         self.value = value
+        self.args = args
 
     def __str__(self):
         return self.value
@@ -41,27 +44,34 @@ class Language:
     def __init__(self, app, lang_code="en_us", localization_dir=None):
         self.app = app
         self.lang_code = lang_code
+        # Packed catalogs are used only for the bundled languages directory
+        self.bundle = get_asset_bundle() if localization_dir is None else None
         self.localization_dir = localization_dir or get_resource_path("assets", "languages")
         self.translations = {}
         self.language_name = ""
         self.alignment = TextAlignment.LTR
+        # widget -> {option: (key, args)}, re-translated on every language change
+        self._bound = weakref.WeakKeyDictionary()
+        self._listeners = []
         self.load_language(self.lang_code, True)
 
-    def load_language(self, lang_code, ignore=False):
+    def _read_catalog(self, lang_code):
+        if self.bundle is not None and LANGUAGE_ENTRY % lang_code in self.bundle:
+            return self.bundle.load(LANGUAGE_ENTRY % lang_code)
+
         path = os.path.join(self.localization_dir, f"{lang_code}.json")
         if not os.path.isfile(path):
             raise FileNotFoundError(f"[Localization] Language file not found: {path}")
+        return load_catalog(path)
 
-        duplicates = check_duplicate_keys(path)
-        if duplicates:
-            raise ValueError(f"[Localization] Duplicate translation keys found in '{lang_code}.json': {duplicates}")
-
+    def load_language(self, lang_code, ignore=False):
         try:
-            with open(path, "r", encoding="utf-8") as file:
-                data = json.load(file)
+            data = self._read_catalog(lang_code)
 
             if lang_code == "en_us":
                 Language.fallback_language = data.get("translations", {})
+            elif Language.fallback_language is None:
+                self._load_fallback()
 
             self.language_name = data.get("name", lang_code)
             self.translations = data.get("translations", {})
@@ -70,12 +80,20 @@ class Language:
             if not ignore:
                 print(f"[Localization] Loaded language: {self.language_name} ({lang_code})")
 
+        except DuplicateKeysError as e:
+            raise ValueError(f"[Localization] Duplicate translation keys found in '{lang_code}.json': {e.duplicates}")
         except Exception as e:
             print(f"[Localization] Failed to load language file: {e}")
             self.translations = {}
             self.language_name = ""
             self.alignment = TextAlignment.LTR
 
+    def _load_fallback(self):
+        try:
+            Language.fallback_language = self._read_catalog("en_us").get("translations", {})
+        except Exception as e:
+            print(f"[Localization] Failed to load fallback language: {e}")
+
     def get(self, key: str, *args) -> Component:
         if not isinstance(key, str):
             raise TypeError("get() expects a string key")
@@ -103,25 +121,76 @@ class Language:
 
         return raw_value
 
+    def component(self, key: str, *args) -> Component:
+        """Translated text that remembers its key, so bound widgets can re-translate it."""
+        return Component(key, self.get(key, *args), args)
+
+    def _resolve(self, args):
+        return [self.component(a.key, *self._resolve(a.args)) if isinstance(a, Component) else a for a in args]
+
+    def bind_text(self, widget, key: str, *args, option: str = "text"):
+        """
+        Set a widget option to a translation and keep it translated across language changes.
+        Component arguments (see component()) are re-translated as well.
+        """
+        self._bound.setdefault(widget, {})[option] = (key, args)
+        text = self.get(key, *args)
+        widget.configure({option: text})
+        return text
+
+    def unbind_text(self, widget, option: str = "text"):
+        """Stop re-translating a widget option, e.g. before showing untranslated text in it."""
+        options = self._bound.get(widget)
+        if options:
+            options.pop(option, None)
+
+    def add_listener(self, callback):
+        """
+        Call `callback()` after every language change, e.g. to re-flow an alignment-dependent layout.
+        Bound methods are held weakly so closed windows don't stay alive.
+        """
+        if hasattr(callback, "__self__"):
+            callback = weakref.WeakMethod(callback)
+        else:
+            callback = (lambda cb: lambda: cb)(callback)
+        self._listeners.append(callback)
+
     def set_language(self, lang_code, ignore=False):
         self.lang_code = lang_code
         self.load_language(lang_code, ignore)
+        self._relabel()
+
+    def _relabel(self):
+        """Re-translate bound widgets, then let listeners update their layout, in one pass."""
+        for widget, options in list(self._bound.items()):
+            try:
+                widget.configure({
+                    option: self.get(key, *self._resolve(args))
+                    for option, (key, args) in options.items()
+                })
+            except Exception:
+                # Destroyed widget still referenced from Python
+                self._bound.pop(widget, None)
+
+        alive = []
+        for ref in self._listeners:
+            callback = ref()
+            if callback is not None:
+                callback()
+                alive.append(ref)
+        self._listeners = alive
 
     def get_available_languages(self):
-        langs = []
-        for filename in os.listdir(self.localization_dir):
-            if filename.endswith(".json"):
-                lang_code = filename[:-5]
-                path = os.path.join(self.localization_dir, filename)
-                try:
-                    with open(path, "r", encoding="utf-8") as file:
-                        data = json.load(file)
-                        name = data.get("name", lang_code)
-                        langs.append((lang_code, name))
-                except (json.JSONDecodeError, FileNotFoundError, PermissionError) as e:
-                    print(f"[Language] Skipping invalid language file: {path} ({e})")
-                    langs.append((lang_code, lang_code))
-        return langs
+        """
+        Return [(code, name), ...] from the language index.
+
+        Only the header ('name', 'alignment') of each file is read, and it is
+        re-read only when the file's mtime or size changes. With the asset
+        bundle, the packed index is used instead.
+        """
+        if self.bundle is not None and LANGUAGES_ENTRY in self.bundle:
+            return [(code, entry["name"]) for code, entry in self.bundle.load(LANGUAGES_ENTRY).items()]
+        return [(code, entry["name"]) for code, entry in get_language_index(self.localization_dir).items()]
 
     def get_language_name(self):
         return self.language_name
@@ -130,23 +199,115 @@ class Language:
         return self.alignment
 
 
-# Utility to check duplicate keys inside "translations"
+class DuplicateKeysError(ValueError):
+    def __init__(self, path, duplicates):
+        super().__init__(f"Duplicate keys in {path}: {duplicates}")
+        self.duplicates = duplicates
+
+
+# path -> (mtime_ns, size, value); shared by every Language instance
+_catalog_cache = {}
+_index_cache = {}
+_cache_lock = threading.Lock()
+
+
+def _file_signature(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _cached(cache, path, loader):
+    signature = _file_signature(path)
+    with _cache_lock:
+        entry = cache.get(path)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+
+    value = loader(path)
+    with _cache_lock:
+        cache[path] = (signature, value)
+    return value
+
+
+def _parse_catalog(path):
+    duplicates = []
+
+    def _pairs_hook(pairs):
+        obj = {}
+        for key, value in pairs:
+            if key in obj and key not in duplicates:
+                duplicates.append(key)
+            obj[key] = value
+        return obj
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f, object_pairs_hook=_pairs_hook)
+
+    if duplicates:
+        raise DuplicateKeysError(path, duplicates)
+    return data
+
+
+def load_catalog(path):
+    """
+    Parse a language file once, checking for duplicate keys during the parse.
+    The result is cached until the file's mtime or size changes.
+
+    :raises DuplicateKeysError: if any object in the file repeats a key
+    """
+    return _cached(_catalog_cache, path, _parse_catalog)
+
+
+def _read_header(path):
+    """Read 'name' and 'alignment' without parsing the translations that follow them."""
+    lang_code = os.path.splitext(os.path.basename(path))[0]
+    text = ""
+    with open(path, "r", encoding="utf-8") as f:
+        while True:
+            chunk = f.read(4096)
+            text += chunk
+            marker = text.find('"translations"')
+            if marker != -1 or not chunk:
+                break
+
+    data = None
+    if marker != -1:
+        try:
+            data = json.loads(text[:marker].rstrip().rstrip(",") + "}")
+        except json.JSONDecodeError:
+            data = None
+    if not isinstance(data, dict):
+        # Header keys after the translations, or an unusual layout: parse it all
+        data = load_catalog(path)
+
+    return {
+        "name": data.get("name", lang_code),
+        "alignment": TextAlignment.from_string(data.get("alignment", "ltr"))
+    }
+
+
+def get_language_index(localization_dir):
+    """
+    Return { code: {"name", "alignment"} } for every language file in the directory.
+    """
+    index = {}
+    for filename in sorted(os.listdir(localization_dir)):
+        if not filename.endswith(".json"):
+            continue
+        lang_code = filename[:-5]
+        path = os.path.join(localization_dir, filename)
+        try:
+            index[lang_code] = _cached(_index_cache, path, _read_header)
+        except (ValueError, OSError) as e:
+            print(f"[Language] Skipping invalid language file: {path} ({e})")
+            index[lang_code] = {"name": lang_code, "alignment": TextAlignment.LTR}
+    return index
+
+
+# Utility to check duplicate keys inside a language file
 def check_duplicate_keys(file_path):
-    with open(file_path, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-
-    keys = []
-    inside_translations = False
-    for line in lines:
-        stripped = line.strip()
-        if stripped.startswith('"translations"'):
-            inside_translations = True
-        elif inside_translations and stripped.startswith('}'):
-            break
-        elif inside_translations and ":" in stripped:
-            key_part = stripped.split(":", 1)[0].strip()
-            if key_part.startswith('"') and key_part.endswith('"'):
-                keys.append(key_part.strip('"'))
-
-    duplicates = [key for key, count in Counter(keys).items() if count > 1]
-    return duplicates
+    try:
+        _parse_catalog(file_path)
+    except DuplicateKeysError as e:
+        return e.duplicates
+    return []
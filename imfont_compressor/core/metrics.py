@@ -0,0 +1,95 @@
+import os
+import time
+from contextlib import contextmanager
+from imfont_compressor.core.utils import format_size
+
+
+def _cpu_time():
+    # CPU of the calling thread, so a compression on a worker isn't charged for
+    # the UI thread, plus finished child processes (the native tool). Windows
+    # doesn't report child CPU time.
+    times = os.times()
+    return time.thread_time() + times.children_user + times.children_system
+
+
+class StageTimer:
+    """
+    Wall-clock and CPU time of each stage of a compression.
+
+    `on_stage(name, event, record)` is called with event "start" (record None)
+    when a stage begins and "end" with its record when it finishes, including
+    when it fails. The hook runs on the compressing thread.
+    """
+
+    def __init__(self, on_stage=None):
+        self.on_stage = on_stage
+        self.stages = []  # [{"name", "wall_ms", "cpu_ms"}] in the order they ran
+
+    @contextmanager
+    def stage(self, name):
+        if self.on_stage:
+            self.on_stage(name, "start", None)
+        wall, cpu = time.perf_counter(), _cpu_time()
+        try:
+            yield
+        finally:
+            record = {
+                "name": name,
+                "wall_ms": round((time.perf_counter() - wall) * 1000.0, 3),
+                "cpu_ms": round((_cpu_time() - cpu) * 1000.0, 3)
+            }
+            self.stages.append(record)
+            if self.on_stage:
+                self.on_stage(name, "end", record)
+
+
+def build_metrics(timer, backend, input_size, compressed_size, output_text, cached=False, input_hash=None):
+    """
+    Metrics record of a finished compression.
+
+    :param backend: "python" (in-process encoders) or "native" (binary_to_compressed_c)
+    :param compressed_size: size of the stb stream, or None when it wasn't produced
+    :param cached: True if the stream came from the CompressionCache
+    :param input_hash: SHA-256 of the input when it was computed anyway (cache key)
+    """
+    metrics = {
+        "backend": backend,
+        "cached": cached,
+        "input_hash": input_hash,
+        "input_size": input_size,
+        "compressed_size": compressed_size,
+        "ratio": round(compressed_size / max(input_size, 1), 4) if compressed_size is not None else None,
+        "output_size": len(output_text.encode("utf-8")),
+        "lines": output_text.count("\n"),
+        "stages": list(timer.stages)
+    }
+    _update_totals(metrics)
+    return metrics
+
+
+def add_stages(metrics, stages):
+    """Append stages timed after run_compression returned, such as writing the output."""
+    metrics["stages"].extend(stages)
+    _update_totals(metrics)
+
+
+def _update_totals(metrics):
+    metrics["wall_ms"] = round(sum(s["wall_ms"] for s in metrics["stages"]), 3)
+    metrics["cpu_ms"] = round(sum(s["cpu_ms"] for s in metrics["stages"]), 3)
+
+
+def format_metrics(metrics):
+    """One-line summary for the status bar, e.g. '61.2 KB -> 30.4 KB (50%), 1,204 lines, 85 ms'."""
+    sizes = format_size(metrics["input_size"])
+    if metrics["ratio"] is not None:
+        sizes += f" -> {format_size(metrics['compressed_size'])} ({metrics['ratio']:.0%})"
+    return f"{sizes}, {metrics['lines']:,} lines, {metrics['wall_ms']:.0f} ms ({metrics['backend']})"
+
+
+def format_stages(metrics):
+    """Per-stage timing table, for the command line."""
+    lines = [f"{'Stage':<12}{'Wall':>12}{'CPU':>12}"]
+    for stage in metrics["stages"]:
+        lines.append(f"{stage['name']:<12}{stage['wall_ms']:>9.1f} ms{stage['cpu_ms']:>9.1f} ms")
+    lines.append(f"{'total':<12}{metrics['wall_ms']:>9.1f} ms{metrics['cpu_ms']:>9.1f} ms")
+    return "\n".join(lines)
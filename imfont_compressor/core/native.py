@@ -0,0 +1,190 @@
+"""
+Client for `binary_to_compressed_c -server`.
+
+The tool reads length-prefixed requests on stdin and writes framed
+responses on stdout (the protocol is described above run_server in
+data/binary_to_compressed_c.cpp), so one process compresses any number of
+fonts. NativeServerPool keeps a few of them alive and spreads jobs across
+them, saving a process start per font.
+"""
+import os
+import queue
+import struct
+import subprocess
+import threading
+from imfont_compressor.core.utils import get_resource_path
+
+NATIVE_POOL_SIZE = 2
+
+_ENCODINGS = {"-u8": 0, "-u32": 1, "-base85": 2}
+_FLAG_COMPRESS = 1
+_FLAG_STATIC = 2
+_FLAG_INLINE = 4
+_LENGTH = struct.Struct("<I")
+_STATUS_OK = 0
+
+
+class NativeError(Exception):
+    """The tool reported an error for a request, or the process failed."""
+
+
+def encode_request(encoding, symbol_name, use_compression=True, use_static=True, path=None, data=None, name=None):
+    """
+    One request frame: a font path, or inline `data` printed as `name`.
+    """
+    flags = (_FLAG_COMPRESS if use_compression else 0) | (_FLAG_STATIC if use_static else 0)
+    if data is not None:
+        flags |= _FLAG_INLINE
+        name = name or "data"
+    else:
+        name = path
+    symbol = symbol_name.encode("utf-8")
+    name = os.fsencode(name)
+    body = b"".join((
+        bytes((_ENCODINGS[encoding], flags)),
+        struct.pack("<H", len(symbol)), symbol,
+        struct.pack("<H", len(name)), name,
+        bytes(data) if data is not None else b""
+    ))
+    return _LENGTH.pack(len(body)) + body
+
+
+class NativeServer:
+    """One `binary_to_compressed_c -server` process. Not thread-safe: see NativeServerPool."""
+
+    def __init__(self, exe_path=None):
+        self.exe_path = exe_path or get_resource_path("data", "binary_to_compressed_c.exe")
+        self.process = None
+        self.requests = 0
+
+    def start(self):
+        self.process = subprocess.Popen([self.exe_path, "-server"], stdin=subprocess.PIPE,
+                                        stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=0)
+        return self
+
+    @property
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def _read(self, size):
+        chunks = []
+        while size:
+            chunk = self.process.stdout.read(size)
+            if not chunk:
+                raise EOFError
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+    def compress(self, encoding, symbol_name, use_compression=True, use_static=True, path=None, data=None,
+                 name=None):
+        """
+        Run one request; the arguments are those of encode_request.
+
+        :return: the generated source
+        :raises NativeError: when the tool reports an error, or exits
+        """
+        if not self.alive:
+            if self.process is not None:
+                self.close()
+            try:
+                self.start()
+            except OSError as e:
+                raise NativeError(f"Failed to start the compressor: {e}")
+        frame = encode_request(encoding, symbol_name, use_compression, use_static, path, data, name)
+        try:
+            self.process.stdin.write(frame)
+            length, = _LENGTH.unpack(self._read(_LENGTH.size))
+            response = self._read(length)
+        except (OSError, EOFError):
+            stderr = self._fail()
+            raise NativeError("The compressor exited; it may be a build without -server." +
+                              (f" ({stderr})" if stderr else ""))
+        self.requests += 1
+
+        # The tool writes "\n" line endings in server mode, like text mode output read by Python
+        text = response[1:].decode("utf-8", "replace")
+        if response[0] != _STATUS_OK:
+            raise NativeError(text)
+        return text
+
+    def _fail(self):
+        """Stop a process that broke the protocol. :return: what it wrote to stderr"""
+        self.process.kill()
+        self.process.wait()
+        stderr = self.process.stderr.read().decode("utf-8", "replace").strip()
+        self._close_streams()
+        return stderr
+
+    def _close_streams(self):
+        for stream in (self.process.stdin, self.process.stdout, self.process.stderr):
+            try:
+                stream.close()
+            except OSError:
+                pass
+        self.process = None
+
+    def close(self):
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()  # the server exits at the end of its input
+            self.process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self.process.kill()
+            self.process.wait()
+        self._close_streams()
+
+
+class NativeServerPool:
+    """
+    Up to `size` NativeServer processes, started on first use and kept
+    alive between jobs. compress() takes an idle process, or waits for
+    one, so jobs from several threads run in parallel. A process that
+    fails is replaced on its next job.
+    """
+
+    def __init__(self, size=NATIVE_POOL_SIZE, exe_path=None):
+        self.size = size
+        self.exe_path = exe_path
+        self._idle = queue.LifoQueue()  # the most recently used process has warm caches
+        self._started = 0
+        self._lock = threading.Lock()
+        self._servers = []
+        self._closed = False
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._closed:
+                raise NativeError("The compressor pool is closed.")
+            if self._started < self.size:
+                self._started += 1
+                server = NativeServer(self.exe_path)
+                self._servers.append(server)
+                return server
+        return self._idle.get()
+
+    def compress(self, *args, **kwargs):
+        """NativeServer.compress on a pooled process."""
+        server = self._acquire()
+        try:
+            return server.compress(*args, **kwargs)
+        finally:
+            self._idle.put(server)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            servers = list(self._servers)
+        for server in servers:
+            server.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,215 @@
+import os
+import glob
+import tempfile
+import threading
+from bisect import bisect_left
+
+PAGE_SIZE = 64 * 1024
+SEARCH_CHUNK = 1024 * 1024
+
+
+class OutputDocument:
+    """
+    Line-addressable view of a large text file, read from disk a page at a time.
+
+    index() makes one pass over the file counting newlines per 64 KB page;
+    nothing else is kept in memory. A line is found by bisecting the page
+    counts and scanning a single page, so reading the lines shown on screen
+    costs a page or two of I/O regardless of the file size.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.size = 0
+        self.newlines = 0
+        self._page_lines = []  # newlines before the start of each page
+        self._ends_with_newline = False
+
+    def index(self):
+        """Count lines page by page. Run it off the UI thread for large files. :return: self"""
+        page_lines = []
+        newlines = 0
+        size = 0
+        last = b""
+        with open(self.path, "rb") as f:
+            while True:
+                page = f.read(PAGE_SIZE)
+                if not page:
+                    break
+                page_lines.append(newlines)
+                newlines += page.count(b"\n")
+                size += len(page)
+                last = page[-1:]
+
+        self.size = size
+        self.newlines = newlines
+        self._page_lines = page_lines
+        self._ends_with_newline = last == b"\n"
+        return self
+
+    @property
+    def line_count(self):
+        if not self.size:
+            return 0
+        return self.newlines + (0 if self._ends_with_newline else 1)
+
+    def summary(self):
+        return {"size": self.size, "line_count": self.line_count}
+
+    def _read(self, offset, size):
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return f.read(size)
+
+    def line_offset(self, line):
+        """Byte offset of the start of a 0-based line; the end of the file past the last line."""
+        if line >= self.line_count:
+            return self.size
+        if line <= 0:
+            return 0
+
+        # The page holding the line-th newline
+        page = bisect_left(self._page_lines, line) - 1
+        data = self._read(page * PAGE_SIZE, PAGE_SIZE)
+        pos = -1
+        for _ in range(line - self._page_lines[page]):
+            pos = data.find(b"\n", pos + 1)
+        return page * PAGE_SIZE + pos + 1
+
+    def line_at(self, offset):
+        """0-based line containing a byte offset."""
+        page = min(offset // PAGE_SIZE, len(self._page_lines) - 1)
+        if page < 0:
+            return 0
+        start = page * PAGE_SIZE
+        return self._page_lines[page] + self._read(start, offset - start).count(b"\n")
+
+    def read_lines(self, first, count):
+        """Return up to `count` lines starting at line `first`, without line endings."""
+        count = min(count, self.line_count - first)
+        if count <= 0:
+            return []
+
+        offset = self.line_offset(first)
+        chunks = []
+        found = 0
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            while found < count:
+                chunk = f.read(PAGE_SIZE)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                found += chunk.count(b"\n")
+
+        lines = b"".join(chunks).split(b"\n")[:count]
+        return [line.decode("utf-8", errors="replace").rstrip("\r") for line in lines]
+
+    def find(self, text, start_line=0, backwards=False, match_case=False):
+        """
+        Find `text` from the start of `start_line` onwards, or before it when searching backwards.
+        Case-insensitive matching folds ASCII letters only, which covers generated source.
+
+        :return: 0-based line of the match, or None
+        """
+        needle = text.encode("utf-8")
+        if not needle:
+            return None
+        if not match_case:
+            needle = needle.lower()
+        keep = len(needle) - 1
+        start = self.line_offset(start_line)
+
+        with open(self.path, "rb") as f:
+            if not backwards:
+                offset = start
+                while offset < self.size:
+                    f.seek(offset)
+                    data = f.read(SEARCH_CHUNK + keep)
+                    hit = (data if match_case else data.lower()).find(needle)
+                    if hit != -1:
+                        return self.line_at(offset + hit)
+                    offset += SEARCH_CHUNK
+            else:
+                end = start
+                while end > 0:
+                    offset = max(0, end - SEARCH_CHUNK)
+                    f.seek(offset)
+                    data = f.read(end - offset + keep)
+                    hit = (data if match_case else data.lower()).rfind(needle)
+                    # Only matches starting before `end`; later ones were in the previous window
+                    if hit != -1 and offset + hit < end:
+                        return self.line_at(offset + hit)
+                    end = offset
+        return None
+
+
+def get_spool_path(name):
+    """
+    Temporary file an output is written to for the preview. Each output gets
+    its own file so a document being displayed is never rewritten under it.
+    """
+    return os.path.join(tempfile.gettempdir(), f"imfont_compressor_{os.getpid()}_{name}.out")
+
+
+def write_spool(text, path):
+    """Write output text to a spool file atomically. :return: the path"""
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8", newline="") as f:
+        f.write(text)
+    os.replace(temp_path, path)
+    return path
+
+
+def remove_spool(path=None):
+    """Delete a spool file, or every spool file of this process."""
+    paths = [path] if path else glob.glob(get_spool_path("*"))
+    for spool_path in paths:
+        try:
+            os.remove(spool_path)
+        except OSError:
+            pass
+
+
+def save_output(destination, source_path=None, text=None, progress=None, chunk_size=1024 * 1024):
+    """
+    Write an output to `destination` atomically (temporary file + rename).
+
+    Copies from the spool file when there is one, so the text isn't encoded
+    again; otherwise writes `text` in slices.
+
+    :param progress: optional callable(fraction) called after every chunk
+    :return: destination
+    """
+    # Unique per process and thread, so saves to the same destination don't share it
+    temp_path = f"{destination}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        if source_path is not None:
+            total = max(1, os.path.getsize(source_path))
+            done = 0
+            with open(source_path, "rb") as src, open(temp_path, "wb") as dst:
+                while True:
+                    chunk = src.read(chunk_size)
+                    if not chunk:
+                        break
+                    dst.write(chunk)
+                    done += len(chunk)
+                    if progress:
+                        progress(done / total)
+        else:
+            total = max(1, len(text))
+            with open(temp_path, "w", encoding="utf-8", newline="") as dst:
+                for start in range(0, len(text), chunk_size):
+                    dst.write(text[start:start + chunk_size])
+                    if progress:
+                        progress(min(1.0, (start + chunk_size) / total))
+        os.replace(temp_path, destination)
+    except BaseException:
+        remove_spool(temp_path)
+        raise
+    return destination
+
+
+def include_snippet(path):
+    """C/C++ line that pulls a saved output into another file."""
+    return f'#include "{path.replace(os.sep, "/")}"'
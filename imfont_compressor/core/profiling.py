@@ -0,0 +1,120 @@
+import cProfile
+import io
+import os
+import pstats
+import time
+import tracemalloc
+
+PROFILE_TOP = 25          # functions and allocation sites listed in the summary
+TRACEMALLOC_FRAMES = 5    # stack depth kept for each allocation
+
+
+class JobProfiler:
+    """
+    cProfile and tracemalloc reports for one compression job.
+
+    The job runs twice: under cProfile, then under tracemalloc. Tracing every
+    allocation slows the pure Python compressor down twenty-fold or more,
+    which would bury the cProfile timings, so the two don't share a run. The
+    first run's result is the one returned.
+
+    During the tracemalloc run the job's stages report through `on_stage`:
+    the peak traced memory of every stage is recorded, and a snapshot is
+    kept at the end of the stage holding the most memory, for the largest
+    allocation sites.
+    """
+
+    def __init__(self, top=PROFILE_TOP):
+        self.top = top
+        self.profiler = cProfile.Profile()
+        self.stage_peaks = []  # [(stage, peak bytes)]
+        self.peak = 0
+        self.snapshot = None
+        self.snapshot_stage = None
+        self._snapshot_size = -1
+        self.elapsed = 0.0
+        self.memory_elapsed = 0.0
+
+    def _on_stage(self, name, event, record):
+        if event == "start":
+            tracemalloc.reset_peak()
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        self.stage_peaks.append((name, peak))
+        self.peak = max(self.peak, peak)
+        if current > self._snapshot_size:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.snapshot_stage = name
+            self._snapshot_size = current
+
+    def run(self, job):
+        """
+        Profile `job`, a callable(on_stage, memory_pass) running the compression with
+        that stage hook; memory_pass is True for the tracemalloc run, whose output
+        is discarded.
+
+        :return: the job's result from the cProfile run
+        """
+        start = time.perf_counter()
+        self.profiler.enable()
+        try:
+            result = job(None, False)
+        finally:
+            self.profiler.disable()
+            self.elapsed = time.perf_counter() - start
+
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+        start = time.perf_counter()
+        try:
+            job(self._on_stage, True)
+        finally:
+            self.memory_elapsed = time.perf_counter() - start
+            self.peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        return result
+
+    def format_report(self, title):
+        lines = [f"Profile of {title}",
+                 f"Wall time under cProfile: {self.elapsed * 1000:.0f} ms "
+                 f"(under tracemalloc: {self.memory_elapsed * 1000:.0f} ms)",
+                 f"Peak traced memory: {self.peak / 1024 / 1024:.2f} MB", ""]
+
+        if self.stage_peaks:
+            lines.append("Peak traced memory by stage")
+            for name, peak in self.stage_peaks:
+                lines.append(f"  {name:<12}{peak / 1024 / 1024:>9.2f} MB")
+            lines.append("")
+
+        for sort_key, heading in (("cumulative", "cumulative time"), ("tottime", "own time")):
+            stream = io.StringIO()
+            stats = pstats.Stats(self.profiler, stream=stream)
+            stats.strip_dirs().sort_stats(sort_key).print_stats(self.top)
+            lines.append(f"Top {self.top} functions by {heading}")
+            lines.append(stream.getvalue().strip())
+            lines.append("")
+
+        if self.snapshot is not None:
+            lines.append(f"Largest allocation sites (live at the end of '{self.snapshot_stage}')")
+            snapshot = self.snapshot.filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+            ))
+            for stat in snapshot.statistics("traceback")[:self.top]:
+                frame = stat.traceback[-1]
+                lines.append(f"  {stat.size / 1024:>10.1f} KB in {stat.count:>6} blocks  "
+                             f"{os.path.basename(frame.filename)}:{frame.lineno}")
+                for caller in list(stat.traceback)[-4:-1][::-1]:
+                    lines.append(f"{'':>36}<- {os.path.basename(caller.filename)}:{caller.lineno}")
+        return "\n".join(lines) + "\n"
+
+    def save(self, output_path, title):
+        """
+        Write <output>.prof (pstats, for snakeviz or `python -m pstats`) and
+        <output>.profile.txt (summary). :return: (stats path, summary path)
+        """
+        stats_path = output_path + ".prof"
+        summary_path = output_path + ".profile.txt"
+        self.profiler.dump_stats(stats_path)
+        with open(summary_path, "w", encoding="utf-8") as f:
+            f.write(self.format_report(title))
+        return stats_path, summary_path
@@ -0,0 +1,608 @@
+"""
+Compression daemon: a warm worker pool behind a local HTTP/JSON API.
+
+    POST /jobs                 {"path": "...", "params": {...}, "output": "..."}  -> 202 job
+    POST /jobs?name=F.ttf&...  font bytes (application/octet-stream)              -> 202 job
+    GET  /jobs/<id>[?wait=S]   job status, long-polled for up to S seconds
+    GET  /jobs/<id>/events     status changes as JSON lines until the job finishes
+    GET  /jobs/<id>/output     the generated source, 410 once it was dropped
+    GET  /status               queue depth, throughput, latencies, cache
+
+`params` takes the run_compression keys (symbol_name, encoding such as
+"-base85" or "auto:load", disable_compression, no_static, header_output)
+plus in_process; an upload passes them in the query string. A full queue
+answers 503 with Retry-After. Sources of finished jobs are kept up to
+JOB_OUTPUT_BYTES in all, the oldest dropped first.
+"""
+import hashlib
+import json
+import math
+import os
+import queue
+import shutil
+import signal
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from imfont_compressor.core.encoders import ENCODERS
+
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 8765
+SERVER_QUEUE = 64                       # jobs waiting for a worker before submissions are refused
+RESULT_CACHE_BYTES = 256 * 1024 * 1024  # generated sources kept for repeated jobs
+MAX_UPLOAD_BYTES = 64 * 1024 * 1024
+MAX_JOBS = 1000                         # finished jobs kept for status and output requests
+JOB_OUTPUT_BYTES = 256 * 1024 * 1024    # sources of finished jobs kept for /jobs/<id>/output
+THROUGHPUT_WINDOW = 60.0                # seconds of finished jobs behind the throughput figures
+MAX_WAIT = 60.0                         # longest ?wait= long poll
+
+DEFAULT_PARAMS = {
+    "symbol_name": "",
+    "encoding": "-u8",
+    "disable_compression": False,
+    "no_static": False,
+    "header_output": False
+}
+FLAG_PARAMS = ("disable_compression", "no_static", "header_output", "in_process")
+
+
+class QueueFull(Exception):
+    """The job queue is at capacity; `retry_after` is a suggested wait in seconds."""
+
+    def __init__(self, retry_after):
+        super().__init__("Job queue is full.")
+        self.retry_after = retry_after
+
+
+def parse_params(values):
+    """
+    Validate job parameters from a JSON object or a query string.
+
+    :return: (run_compression params without font_path, in_process or None for the server default)
+    :raises ValueError: on unknown keys or values
+    """
+    unknown = set(values) - set(DEFAULT_PARAMS) - {"in_process"}
+    if unknown:
+        raise ValueError(f"Unknown parameter(s): {', '.join(sorted(unknown))}")
+
+    params = dict(DEFAULT_PARAMS)
+    params.update({k: v for k, v in values.items() if k in DEFAULT_PARAMS or k == "in_process"})
+    for key in FLAG_PARAMS:
+        value = params.get(key)
+        if isinstance(value, str):
+            value = value.lower() in ("1", "true", "yes", "on")
+        params[key] = bool(value)
+    if not isinstance(params["symbol_name"], str):
+        raise ValueError("symbol_name must be a string.")
+
+    encoding = params["encoding"]
+    if not isinstance(encoding, str) or (encoding not in ENCODERS and encoding.partition(":")[0] != "auto"):
+        raise ValueError(f"Unknown encoding: {encoding!r}")
+    in_process = params.pop("in_process")
+    return params, in_process if "in_process" in values else None
+
+
+# Worker processes keep their own stream cache, so a font re-encoded with other
+# options skips compression when it lands on the same worker.
+_worker_cache = None
+
+
+def _worker_init():
+    global _worker_cache
+    # Ctrl+C reaches the whole process group; the server shuts the pool down itself
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    from imfont_compressor.core.cache import CompressionCache
+    _worker_cache = CompressionCache()
+
+
+def _worker_ready():
+    return os.getpid()
+
+
+def _worker_run(params, in_process):
+    from imfont_compressor.core.compressor import run_compression
+    return run_compression(params, None, _worker_cache, in_process=in_process)
+
+
+class Job:
+    def __init__(self, params, in_process, output=None):
+        self.id = uuid.uuid4().hex[:12]
+        self.params = params
+        self.in_process = in_process
+        self.output = output          # path the server writes the source to, if requested
+        self.status = "queued"
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self.result = None            # run_compression result without the source
+        self.output_text = None       # the source, until dropped by JobServer._evict_jobs
+        self.cached = False           # served from the result cache
+        self.error = None
+        self.version = 0              # bumped on every status change, for /events
+
+    @property
+    def done(self):
+        return self.status in ("done", "failed")
+
+    def to_dict(self):
+        info = {
+            "id": self.id,
+            "status": self.status,
+            "font": os.path.basename(self.params["font_path"]),
+            "submitted": round(self.submitted, 3),
+            "queue_ms": round(((self.started or time.time()) - self.submitted) * 1000.0, 3),
+        }
+        if self.started is not None:
+            info["run_ms"] = round(((self.finished or time.time()) - self.started) * 1000.0, 3)
+        if self.status == "failed":
+            info["error"] = self.error
+        if self.status == "done":
+            info["cached"] = self.cached
+            info["metrics"] = self.result.get("metrics")
+            if "auto" in self.result:
+                info["auto"] = {k: v for k, v in self.result["auto"].items() if k != "candidates"}
+            if self.output_text is not None:
+                info["output_url"] = f"/jobs/{self.id}/output"
+            else:
+                info["output_expired"] = True
+            if self.output:
+                info["output_file"] = self.output
+        return info
+
+
+class ResultCache:
+    """LRU of finished results keyed by input hash and options, bounded by output size."""
+
+    def __init__(self, max_bytes=RESULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (result, size)
+        self._pending = {}             # key -> Future of a job computing it
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(params, in_process):
+        digest = hashlib.sha256()
+        with open(params["font_path"], "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        # The font's path appears in the generated source
+        options = (params["font_path"], params["symbol_name"], params["encoding"],
+                   params["disable_compression"], params["no_static"], params["header_output"], in_process)
+        return digest.hexdigest(), options
+
+    def claim(self, key):
+        """
+        :return: (result, None) on a hit, (None, Future) when another job is
+                 computing it, or (None, None) when the caller should compute it
+                 and then call put() or release()
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0], None
+            future = self._pending.get(key)
+            if future is not None:
+                self.hits += 1
+                return None, future
+            self.misses += 1
+            self._pending[key] = Future()
+            return None, None
+
+    def put(self, key, result):
+        size = len(result["output_text"])
+        with self._lock:
+            if size <= self.max_bytes:
+                self._entries[key] = (result, size)
+                self.size += size
+                while self.size > self.max_bytes:
+                    _, (_, evicted) = self._entries.popitem(last=False)
+                    self.size -= evicted
+            future = self._pending.pop(key, None)
+        if future is not None:
+            future.set_result(result)
+
+    def release(self, key, error):
+        with self._lock:
+            future = self._pending.pop(key, None)
+        if future is not None:
+            future.set_exception(error)
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self.size, "max_bytes": self.max_bytes,
+                    "hits": self.hits, "misses": self.misses}
+
+
+class JobServer:
+    """
+    Bounded job queue in front of a pool of warm worker processes.
+
+    `workers` dispatcher threads take jobs off the queue, answer repeated
+    jobs from the ResultCache and run the rest with run_compression in the
+    process pool (identical jobs in flight share one run). submit() raises
+    QueueFull instead of queueing more than `queue_size` jobs.
+    """
+
+    def __init__(self, workers=None, queue_size=SERVER_QUEUE, cache_bytes=RESULT_CACHE_BYTES,
+                 in_process=False, output_bytes=JOB_OUTPUT_BYTES):
+        self.workers = workers or os.cpu_count() or 1
+        self.in_process = in_process
+        self.cache = ResultCache(cache_bytes)
+        self.output_bytes = output_bytes
+        self._output_size = 0  # length of the sources held by finished jobs
+        self.started = time.time()
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._jobs = OrderedDict()
+        self._changed = threading.Condition()
+        self._running = 0
+        self._counts = {"submitted": 0, "completed": 0, "failed": 0, "rejected": 0}
+        self._recent = deque()  # (finished, input bytes, queue ms, run ms) within THROUGHPUT_WINDOW
+        self._upload_root = tempfile.mkdtemp(prefix="imfont_server_")
+
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_worker_init)
+        self._threads = [threading.Thread(target=self._dispatch, name=f"JobDispatcher-{i}", daemon=True)
+                         for i in range(self.workers)]
+
+    def start(self):
+        # Start every worker now, so the first jobs don't pay for process startup and imports
+        for future in [self._executor.submit(_worker_ready) for _ in range(self.workers)]:
+            future.result()
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def close(self):
+        # Dispatchers are daemon threads: they stop with the process, whatever they wait on
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        shutil.rmtree(self._upload_root, ignore_errors=True)
+
+    def _retry_after(self):
+        with self._changed:
+            run_times = [r[3] for r in self._recent]
+        average_s = sum(run_times) / len(run_times) / 1000.0 if run_times else 1.0
+        return max(1, math.ceil(self._queue.qsize() * average_s / self.workers))
+
+    def submit(self, params, in_process=None, output=None, data=None, name=None):
+        """
+        Queue a job for the font at params["font_path"], or for uploaded `data`
+        saved as `name`.
+
+        :return: the Job
+        :raises QueueFull: when the queue is at capacity
+        """
+        if data is not None:
+            params = dict(params, font_path=self._save_upload(data, name))
+
+        job = Job(params, self.in_process if in_process is None else in_process, output)
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            with self._changed:
+                self._counts["rejected"] += 1
+            raise QueueFull(self._retry_after())
+
+        with self._changed:
+            self._jobs[job.id] = job
+            self._counts["submitted"] += 1
+            self._evict_jobs()
+        return job
+
+    def _save_upload(self, data, name):
+        # Uploads are stored by content until the server stops, so the same
+        # font uploaded again has the same path and its result is cached
+        directory = os.path.join(self._upload_root, hashlib.sha256(data).hexdigest()[:32])
+        path = os.path.join(directory, os.path.basename(name or "") or "font.ttf")
+        if not os.path.isfile(path):
+            os.makedirs(directory, exist_ok=True)
+            temp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        return path
+
+    def _evict_jobs(self):
+        excess = len(self._jobs) - MAX_JOBS
+        if excess > 0:
+            for job_id in [job_id for job_id, job in self._jobs.items() if job.done][:excess]:
+                self._drop_output(self._jobs.pop(job_id))
+
+        # Then the sources of the oldest jobs, keeping their status
+        if self._output_size > self.output_bytes:
+            for job in self._jobs.values():
+                if self._output_size <= self.output_bytes:
+                    break
+                self._drop_output(job)
+
+    def _drop_output(self, job):
+        if job.output_text is not None:
+            self._output_size -= len(job.output_text)
+            job.output_text = None
+
+    def get(self, job_id):
+        with self._changed:
+            return self._jobs.get(job_id)
+
+    def _set_status(self, job, status, **fields):
+        with self._changed:
+            job.status = status
+            for key, value in fields.items():
+                setattr(job, key, value)
+            job.version += 1
+            self._changed.notify_all()
+
+    def wait(self, job, version, timeout):
+        """
+        Block for up to `timeout` seconds until `job` changes past `version`
+        (until it finishes when version is None).
+
+        :return: (version, status dict)
+        """
+        deadline = time.monotonic() + timeout
+        with self._changed:
+            while not job.done and (version is None or job.version <= version):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._changed.wait(remaining)
+            return job.version, job.to_dict()
+
+    def _dispatch(self):
+        while True:
+            job = self._queue.get()
+            with self._changed:
+                self._running += 1
+            self._set_status(job, "running", started=time.time())
+            try:
+                result, cached = self._run(job)
+                if not result["success"]:
+                    raise RuntimeError(result["error"])
+                if job.output:
+                    from imfont_compressor.core.preview import save_output
+                    save_output(job.output, text=result["output_text"])
+                # The result may be shared with the cache: the job keeps the source apart
+                self._finish(job, "done", result={k: v for k, v in result.items() if k != "output_text"},
+                             output_text=result["output_text"], cached=cached)
+            except Exception as e:
+                self._finish(job, "failed", error=str(e))
+
+    def _run(self, job):
+        if not os.path.isfile(job.params["font_path"]):
+            return {"success": False, "error": "Font file not found."}, False
+
+        key = ResultCache.key_for(job.params, job.in_process)
+        result, pending = self.cache.claim(key)
+        if result is not None:
+            return result, True
+        if pending is not None:
+            return pending.result(), True
+
+        try:
+            result = self._executor.submit(_worker_run, job.params, job.in_process).result()
+        except BaseException as e:
+            self.cache.release(key, e)
+            raise
+        if result["success"]:
+            self.cache.put(key, result)
+        else:
+            self.cache.release(key, RuntimeError(result["error"]))
+        return result, False
+
+    def _finish(self, job, status, **fields):
+        now = time.time()
+        self._set_status(job, status, finished=now, **fields)
+        with self._changed:
+            self._running -= 1
+            self._counts["completed" if status == "done" else "failed"] += 1
+            if job.output_text is not None:
+                self._output_size += len(job.output_text)
+            input_size = ((job.result or {}).get("metrics") or {}).get("input_size") or 0
+            self._recent.append((now, input_size, (job.started - job.submitted) * 1000.0,
+                                 (now - job.started) * 1000.0))
+            self._evict_jobs()
+
+    def status(self):
+        now = time.time()
+        with self._changed:
+            while self._recent and self._recent[0][0] < now - THROUGHPUT_WINDOW:
+                self._recent.popleft()
+            recent = list(self._recent)
+            running = self._running
+            counts = dict(self._counts)
+            output_size = self._output_size
+
+        window = min(THROUGHPUT_WINDOW, max(now - self.started, 1e-3))
+        queue_times = sorted(r[2] for r in recent)
+        run_times = sorted(r[3] for r in recent)
+
+        def percentiles(values):
+            if not values:
+                return None
+            return {"p50": round(values[max(0, math.ceil(0.5 * len(values)) - 1)], 3),
+                    "p90": round(values[max(0, math.ceil(0.9 * len(values)) - 1)], 3),
+                    "max": round(values[-1], 3)}
+
+        return {
+            "uptime_s": round(now - self.started, 3),
+            "workers": self.workers,
+            "queue_depth": self._queue.qsize(),
+            "queue_capacity": self._queue.maxsize,
+            "running": running,
+            "jobs": counts,
+            "throughput": {
+                "window_s": round(window, 3),
+                "jobs_per_s": round(len(recent) / window, 3),
+                "input_bytes_per_s": round(sum(r[1] for r in recent) / window, 1)
+            },
+            "queue_ms": percentiles(queue_times),
+            "run_ms": percentiles(run_times),
+            "result_cache": self.cache.stats(),
+            "job_outputs": {"bytes": output_size, "max_bytes": self.output_bytes}
+        }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "ImFontCompressor"
+    jobs = None  # the JobServer, set by make_server
+
+    def log_message(self, format, *args):
+        pass  # one line per request would drown the console of a busy build
+
+    def _send_json(self, code, body, headers=None):
+        data = json.dumps(body, indent=2).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _error(self, code, message, headers=None):
+        self._send_json(code, {"error": message}, headers)
+
+    def _job(self, job_id):
+        job = self.jobs.get(job_id)
+        if job is None:
+            self._error(404, f"No job {job_id}.")
+        return job
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != "/jobs":
+            return self._error(404, "Not found.")
+
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_UPLOAD_BYTES:
+            return self._error(413, f"Request larger than {MAX_UPLOAD_BYTES} bytes.")
+        body = self.rfile.read(length)
+
+        try:
+            if self.headers.get_content_type() == "application/json":
+                request = json.loads(body or b"{}")
+                if not isinstance(request, dict):
+                    raise ValueError("The JSON body must be an object.")
+                if not isinstance(request.get("path"), str):
+                    raise ValueError("'path' to a font file is required.")
+                if not isinstance(request.get("params") or {}, dict):
+                    raise ValueError("'params' must be an object.")
+                params, in_process = parse_params(request.get("params") or {})
+                params["font_path"] = os.path.abspath(request["path"])
+                job = self.jobs.submit(params, in_process, request.get("output"))
+            else:
+                query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+                name = query.pop("name", None)
+                if not body:
+                    raise ValueError("Upload the font bytes, or post JSON with a 'path'.")
+                params, in_process = parse_params(query)
+                job = self.jobs.submit(params, in_process, data=body, name=name)
+        except QueueFull as e:
+            return self._error(503, str(e), {"Retry-After": str(e.retry_after)})
+        except ValueError as e:
+            return self._error(400, str(e))
+
+        self._send_json(202, job.to_dict(), {"Location": f"/jobs/{job.id}"})
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        parts = [part for part in url.path.split("/") if part]
+
+        if parts == ["status"]:
+            return self._send_json(200, self.jobs.status())
+        if len(parts) < 2 or parts[0] != "jobs" or len(parts) > 3:
+            return self._error(404, "Not found.")
+        job = self._job(parts[1])
+        if job is None:
+            return
+
+        if len(parts) == 2:
+            try:
+                wait = min(float(parse_qs(url.query).get("wait", ["0"])[-1]), MAX_WAIT)
+            except ValueError:
+                return self._error(400, "'wait' must be a number of seconds.")
+            _, info = self.jobs.wait(job, None, max(wait, 0))
+            return self._send_json(200, info)
+
+        if parts[2] == "events":
+            return self._stream_events(job)
+        if parts[2] == "output":
+            if job.status != "done":
+                return self._error(409, f"Job is {job.status}.")
+            text = job.output_text
+            if text is None:
+                return self._error(410, "The output was dropped to bound the server's memory; submit the job again.")
+            data = text.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.send_header("Content-Disposition",
+                             f'attachment; filename="{os.path.basename(job.result["output_file"])}"')
+            self.end_headers()
+            self.wfile.write(data)
+            return
+        self._error(404, "Not found.")
+
+    def _stream_events(self, job):
+        # One JSON line per status change; the response ends when the job does
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        version = -1
+        try:
+            while True:
+                version, info = self.jobs.wait(job, version, MAX_WAIT)
+                self.wfile.write((json.dumps(info) + "\n").encode("utf-8"))
+                self.wfile.flush()
+                if info["status"] in ("done", "failed"):
+                    return
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    # A build submitting its fonts at once shouldn't overflow the listen backlog (5)
+    request_queue_size = 128
+
+
+def make_server(jobs, host=SERVER_HOST, port=SERVER_PORT):
+    """HTTP server for a started JobServer; port 0 picks a free port (see server_address)."""
+    handler = type("JobHandler", (_Handler,), {"jobs": jobs})
+    httpd = _HTTPServer((host, port), handler)
+    httpd.daemon_threads = True
+    return httpd
+
+
+def serve(host=SERVER_HOST, port=SERVER_PORT, workers=None, queue_size=SERVER_QUEUE,
+          cache_bytes=RESULT_CACHE_BYTES, in_process=False, on_ready=None):
+    """
+    Run the daemon until Ctrl+C or SIGTERM. `on_ready(url)` is called once it
+    accepts requests.
+    """
+    def _terminate(*_):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, _terminate)
+    jobs = JobServer(workers, queue_size, cache_bytes, in_process).start()
+    httpd = make_server(jobs, host, port)
+    try:
+        if on_ready:
+            on_ready(f"http://{httpd.server_address[0]}:{httpd.server_address[1]}")
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+        jobs.close()
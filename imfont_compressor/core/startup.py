@@ -0,0 +1,39 @@
+import time
+from contextlib import contextmanager
+
+
+class StartupProfile:
+    """
+    Wall-clock time of each GUI startup phase.
+
+    Phases are always recorded (it costs a couple of perf_counter calls);
+    the breakdown is printed only when `enabled` (--profile-startup).
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.start = time.perf_counter()
+        self.phases = []  # [(name, milliseconds)] in the order they ran
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, (time.perf_counter() - start) * 1000.0))
+
+    def total_ms(self):
+        return (time.perf_counter() - self.start) * 1000.0
+
+    def format_report(self):
+        total = self.total_ms()
+        lines = ["Startup profile:"]
+        for name, ms in self.phases:
+            lines.append(f"  {name:<16}{ms:8.1f} ms  {ms / total:6.1%}")
+        lines.append(f"  {'total':<16}{total:8.1f} ms")
+        return "\n".join(lines)
+
+    def report(self):
+        if self.enabled:
+            print(self.format_report(), flush=True)
@@ -0,0 +1,255 @@
+"""
+Pure Python port of stb_compress / stb_decompress (stb.h), as used by
+data/binary_to_compressed_c.cpp and Dear ImGui's compressed font loader.
+
+The compressor is byte-for-byte compatible with the native tool, so the
+output of this module can be fed to the same encoders and decoded by
+ImGui's AddFontFromMemoryCompressedTTF().
+"""
+import struct
+import zlib
+
+STB_WINDOW = 0x40000  # 256K
+STB_HASH_SIZE = 32768
+STB_HEADER_SIZE = 16
+STB_SIGNATURE = 0x57BC0000
+
+_MASK32 = 0xFFFFFFFF
+
+
+def stb_adler32(data, adler32=1):
+    # stb_adler32 is a plain Adler-32, zlib's implementation matches it exactly
+    return zlib.adler32(data, adler32) & _MASK32
+
+
+def _matchlen(data, a, b, maxlen):
+    """Length of the common run starting at `a` and `b`, capped at `maxlen`."""
+    if maxlen <= 0 or data[a] != data[b]:
+        return 0
+
+    # Grow the probe exponentially, then binary search the mismatch point.
+    # Slice comparisons run in C, which is what keeps this usable on fonts.
+    lo, n = 1, 8
+    while n < maxlen and data[a:a + n] == data[b:b + n]:
+        lo, n = n, n * 2
+    hi = min(n, maxlen)
+    if data[a:a + hi] == data[b:b + hi]:
+        return hi
+
+    while lo + 1 < hi:
+        mid = (lo + hi) // 2
+        if data[a:a + mid] == data[b:b + mid]:
+            lo = mid
+        else:
+            hi = mid
+    return lo
+
+
+def _not_crap(best, dist):
+    return ((best > 2 and dist <= 0x00100)
+            or (best > 5 and dist <= 0x04000)
+            or (best > 7 and dist <= 0x80000))
+
+
+def _out_literals(out, data, start, numlit):
+    while numlit > 65536:
+        _out_literals(out, data, start, 65536)
+        start += 65536
+        numlit -= 65536
+
+    if numlit == 0:
+        return
+    elif numlit <= 32:
+        out.append(0x20 + numlit - 1)
+    elif numlit <= 2048:
+        out += (0x0800 + numlit - 1).to_bytes(2, "big")
+    else:
+        out += (0x070000 + numlit - 1).to_bytes(3, "big")
+    out += data[start:start + numlit]
+
+
+def stb_compress(data) -> bytes:
+    """
+    Compress `data` into an stb stream.
+
+    :param data: bytes-like input
+    :return: compressed stream, identical to the native stb_compress() output
+    """
+    data = bytes(data)
+    length = len(data)
+    window = STB_WINDOW
+    mask = STB_HASH_SIZE - 1
+    chash = [-1] * STB_HASH_SIZE
+
+    out = bytearray()
+    out += struct.pack(">HHIII", 0x57BC, 0, 0, length, window)
+
+    q = 0
+    lit_start = 0
+    end = length
+
+    # stop short of the end so we don't scan off the end doing the hashing
+    while q + 12 < end:
+        match_max = end - q if q + 65536 > end else 65536
+        best, dist = 2, 0
+
+        # only try 4 candidate locations, chosen by 4 hashes of different lengths
+        h = (data[q] << 14) + (data[q + 1] << 7) + data[q + 2]
+        h1 = (h + (h >> 16)) & mask
+        h = (((h << 14) + (h >> 18) + (data[q + 3] << 7) + data[q + 4]) & _MASK32)
+        h2 = (h + (h >> 16)) & mask
+        h = (((h << 14) + (h >> 18) + (data[q + 5] << 7) + data[q + 6]) & _MASK32)
+        h = (((h << 14) + (h >> 18) + (data[q + 7] << 7) + data[q + 8]) & _MASK32)
+        h3 = (h + (h >> 16)) & mask
+        h = (((h << 14) + (h >> 18) + (data[q + 9] << 7) + data[q + 10]) & _MASK32)
+        h = (((h << 14) + (h >> 18) + (data[q + 11] << 7) + data[q + 12]) & _MASK32)
+        h4 = (h + (h >> 16)) & mask
+
+        for probe, slot in enumerate((h1, h2, h3, h4)):
+            t = chash[slot]
+            if t < 0 or (probe and dist == q - t):
+                continue
+            m = _matchlen(data, t, q, match_max)
+            if m > best and q - t <= window and (m > 9 or _not_crap(m, q - t)):
+                best, dist = m, q - t
+
+        # the hash table is shared, so it can only be updated after probing
+        chash[h1] = chash[h2] = chash[h3] = chash[h4] = q
+
+        if best < 3:
+            q += 1
+            continue
+
+        if best <= 0x80 and dist <= 0x100:
+            _out_literals(out, data, lit_start, q - lit_start)
+            q += best
+            lit_start = q
+            out.append(0x80 + best - 1)
+            out.append(dist - 1)
+        elif best > 5 and best <= 0x100 and dist <= 0x4000:
+            _out_literals(out, data, lit_start, q - lit_start)
+            q += best
+            lit_start = q
+            out += (0x4000 + dist - 1).to_bytes(2, "big")
+            out.append(best - 1)
+        elif best > 7 and best <= 0x100 and dist <= 0x80000:
+            _out_literals(out, data, lit_start, q - lit_start)
+            q += best
+            lit_start = q
+            out += (0x180000 + dist - 1).to_bytes(3, "big")
+            out.append(best - 1)
+        elif best > 8 and best <= 0x10000 and dist <= 0x80000:
+            _out_literals(out, data, lit_start, q - lit_start)
+            q += best
+            lit_start = q
+            out += (0x100000 + dist - 1).to_bytes(3, "big")
+            out += (best - 1).to_bytes(2, "big")
+        elif best > 9 and dist <= 0x1000000:
+            best = min(best, 65536)
+            _out_literals(out, data, lit_start, q - lit_start)
+            q += best
+            lit_start = q
+            if best <= 0x100:
+                out.append(0x06)
+                out += (dist - 1).to_bytes(3, "big")
+                out.append(best - 1)
+            else:
+                out.append(0x04)
+                out += (dist - 1).to_bytes(3, "big")
+                out += (best - 1).to_bytes(2, "big")
+        else:
+            # fallback literals if no match was a balanced tradeoff
+            q += 1
+
+    _out_literals(out, data, lit_start, length - lit_start)
+
+    out += (0x05FA).to_bytes(2, "big")
+    out += stb_adler32(data).to_bytes(4, "big")
+    return bytes(out)
+
+
+def stb_decompress_length(stream) -> int:
+    """Return the decompressed size stored in an stb stream header."""
+    return int.from_bytes(stream[8:12], "big")
+
+
+def stb_decompress(stream) -> bytes:
+    """
+    Decompress an stb stream.
+
+    :param stream: bytes-like stb stream
+    :return: decompressed data
+    :raises ValueError: If the stream is malformed or fails its checksum
+    """
+    i = bytes(stream)
+    if len(i) < STB_HEADER_SIZE or int.from_bytes(i[0:4], "big") != STB_SIGNATURE:
+        raise ValueError("[stb] Invalid stream signature.")
+    if int.from_bytes(i[4:8], "big") != 0:
+        raise ValueError("[stb] Stream is larger than 4GB.")
+
+    olen = stb_decompress_length(i)
+    out = bytearray()
+    pos = STB_HEADER_SIZE
+
+    def match(dist, n):
+        start = len(out) - dist
+        if start < 0:
+            raise ValueError("[stb] Match reaches before the start of the output.")
+        if dist >= n:
+            out.extend(out[start:start + n])
+        else:
+            # overlapping copy repeats the last `dist` bytes
+            chunk = out[start:]
+            reps, rem = divmod(n, dist)
+            out.extend(chunk * reps + chunk[:rem])
+
+    while True:
+        try:
+            c = i[pos]
+            if c >= 0x80:
+                match(i[pos + 1] + 1, c - 0x80 + 1)
+                pos += 2
+            elif c >= 0x40:
+                match(int.from_bytes(i[pos:pos + 2], "big") - 0x4000 + 1, i[pos + 2] + 1)
+                pos += 3
+            elif c >= 0x20:
+                n = c - 0x20 + 1
+                out += i[pos + 1:pos + 1 + n]
+                pos += 1 + n
+            elif c >= 0x18:
+                match(int.from_bytes(i[pos:pos + 3], "big") - 0x180000 + 1, i[pos + 3] + 1)
+                pos += 4
+            elif c >= 0x10:
+                match(int.from_bytes(i[pos:pos + 3], "big") - 0x100000 + 1,
+                      int.from_bytes(i[pos + 3:pos + 5], "big") + 1)
+                pos += 5
+            elif c >= 0x08:
+                n = int.from_bytes(i[pos:pos + 2], "big") - 0x0800 + 1
+                out += i[pos + 2:pos + 2 + n]
+                pos += 2 + n
+            elif c == 0x07:
+                n = int.from_bytes(i[pos + 1:pos + 3], "big") + 1
+                out += i[pos + 3:pos + 3 + n]
+                pos += 3 + n
+            elif c == 0x06:
+                match(int.from_bytes(i[pos + 1:pos + 4], "big") + 1, i[pos + 4] + 1)
+                pos += 5
+            elif c == 0x04:
+                match(int.from_bytes(i[pos + 1:pos + 4], "big") + 1,
+                      int.from_bytes(i[pos + 4:pos + 6], "big") + 1)
+                pos += 6
+            elif c == 0x05 and i[pos + 1] == 0xFA:
+                break
+            else:
+                raise ValueError(f"[stb] Unknown opcode 0x{c:02x} at offset {pos}.")
+        except IndexError:
+            raise ValueError("[stb] Unexpected end of stream.") from None
+
+        if len(out) > olen:
+            raise ValueError("[stb] Output overruns the declared length.")
+
+    if len(out) != olen:
+        raise ValueError("[stb] Output does not match the declared length.")
+    if stb_adler32(out) != int.from_bytes(i[pos + 2:pos + 6], "big"):
+        raise ValueError("[stb] Checksum mismatch.")
+    return bytes(out)
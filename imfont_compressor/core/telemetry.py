@@ -0,0 +1,299 @@
+import hashlib
+import json
+import math
+import os
+import statistics
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager
+
+TELEMETRY_FILE = "telemetry.jsonl"
+TELEMETRY_MAX_BYTES = 4 * 1024 * 1024  # the log is rotated past this size
+TELEMETRY_BACKUPS = 3                   # telemetry.jsonl.1 .. .3 are kept
+# Overrides the log location, or disables logging when set to an empty string
+TELEMETRY_ENV = "IMFONT_TELEMETRY"
+
+# Inclusive upper bounds of the ratio histogram buckets; the last one catches data that grew
+RATIO_BUCKETS = (0.25, 0.5, 0.75, 0.9, 1.0, float("inf"))
+
+
+@contextmanager
+def _locked(fd):
+    """Exclusive lock on an open file, held across processes."""
+    if os.name == "nt":
+        import msvcrt
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class TelemetryLog:
+    """
+    Append-only JSON Lines log of compression jobs, kept on this machine.
+
+    Each record is one write to a file opened for appending, under an
+    exclusive lock on telemetry.jsonl.lock, so threads and processes of a
+    batch can log to the same file without interleaving lines. The writer
+    that pushes the file past `max_bytes` rotates it (telemetry.jsonl -> .1
+    -> .2 ...) while it still holds the lock. A record costs two opens, a
+    lock and a write: tens of microseconds.
+    """
+
+    def __init__(self, path, max_bytes=TELEMETRY_MAX_BYTES, backups=TELEMETRY_BACKUPS):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+
+    def paths(self):
+        """The log and its rotated backups, oldest first."""
+        return [f"{self.path}.{i}" for i in range(self.backups, 0, -1)] + [self.path]
+
+    def append(self, record):
+        line = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # The lock is taken on a separate file: the log itself is renamed by rotation
+        lock_fd = os.open(self.path + ".lock", os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            with _locked(lock_fd):
+                fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    os.write(fd, line)
+                    size = os.fstat(fd).st_size
+                finally:
+                    os.close(fd)
+                if size > self.max_bytes:
+                    self._rotate()
+        finally:
+            os.close(lock_fd)
+
+    def _rotate(self):
+        try:
+            for i in range(self.backups - 1, 0, -1):
+                if os.path.exists(f"{self.path}.{i}"):
+                    os.replace(f"{self.path}.{i}", f"{self.path}.{i + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        except OSError:
+            pass  # Windows can't rename a file a reader has open; the next writer retries
+
+    def records(self):
+        """Every readable record, oldest first; malformed lines are skipped."""
+        for path in self.paths():
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            yield json.loads(line)
+                        except ValueError:
+                            continue
+            except OSError:
+                continue
+
+
+_log = None
+_log_loaded = False
+_log_lock = threading.Lock()
+
+
+def get_telemetry_path():
+    override = os.environ.get(TELEMETRY_ENV)
+    if override is not None:
+        return override
+    from imfont_compressor.core.config import get_config_dir
+    return os.path.join(get_config_dir(), TELEMETRY_FILE)
+
+
+def get_telemetry_log():
+    """The job log, or None when IMFONT_TELEMETRY disables it."""
+    global _log, _log_loaded
+    with _log_lock:
+        if not _log_loaded:
+            _log_loaded = True
+            path = get_telemetry_path()
+            _log = TelemetryLog(path) if path else None
+        return _log
+
+
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def job_record(params, result):
+    """Telemetry record of one run_compression call."""
+    metrics = result.get("metrics") or {}
+    input_hash = metrics.get("input_hash")
+    if input_hash is None and result["success"]:
+        input_hash = _file_hash(params["font_path"])
+
+    record = {
+        "time": round(time.time(), 3),
+        "pid": os.getpid(),
+        "font": os.path.basename(params["font_path"]),
+        "input_hash": input_hash,
+        "options": {
+            "encoding": params["encoding"],
+            "compress": not params["disable_compression"],
+            "static": not params["no_static"]
+        },
+        "success": result["success"]
+    }
+    if not result["success"]:
+        record["error"] = result["error"]
+        return record
+
+    for key in ("backend", "cached", "input_size", "compressed_size", "ratio", "output_size", "lines",
+                "wall_ms", "cpu_ms"):
+        record[key] = metrics.get(key)
+    record["stages"] = {s["name"]: [s["wall_ms"], s["cpu_ms"]] for s in metrics.get("stages", [])}
+    if "auto" in result:
+        record["auto"] = {"goal": result["auto"]["goal"], "encoding": result["auto"]["encoding"],
+                          "compressed": result["auto"]["compressed"]}
+    return record
+
+
+def log_job(params, result):
+    """Append a job to the telemetry log. Never raises: logging must not fail a compression."""
+    log = get_telemetry_log()
+    if log is None:
+        return
+    try:
+        log.append(job_record(params, result))
+    except Exception as e:
+        print(f"[Telemetry] Failed to log the job: {e}")
+
+
+def _percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    return sorted_values[max(0, math.ceil(fraction * len(sorted_values)) - 1)]
+
+
+def aggregate(records, top=10, since=None):
+    """
+    Summarise job records: wall time percentiles, slowest fonts, ratio
+    distribution, cache hit rate and totals per day (local time).
+
+    :param since: only count records from this Unix time on
+    """
+    jobs = failures = hits = 0
+    backends = defaultdict(int)
+    wall_times = []
+    ratios = []
+    fonts = {}
+    days = defaultdict(lambda: {"jobs": 0, "wall_ms": 0.0, "cache_hits": 0})
+
+    for record in records:
+        if since is not None and record.get("time", 0) < since:
+            continue
+        jobs += 1
+        if not record.get("success"):
+            failures += 1
+            continue
+
+        wall_ms = record.get("wall_ms") or 0.0
+        wall_times.append(wall_ms)
+        backends[record.get("backend")] += 1
+        hits += bool(record.get("cached"))
+        if record.get("ratio") is not None:
+            ratios.append(record["ratio"])
+
+        font = fonts.setdefault(record.get("input_hash"), {"font": record.get("font"), "times": [],
+                                                          "input_size": record.get("input_size")})
+        font["font"] = record.get("font")
+        font["times"].append(wall_ms)
+
+        day = days[time.strftime("%Y-%m-%d", time.localtime(record.get("time", 0)))]
+        day["jobs"] += 1
+        day["wall_ms"] += wall_ms
+        day["cache_hits"] += bool(record.get("cached"))
+
+    succeeded = jobs - failures
+    wall_times.sort()
+    slowest = sorted(
+        ({"font": f["font"], "input_hash": key, "input_size": f["input_size"], "jobs": len(f["times"]),
+          "median_ms": round(statistics.median(f["times"]), 3), "max_ms": round(max(f["times"]), 3)}
+         for key, f in fonts.items()),
+        key=lambda f: f["median_ms"], reverse=True
+    )[:top]
+
+    counts = [0] * len(RATIO_BUCKETS)
+    for ratio in ratios:
+        counts[bisect_left(RATIO_BUCKETS, ratio)] += 1
+    histogram = [
+        {"above": lower, "up_to": upper if upper != float("inf") else None, "jobs": count}
+        for lower, upper, count in zip((0.0,) + RATIO_BUCKETS, RATIO_BUCKETS, counts)
+    ]
+
+    return {
+        "jobs": jobs,
+        "failures": failures,
+        "cache_hit_rate": round(hits / succeeded, 4) if succeeded else None,
+        "backends": dict(backends),
+        "wall_ms": {
+            "p50": _percentile(wall_times, 0.50), "p90": _percentile(wall_times, 0.90),
+            "p99": _percentile(wall_times, 0.99), "max": wall_times[-1]
+        } if wall_times else None,
+        "slowest_fonts": slowest,
+        "ratios": histogram,
+        "days": [
+            {"date": date, "jobs": d["jobs"], "wall_ms": round(d["wall_ms"], 3),
+             "cache_hit_rate": round(d["cache_hits"] / d["jobs"], 4)}
+            for date, d in sorted(days.items())
+        ]
+    }
+
+
+def format_stats(stats):
+    """Render an aggregate() result as text."""
+    if not stats["jobs"]:
+        return "No jobs logged."
+
+    lines = [f"Jobs: {stats['jobs']} ({stats['failures']} failed)"]
+    if stats["cache_hit_rate"] is not None:
+        lines.append(f"Cache hit rate: {stats['cache_hit_rate']:.0%}")
+    if stats["backends"]:
+        lines.append("Backends: " + ", ".join(f"{name} {count}" for name, count in sorted(stats["backends"].items())))
+    if stats["wall_ms"]:
+        w = stats["wall_ms"]
+        lines.append(f"Time per job: p50 {w['p50']:.0f} ms, p90 {w['p90']:.0f} ms, "
+                     f"p99 {w['p99']:.0f} ms, max {w['max']:.0f} ms")
+
+    if stats["slowest_fonts"]:
+        lines += ["", f"{'Slowest fonts':<32}{'Size':>12}{'Jobs':>6}{'Median':>11}{'Max':>11}"]
+        for font in stats["slowest_fonts"]:
+            size = f"{font['input_size']:,}" if font["input_size"] is not None else "-"
+            lines.append(f"{(font['font'] or '?')[:31]:<32}{size:>12}{font['jobs']:>6}"
+                         f"{font['median_ms']:>8.0f} ms{font['max_ms']:>8.0f} ms")
+
+    total = sum(bucket["jobs"] for bucket in stats["ratios"])
+    if total:
+        lines += ["", "Compressed size / input size"]
+        for bucket in stats["ratios"]:
+            if bucket["up_to"] is None:
+                label = f">{bucket['above']:.0%}"
+            else:
+                label = f"{bucket['above']:.0%}-{bucket['up_to']:.0%}"
+            lines.append(f"  {label:<10}{bucket['jobs']:>6}  {'#' * round(40 * bucket['jobs'] / total)}".rstrip())
+
+    lines += ["", f"{'Day':<12}{'Jobs':>6}{'Total time':>14}{'Cache hits':>12}"]
+    for day in stats["days"]:
+        lines.append(f"{day['date']:<12}{day['jobs']:>6}{day['wall_ms'] / 1000:>12.1f} s{day['cache_hit_rate']:>12.0%}")
+    return "\n".join(lines)
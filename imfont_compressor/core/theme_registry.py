@@ -0,0 +1,215 @@
+import os
+import json
+import threading
+
+
+def flatten_color_map(color_dict, parent_key=""):
+    """
+    Recursively flatten nested color dictionaries to a flat dict with dot notation keys.
+
+    :param color_dict: nested dict of colors
+    :param parent_key: prefix for keys (used during recursion)
+    :return: flat dict of colors { "section.color_key": "#hex" }
+    """
+    items = {}
+    for key, value in color_dict.items():
+        full_key = f"{parent_key}.{key}" if parent_key else key
+        if isinstance(value, dict):
+            items.update(flatten_color_map(value, full_key))
+        else:
+            items[full_key] = value
+    return items
+
+
+class _ThemeFile:
+    __slots__ = ("mtime_ns", "size", "data", "color_map")
+
+    def __init__(self, mtime_ns, size, data):
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.data = data          # validated theme dict, or None if the file was rejected
+        self.color_map = None     # flattened lazily, most themes are never applied
+
+
+class ThemeRegistry:
+    """
+    In-memory index of the theme directory.
+
+    Theme files are parsed once and kept with their mtime and size; each
+    refresh stats the directory and re-parses only files that were added or
+    changed since, so listing and switching themes stays cheap with large
+    theme packs. Flattened color maps are cached per file on first use.
+
+    A registry built from packed entries (see entries() and the asset
+    bundle) serves those and never touches the directory.
+    """
+
+    def __init__(self, theme_dir, packed=None):
+        self.theme_dir = theme_dir
+        self._packed = packed  # [[filename, data, color_map], ...] or None
+        self._files = {}  # filename -> _ThemeFile
+        self._themes = None  # theme_id -> [theme dicts], rebuilt when a file changes
+        self._by_key = {}  # (theme_id, version) -> _ThemeFile
+        self._display = None  # display name -> (theme_id, version)
+        self._lock = threading.Lock()
+
+    def _load_file(self, filename, path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"[Theme] Failed to load {filename}: {e}")
+            return None
+
+        if not isinstance(data, dict):
+            print(f"[Theme] Skipping {filename}: Invalid JSON format (not an object)")
+            return None
+
+        theme_id = data.get("id")
+        if not theme_id:
+            print(f"[Theme] Skipping {filename}: Missing 'id' field")
+            return None
+
+        if not isinstance(data.get("colors"), dict):
+            print(f"[Theme] Skipping {filename}: Missing or invalid 'colors'")
+            return None
+
+        data["version"] = str(data.get("version", "1.0"))
+        data["name"] = data.get("name", theme_id)
+        return data
+
+    def refresh(self) -> bool:
+        """
+        Bring the index up to date with the directory.
+
+        :return: True if any theme file was added, changed or removed
+        """
+        with self._lock:
+            if self._packed is not None:
+                if self._files:
+                    return False
+                for filename, data, color_map in self._packed:
+                    theme_file = self._files[filename] = _ThemeFile(None, None, data)
+                    theme_file.color_map = color_map
+                self._themes = self._display = None
+                return True
+
+            if not os.path.isdir(self.theme_dir):
+                print(f"[Theme] Theme directory not found: {self.theme_dir}")
+                changed = bool(self._files) or self._themes is None
+                self._files = {}
+                self._themes = self._display = None
+                return changed
+
+            seen = set()
+            changed = False
+            with os.scandir(self.theme_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    seen.add(entry.name)
+
+                    stat = entry.stat()
+                    cached = self._files.get(entry.name)
+                    if cached and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+                        continue
+
+                    self._files[entry.name] = _ThemeFile(
+                        stat.st_mtime_ns, stat.st_size, self._load_file(entry.name, entry.path)
+                    )
+                    changed = True
+
+            for filename in self._files.keys() - seen:
+                del self._files[filename]
+                changed = True
+
+            if changed:
+                self._themes = self._display = None
+            return changed
+
+    def invalidate(self, filename=None):
+        """Forget one file (or all of them) so the next refresh re-parses it."""
+        with self._lock:
+            if filename is None or self._packed is not None:
+                self._files.clear()
+            else:
+                self._files.pop(filename, None)
+            self._themes = self._display = None
+
+    def entries(self) -> list:
+        """
+        Return [[filename, theme data, flattened color map], ...] for every valid
+        theme file, the form stored in the asset bundle.
+        """
+        self.refresh()
+        with self._lock:
+            files = sorted(self._files.items())
+        return [
+            [filename, theme_file.data, flatten_color_map(theme_file.data["colors"])]
+            for filename, theme_file in files
+            if theme_file.data is not None
+        ]
+
+    def themes(self, sort: bool = True) -> dict:
+        """
+        Return { theme_id: [theme_data_dict, ...] } with the rules of UITheme.list_available_themes.
+        The theme dicts are shared with the registry and must not be modified.
+
+        :param sort: If True, sort the result by theme 'name'
+        """
+        self.refresh()
+        with self._lock:
+            if self._themes is None:
+                themes = {}
+                by_key = {}
+                for filename in sorted(self._files):
+                    theme_file = self._files[filename]
+                    data = theme_file.data
+                    if data is None:
+                        continue
+
+                    key = (data["id"], data["version"])
+                    if key in by_key:
+                        print(f"[Theme] Skipping duplicate theme '{data['id']}' with version '{data['version']}' (from {filename})")
+                        continue
+                    by_key[key] = theme_file
+                    themes.setdefault(data["id"], []).append(data)
+
+                self._themes = themes
+                self._by_key = by_key
+            themes = {theme_id: list(versions) for theme_id, versions in self._themes.items()}
+
+        if sort:
+            themes = dict(sorted(
+                themes.items(),
+                key=lambda item: item[1][0].get("name", "").lower()
+            ))
+        return themes
+
+    def display_map(self) -> dict:
+        """
+        Return { display name: (theme_id, version) } for the theme combobox.
+        Themes with a single version show their name, others "name (vX)".
+        """
+        themes = self.themes()
+        with self._lock:
+            if self._display is None:
+                display = {}
+                for theme_id, versions in themes.items():
+                    for theme in versions:
+                        name = theme.get("name", theme_id)
+                        version = theme.get("version", "1.0")
+                        key = name if len(versions) == 1 else f"{name} (v{version})"
+                        display[key] = (theme_id, version)
+                self._display = display
+            return dict(self._display)
+
+    def color_map(self, theme: dict) -> dict:
+        """Flattened colors of a theme returned by themes(), cached until its file changes."""
+        with self._lock:
+            theme_file = self._by_key.get((theme.get("id"), theme.get("version")))
+            if theme_file is None or theme_file.data is not theme:
+                return flatten_color_map(theme.get("colors", {}))
+            if theme_file.color_map is None:
+                theme_file.color_map = flatten_color_map(theme["colors"])
+            return theme_file.color_map
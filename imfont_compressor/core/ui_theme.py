@@ -1,9 +1,12 @@
-import os
 import json
+import weakref
+from collections import defaultdict
 from enum import Enum
 import tkinter as tk
 from tkinter import ttk
 from imfont_compressor.core.utils import get_resource_path
+from imfont_compressor.core.theme_registry import ThemeRegistry, flatten_color_map
+from imfont_compressor.core.assets import get_asset_bundle, THEMES_ENTRY
 
 class ColorKeys(Enum):
     # === Backgrounds ===
@@ -85,19 +88,29 @@ class UITheme:
         :param theme_dir: directory where theme JSON files are stored
         """
         self.app = app
+        bundle = get_asset_bundle() if theme_dir is None else None
         self.theme_dir = theme_dir or get_resource_path("assets", "themes")
+        if bundle is not None and THEMES_ENTRY in bundle:
+            self.registry = ThemeRegistry(self.theme_dir, packed=bundle.load(THEMES_ENTRY))
+        else:
+            self.registry = ThemeRegistry(self.theme_dir)
         self.theme_name = None
         self.theme_raw = {}
         self.color_map = {}
+        # ColorKeys -> widgets painted with it; entries vanish with their widgets
+        self._widgets_by_key = defaultdict(weakref.WeakSet)
+        self._painted_map = {}  # color_map of the last repaint
+        self._defaults_registered = False
         self.apply_theme(default_theme)
 
-    def apply_theme(self, theme_name):
+    def apply_theme(self, theme_name, version: str = None):
         """
         Change the current theme by loading a new theme file.
         
         :param theme_name: theme ID to load
+        :param version: optional theme version, defaults to latest
         """
-        self.load_theme(theme_name)
+        self.load_theme(theme_name, version)
         self.refresh_colors()
 
     def load_theme(self, theme_id: str, version: str = None):
@@ -133,7 +146,7 @@ class UITheme:
         try:
             self.theme_raw = selected_theme
             self.theme_name = f"{theme_id}@{selected_theme.get('version', '1.0')}"
-            self.color_map = self._flatten_color_map(selected_theme.get("colors", {}))
+            self.color_map = self.registry.color_map(selected_theme)
         except json.JSONDecodeError as e:
             raise json.JSONDecodeError(f"[UITheme] Failed to parse JSON for theme '{theme_id}@{version}': {e}", e.doc, e.pos)
 
@@ -145,14 +158,7 @@ class UITheme:
         :param parent_key: prefix for keys (used during recursion)
         :return: flat dict of colors { "section.color_key": "#hex" }
         """
-        items = {}
-        for key, value in color_dict.items():
-            full_key = f"{parent_key}.{key}" if parent_key else key
-            if isinstance(value, dict):
-                items.update(self._flatten_color_map(value, full_key))
-            else:
-                items[full_key] = value
-        return items
+        return flatten_color_map(color_dict, parent_key)
 
     def apply_colors(self, widget, **theme_options: ColorKeys):
         """
@@ -193,26 +199,44 @@ class UITheme:
             else:
                 normal_keys[k] = v
 
+        for option in set(normal_keys) | set(disabled_keys):
+            if option not in widget.keys():
+                raise AttributeError(f"[Theme] Widget does not support option '{option}'")
+
+        self._register(widget, normal_keys, disabled_keys)
+
+        try:
+            self._paint(widget)
+        except Exception as e:
+            raise RuntimeError(f"[Theme] Could not apply colors on widget: {e}")
+
+    def _register(self, widget, normal_keys, disabled_keys):
         # Store clean keys
         widget._theme_color_keys = {
             "normal": normal_keys,
             "disabled": disabled_keys
         }
+        for color_key in (*normal_keys.values(), *disabled_keys.values()):
+            self._widgets_by_key[color_key].add(widget)
 
-        # Determine current widget state
+    def _paint(self, widget):
+        """Configure a registered widget for its current state in a single call."""
+        theme_keys = widget._theme_color_keys
         state = widget.cget("state") if "state" in widget.keys() else "normal"
-        use_keys = disabled_keys if state == "disabled" else normal_keys
+        use_keys = theme_keys["disabled"] if state == "disabled" else theme_keys["normal"]
+        if use_keys:
+            widget.configure({option: self.get_color(color_key) for option, color_key in use_keys.items()})
+
+    def refresh_widget(self, widget):
+        """Repaint one widget, e.g. after its state changed between normal and disabled."""
+        if getattr(widget, "_theme_color_keys", None):
+            self._paint(widget)
+
+    def set_state(self, widget, state):
+        """Change a widget's state and repaint it with the matching colors."""
+        widget.configure(state=state)
+        self.refresh_widget(widget)
 
-        # Apply to widget
-        for option, color_key in use_keys.items():
-            color_value = self.get_color(color_key)
-            if option not in widget.keys():
-                raise AttributeError(f"[Theme] Widget does not support option '{option}'")
-            try:
-                widget.configure({option: color_value})
-            except Exception as e:
-                raise RuntimeError(f"[Theme] Could not set '{option}' with {color_key} on widget: {e}")
-    
     def get_color(self, name, fallback=None):
         """
         Retrieve a color hex string by its key.
@@ -238,7 +262,7 @@ class UITheme:
 
     def list_available_themes(self, sort: bool = True) -> dict:
         """
-        Load available themes from disk, requiring each to explicitly declare an 'id'.
+        Return the available themes from the theme registry, requiring each to explicitly declare an 'id'.
 
         Rules:
         - Skip any theme JSON without an 'id'.
@@ -246,61 +270,12 @@ class UITheme:
         - Return a dict mapping theme_id → list of theme dicts (each dict includes all info).
         - Optionally sort the result by theme 'name' alphabetically.
 
+        Files are parsed once and re-read only when their mtime or size changes.
+
         :param sort: If True, return the result sorted by theme 'name'.
         :return: dict { theme_id: [theme_data_dict, ...] }
         """
-        themes = {}  # Map theme_id -> list of theme dicts (different versions)
-
-        if not os.path.isdir(self.theme_dir):
-            print(f"[Theme] Theme directory not found: {self.theme_dir}")
-            return themes
-
-        for filename in os.listdir(self.theme_dir):
-            if not filename.endswith(".json"):
-                continue
-
-            theme_path = os.path.join(self.theme_dir, filename)
-
-            try:
-                with open(theme_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                if not isinstance(data, dict):
-                    print(f"[Theme] Skipping {filename}: Invalid JSON format (not an object)")
-                    continue
-
-                theme_id = data.get("id")
-                if not theme_id:
-                    print(f"[Theme] Skipping {filename}: Missing 'id' field")
-                    continue
-
-                colors = data.get("colors")
-                if not isinstance(colors, dict):
-                    print(f"[Theme] Skipping {filename}: Missing or invalid 'colors'")
-                    continue
-
-                data["version"] = str(data.get("version", "1.0"))
-                data["name"] = data.get("name", theme_id)
-
-                if theme_id not in themes:
-                    themes[theme_id] = [data]
-                else:
-                    existing_versions = {t["version"] for t in themes[theme_id]}
-                    if data["version"] in existing_versions:
-                        print(f"[Theme] Skipping duplicate theme '{theme_id}' with version '{data['version']}' (from {filename})")
-                    else:
-                        themes[theme_id].append(data)
-
-            except Exception as e:
-                print(f"[Theme] Failed to load {filename}: {e}")
-
-        if sort:
-            themes = dict(sorted(
-                themes.items(),
-                key=lambda item: item[1][0].get("name", "").lower()
-            ))
-
-        return themes
+        return self.registry.themes(sort)
     
     def get_theme_display_list(self):
         """
@@ -308,19 +283,13 @@ class UITheme:
         - If a theme has only one version, display only the name.
         - If multiple versions, display name + (vVersion).
         """
-        themes = self.list_available_themes()
-        display_list = []
+        return list(self.registry.display_map())
 
-        for theme_id, versions in themes.items():
-            if len(versions) == 1:
-                name = versions[0].get("name", theme_id)
-                display_list.append(name)
-            else:
-                for theme in versions:
-                    name = theme.get("name", theme_id)
-                    version = theme.get("version", "1.0")
-                    display_list.append(f"{name} (v{version})")
-        return display_list
+    def get_theme_display_map(self):
+        """
+        Returns { display string: (theme_id, version) } matching get_theme_display_list().
+        """
+        return self.registry.display_map()
 
     def get_name(self):
         """
@@ -331,188 +300,180 @@ class UITheme:
         """
         return self.theme_raw.get("name", self.theme_name)
     
+    # Colors for widgets created without apply_colors, picked by class
+    # (checked in order, so subclasses must come first)
+    _DEFAULT_KEYS = (
+        (tk.Checkbutton, {
+            "bg": ColorKeys.CHECK_BG,
+            "fg": ColorKeys.CHECK_FG,
+            "activebackground": ColorKeys.CHECK_ACTIVE_BG,
+            "activeforeground": ColorKeys.CHECK_ACTIVE_FG,
+            "selectcolor": ColorKeys.CHECK_SELECTED
+        }, None),
+        (tk.Button, {
+            "bg": ColorKeys.BUTTON_BG,
+            "fg": ColorKeys.BUTTON_FG,
+            "activebackground": ColorKeys.BUTTON_PRESSED_BG,
+            "activeforeground": ColorKeys.BUTTON_PRESSED_FG
+        }, {
+            "bg": ColorKeys.BUTTON_DISABLED_BG,
+            "fg": ColorKeys.BUTTON_DISABLED_FG,
+            "activebackground": ColorKeys.BUTTON_PRESSED_BG,
+            "activeforeground": ColorKeys.BUTTON_PRESSED_FG
+        }),
+        (tk.Entry, {
+            "bg": ColorKeys.INPUT_BG,
+            "fg": ColorKeys.INPUT_FG,
+            "insertbackground": ColorKeys.INPUT_INSIDE
+        }, None),
+        (tk.Label, {
+            "bg": ColorKeys.BG_MAIN_FRAME,
+            "fg": ColorKeys.LABEL
+        }, None),
+        (tk.Frame, {
+            "bg": ColorKeys.BG_MAIN_FRAME
+        }, None)
+    )
+
+    def register_defaults(self, widget):
+        """
+        Register `widget` and its descendants that were created without apply_colors,
+        using the per-class defaults, and switch ttk widgets to the custom styles.
+
+        Called once when the UI has been built; widgets created later use apply_colors.
+        """
+        if not getattr(widget, "_theme_color_keys", None):
+            keys = widget.keys()
+            for widget_class, normal_keys, disabled_keys in self._DEFAULT_KEYS:
+                if isinstance(widget, widget_class):
+                    normal_keys = {opt: key for opt, key in normal_keys.items() if opt in keys}
+                    disabled_keys = {opt: key for opt, key in (disabled_keys or normal_keys).items() if opt in keys}
+                    self._register(widget, normal_keys, disabled_keys)
+                    break
+
+        if isinstance(widget, ttk.Combobox):
+            widget.configure(style="Custom.TCombobox")
+        elif isinstance(widget, ttk.Notebook):
+            widget.configure(style="Custom.TNotebook")
+        elif isinstance(widget, ttk.Entry):
+            widget.configure(style="Custom.TEntry")
+
+        for child in widget.winfo_children():
+            self.register_defaults(child)
+
+    def _configure_ttk_styles(self):
+        """Configure the custom ttk styles for the current theme, once per theme change."""
+        get_color = self.get_color
+        style = ttk.Style()
+        if style.theme_use() != "default":
+            style.theme_use("default")
+
+        style.configure('Custom.TCombobox',
+                        fieldbackground=get_color(ColorKeys.COMBO_FIELD_BG),
+                        foreground=get_color(ColorKeys.COMBO_FG),
+                        background=get_color(ColorKeys.COMBO_BG),
+                        arrowcolor=get_color(ColorKeys.COMBO_ARROW))
+
+        style.map('Custom.TCombobox',
+                fieldbackground=[
+                    ('readonly', get_color(ColorKeys.COMBO_FIELD_BG)),
+                    ('!readonly', get_color(ColorKeys.COMBO_FIELD_BG)),
+                    ('active', get_color(ColorKeys.COMBO_FIELD_BG)),
+                    ('disabled', get_color(ColorKeys.COMBO_DISABLED_BG))
+                ],
+                foreground=[
+                    ('readonly', get_color(ColorKeys.COMBO_FG)),
+                    ('!readonly', get_color(ColorKeys.COMBO_FG)),
+                    ('active', get_color(ColorKeys.COMBO_FG)),
+                    ('disabled', get_color(ColorKeys.COMBO_DISABLED_FG))
+                ],
+                background=[
+                    ('readonly', get_color(ColorKeys.COMBO_BG)),
+                    ('!readonly', get_color(ColorKeys.COMBO_BG)),
+                    ('active', get_color(ColorKeys.COMBO_BG)),
+                    ('disabled', get_color(ColorKeys.COMBO_DISABLED_BG))
+                ],
+                selectbackground=[
+                    ('readonly', get_color(ColorKeys.COMBO_SELECT_BG)),
+                    ('!readonly', get_color(ColorKeys.COMBO_SELECT_BG))
+                ],
+                selectforeground=[
+                    ('readonly', get_color(ColorKeys.COMBO_SELECT_FG)),
+                    ('!readonly', get_color(ColorKeys.COMBO_SELECT_FG))
+                ])
+
+        style.configure("Custom.TNotebook",
+                        background=get_color(ColorKeys.TAB_CONTAINER_BG),
+                        borderwidth=0,
+                        padding=0)
+        style.layout("Custom.TNotebook.Tab", [])
+
+        style.configure("Custom.TEntry",
+                        fieldbackground=get_color(ColorKeys.INPUT_BG),
+                        foreground=get_color(ColorKeys.INPUT_FG),
+                        bordercolor=get_color(ColorKeys.INPUT_BORDER),
+                        lightcolor=get_color(ColorKeys.INPUT_INSIDE))
+
+        style.map("Custom.TEntry",
+                fieldbackground=[
+                    ("disabled", get_color(ColorKeys.BUTTON_DISABLED_BG)),
+                    ("focus", get_color(ColorKeys.INPUT_BG)),
+                    ("!disabled", get_color(ColorKeys.INPUT_BG))
+                ],
+                foreground=[
+                    ("disabled", get_color(ColorKeys.BUTTON_DISABLED_FG)),
+                    ("focus", get_color(ColorKeys.INPUT_FG)),
+                    ("!disabled", get_color(ColorKeys.INPUT_FG))
+                ],
+                bordercolor=[
+                    ("focus", get_color(ColorKeys.INPUT_BORDER_FOCUS)),
+                    ("!focus", get_color(ColorKeys.INPUT_BORDER))
+                ],
+                lightcolor=[
+                    ("focus", get_color(ColorKeys.INPUT_INSIDE)),
+                    ("!focus", get_color(ColorKeys.INPUT_INSIDE))
+                ])
+
     def refresh_colors(self):
-        """Refresh all widget colors based on current theme."""
+        """
+        Repaint widgets whose colors changed since the last repaint, in one pass.
 
+        Calls made while the UI is still being built are no-ops; the first call
+        after initialization registers the widget tree and paints everything.
+        """
         if not self.app.initialized:
             return
-        
+
+        if not self._defaults_registered:
+            self.register_defaults(self.app.root)
+            self._defaults_registered = True
+
         if self.app.main_window is not None:
             self.app.main_window.refresh_colors()
 
-        def get_color(key: ColorKeys) -> str:
-            if not isinstance(key, ColorKeys):
-                raise TypeError(f"[Theme] Expected ColorKeys enum, got {type(key)}: {key}")
-            return self.get_color(key)
+        if self.color_map == self._painted_map:
+            return
+
+        self._configure_ttk_styles()
+
+        # Only widgets using a color that differs from the painted theme need work
+        changed_keys = [
+            key for key in self._widgets_by_key
+            if self._painted_map.get(key.value) != self.color_map.get(key.value)
+        ]
+        widgets = set()
+        for key in changed_keys:
+            widgets.update(self._widgets_by_key[key])
 
-        def widget_supports_option(widget, option: str) -> bool:
+        for widget in widgets:
             try:
-                widget.cget(option)
-                return True
+                self._paint(widget)
             except tk.TclError:
-                return False
-
-        def update_widget_colors(widget):
-            widget_id = widget.winfo_name() or str(widget)
-            theme_keys = getattr(widget, "_theme_color_keys", None)
-
-            if theme_keys:
-                state = widget.cget("state") if "state" in widget.keys() else "normal"
-                if isinstance(theme_keys, dict) and "normal" in theme_keys and "disabled" in theme_keys:
-                    state_keys = theme_keys["disabled"] if state == "disabled" else theme_keys["normal"]
-                else:
-                    state_keys = theme_keys
-
-                for option, color_key in state_keys.items():
-                    if not isinstance(color_key, ColorKeys):
-                        raise ValueError(f"[Theme] Widget '{widget_id}' has invalid ColorKeys entry for '{option}': {color_key}")
-                    if widget_supports_option(widget, option):
-                        try:
-                            widget.configure({option: get_color(color_key)})
-                        except Exception as e:
-                            raise RuntimeError(f"[Theme] Failed to apply '{option}' with {color_key} to '{widget_id}': {e}")
-                    else:
-                        pass
+                # Destroyed but still referenced from Python
+                for key_set in self._widgets_by_key.values():
+                    key_set.discard(widget)
+            except Exception as e:
+                widget_id = widget.winfo_name() or str(widget)
+                raise RuntimeError(f"[Theme] Failed to apply colors to '{widget_id}': {e}")
 
-            else:
-                try:
-                    if isinstance(widget, tk.Frame):
-                        if widget_supports_option(widget, "bg"):
-                            widget.configure(bg=get_color(ColorKeys.BG_MAIN_FRAME))
-
-                    elif isinstance(widget, tk.Label):
-                        if widget_supports_option(widget, "bg"):
-                            widget.configure(bg=get_color(ColorKeys.BG_MAIN_FRAME))
-                        if widget_supports_option(widget, "fg"):
-                            widget.configure(fg=get_color(ColorKeys.LABEL))
-
-                    elif isinstance(widget, tk.Entry):
-                        if widget_supports_option(widget, "bg"):
-                            widget.configure(bg=get_color(ColorKeys.INPUT_BG))
-                        if widget_supports_option(widget, "fg"):
-                            widget.configure(fg=get_color(ColorKeys.INPUT_FG))
-                        if widget_supports_option(widget, "insertbackground"):
-                            widget.configure(insertbackground=get_color(ColorKeys.INPUT_INSIDE))
-
-                    elif isinstance(widget, tk.Checkbutton):
-                        if widget_supports_option(widget, "bg"):
-                            widget.configure(bg=get_color(ColorKeys.CHECK_BG))
-                        if widget_supports_option(widget, "fg"):
-                            widget.configure(fg=get_color(ColorKeys.CHECK_FG))
-                        if widget_supports_option(widget, "activebackground"):
-                            widget.configure(activebackground=get_color(ColorKeys.CHECK_ACTIVE_BG))
-                        if widget_supports_option(widget, "activeforeground"):
-                            widget.configure(activeforeground=get_color(ColorKeys.CHECK_ACTIVE_FG))
-                        if widget_supports_option(widget, "selectcolor"):
-                            widget.configure(selectcolor=get_color(ColorKeys.CHECK_SELECTED))
-
-                    elif isinstance(widget, tk.Button):
-                        state = widget.cget("state")
-                        if state != "disabled":
-                            if widget_supports_option(widget, "bg"):
-                                widget.configure(bg=get_color(ColorKeys.BUTTON_BG))
-                            if widget_supports_option(widget, "fg"):
-                                widget.configure(fg=get_color(ColorKeys.BUTTON_FG))
-                        else:
-                            if widget_supports_option(widget, "bg"):
-                                widget.configure(bg=get_color(ColorKeys.BUTTON_DISABLED_BG))
-                            if widget_supports_option(widget, "fg"):
-                                widget.configure(fg=get_color(ColorKeys.BUTTON_DISABLED_FG))
-
-                        if widget_supports_option(widget, "activebackground"):
-                            widget.configure(activebackground=get_color(ColorKeys.BUTTON_PRESSED_BG))
-                        if widget_supports_option(widget, "activeforeground"):
-                            widget.configure(activeforeground=get_color(ColorKeys.BUTTON_PRESSED_FG))
-
-                except Exception as fallback_exception:
-                    pass
-
-            # Handle TTK widget styles
-            if isinstance(widget, ttk.Widget):
-                style = ttk.Style()
-                try:
-                    if isinstance(widget, ttk.Combobox):
-                        style.configure('Custom.TCombobox',
-                                        fieldbackground=get_color(ColorKeys.COMBO_FIELD_BG),
-                                        foreground=get_color(ColorKeys.COMBO_FG),
-                                        background=get_color(ColorKeys.COMBO_BG),
-                                        arrowcolor=get_color(ColorKeys.COMBO_ARROW))
-
-                        style.map('Custom.TCombobox',
-                                fieldbackground=[
-                                    ('readonly', get_color(ColorKeys.COMBO_FIELD_BG)),
-                                    ('!readonly', get_color(ColorKeys.COMBO_FIELD_BG)),
-                                    ('active', get_color(ColorKeys.COMBO_FIELD_BG)),
-                                    ('disabled', get_color(ColorKeys.COMBO_DISABLED_BG))
-                                ],
-                                foreground=[
-                                    ('readonly', get_color(ColorKeys.COMBO_FG)),
-                                    ('!readonly', get_color(ColorKeys.COMBO_FG)),
-                                    ('active', get_color(ColorKeys.COMBO_FG)),
-                                    ('disabled', get_color(ColorKeys.COMBO_DISABLED_FG))
-                                ],
-                                background=[
-                                    ('readonly', get_color(ColorKeys.COMBO_BG)),
-                                    ('!readonly', get_color(ColorKeys.COMBO_BG)),
-                                    ('active', get_color(ColorKeys.COMBO_BG)),
-                                    ('disabled', get_color(ColorKeys.COMBO_DISABLED_BG))
-                                ],
-                                selectbackground=[
-                                    ('readonly', get_color(ColorKeys.COMBO_SELECT_BG)),
-                                    ('!readonly', get_color(ColorKeys.COMBO_SELECT_BG))
-                                ],
-                                selectforeground=[
-                                    ('readonly', get_color(ColorKeys.COMBO_SELECT_FG)),
-                                    ('!readonly', get_color(ColorKeys.COMBO_SELECT_FG))
-                                ])
-
-                        widget.configure(style='Custom.TCombobox')
-
-                    elif isinstance(widget, ttk.Notebook):
-                        style.theme_use("default")
-                        style.configure("Custom.TNotebook",
-                                        background=get_color(ColorKeys.TAB_CONTAINER_BG),
-                                        borderwidth=0,
-                                        padding=0)
-
-                        style.layout("Custom.TNotebook.Tab", [])
-                        widget.configure(style="Custom.TNotebook")
-
-                    elif isinstance(widget, ttk.Entry):
-                        style.configure("Custom.TEntry",
-                                        fieldbackground=get_color(ColorKeys.INPUT_BG),
-                                        foreground=get_color(ColorKeys.INPUT_FG),
-                                        bordercolor=get_color(ColorKeys.INPUT_BORDER),
-                                        lightcolor=get_color(ColorKeys.INPUT_INSIDE))
-
-                        style.map("Custom.TEntry",
-                                fieldbackground=[
-                                    ("disabled", get_color(ColorKeys.BUTTON_DISABLED_BG)),
-                                    ("focus", get_color(ColorKeys.INPUT_BG)),
-                                    ("!disabled", get_color(ColorKeys.INPUT_BG))
-                                ],
-                                foreground=[
-                                    ("disabled", get_color(ColorKeys.BUTTON_DISABLED_FG)),
-                                    ("focus", get_color(ColorKeys.INPUT_FG)),
-                                    ("!disabled", get_color(ColorKeys.INPUT_FG))
-                                ],
-                                bordercolor=[
-                                    ("focus", get_color(ColorKeys.INPUT_BORDER_FOCUS)),
-                                    ("!focus", get_color(ColorKeys.INPUT_BORDER))
-                                ],
-                                lightcolor=[
-                                    ("focus", get_color(ColorKeys.INPUT_INSIDE)),
-                                    ("!focus", get_color(ColorKeys.INPUT_INSIDE))
-                                ])
-
-                        widget.configure(style="Custom.TEntry")
-
-                except Exception as ttk_exception:
-                    pass
-
-            # Recurse through children
-            for child in widget.winfo_children():
-                update_widget_colors(child)
-
-        # Start from root widget
-        update_widget_colors(self.app.root)
+        self._painted_map = self.color_map
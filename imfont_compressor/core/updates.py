@@ -0,0 +1,147 @@
+import json
+import os
+import re
+import threading
+import time
+from imfont_compressor import CURRENT_VERSION, RELEASE_API
+
+UPDATE_CACHE_FILE = "update_cache.json"
+UPDATE_TTL = 60 * 60  # seconds a cached answer is used without asking the server
+UPDATE_TIMEOUT = 5.0  # seconds for connecting and for each read
+# Points the update check at another server, e.g. a local stand-in
+RELEASE_API_ENV = "IMFONT_RELEASE_API"
+
+
+class UpdateCheckError(Exception):
+    pass
+
+
+def compare_versions(v1, v2):
+    def parse_version(version):
+        return [int(num) for num in re.sub(r'[^0-9.]', '', version).split('.')]
+
+    v1_parts = parse_version(v1)
+    v2_parts = parse_version(v2)
+
+    for i in range(max(len(v1_parts), len(v2_parts))):
+        v1_part = v1_parts[i] if i < len(v1_parts) else 0
+        v2_part = v2_parts[i] if i < len(v2_parts) else 0
+
+        if v1_part < v2_part:
+            return -1
+        elif v1_part > v2_part:
+            return 1
+
+    return 0
+
+
+class UpdateChecker:
+    """
+    Looks up the latest release, remembering the answer on disk.
+
+    Within `ttl` seconds of the last answer no request is made at all. After
+    that the request is conditional (If-None-Match / If-Modified-Since), so
+    an unchanged release costs a 304 with no body. The cache is written
+    atomically next to the user configuration.
+
+    check() blocks for up to `timeout` seconds; call it off the UI thread.
+    """
+
+    def __init__(self, url=None, cache_path=None, ttl=UPDATE_TTL, timeout=UPDATE_TIMEOUT,
+                 current_version=CURRENT_VERSION, clock=time.time):
+        if cache_path is None:
+            from imfont_compressor.core.config import get_config_dir
+            cache_path = os.path.join(get_config_dir(), UPDATE_CACHE_FILE)
+        self.url = url or os.environ.get(RELEASE_API_ENV) or RELEASE_API + "/latest"
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.timeout = timeout
+        self.current_version = current_version
+        self.clock = clock
+        self.requests = 0  # network round-trips made, for diagnostics
+        self._cache = None
+        self._lock = threading.Lock()
+
+    def _load_cache(self):
+        if self._cache is None:
+            self._cache = {}
+            try:
+                with open(self.cache_path, "r", encoding="utf-8") as f:
+                    cache = json.load(f)
+                # Only trust a cache written for the same endpoint
+                if isinstance(cache, dict) and cache.get("url") == self.url and "release" in cache:
+                    self._cache = cache
+            except (OSError, ValueError):
+                pass
+        return self._cache
+
+    def _save_cache(self, cache):
+        self._cache = cache
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            temp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(cache, f, indent=2)
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            print(f"[Update] Failed to save the update cache: {e}")
+
+    def _fetch(self, cache):
+        import urllib.error
+        import urllib.request
+
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "User-Agent": f"ImFontCompressor/{self.current_version}"
+        }
+        if cache.get("etag"):
+            headers["If-None-Match"] = cache["etag"]
+        if cache.get("last_modified"):
+            headers["If-Modified-Since"] = cache["last_modified"]
+
+        self.requests += 1
+        request = urllib.request.Request(self.url, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                data = json.load(response)
+                return {
+                    "url": self.url,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "fetched_at": self.clock(),
+                    "release": {"tag_name": data["tag_name"], "html_url": data["html_url"]}
+                }, "network"
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and cache:
+                return dict(cache, fetched_at=self.clock()), "not_modified"
+            raise UpdateCheckError(f"HTTP {e.code}: {e.reason}") from e
+        except (urllib.error.URLError, OSError) as e:
+            raise UpdateCheckError(str(getattr(e, "reason", e))) from e
+        except (ValueError, KeyError) as e:
+            raise UpdateCheckError(f"Unexpected response: {e}") from e
+
+    def check(self, force=False):
+        """
+        Return {"is_update", "latest_version", "download_url", "source"}, where source is
+        "cache", "not_modified" or "network".
+
+        :param force: ignore the TTL (the request is still conditional)
+        :raises UpdateCheckError: if the server can't be reached or answers unexpectedly
+        """
+        with self._lock:
+            cache = self._load_cache()
+            fresh = cache and 0 <= self.clock() - cache.get("fetched_at", 0) < self.ttl
+            if fresh and not force:
+                source = "cache"
+            else:
+                cache, source = self._fetch(cache)
+                self._save_cache(cache)
+
+        release = cache["release"]
+        latest_version = release["tag_name"].lstrip("v")
+        return {
+            "is_update": compare_versions(self.current_version, latest_version) < 0,
+            "latest_version": latest_version,
+            "download_url": release["html_url"],
+            "source": source
+        }
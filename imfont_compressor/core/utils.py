@@ -1,11 +1,14 @@
 import os
 import sys
-import tkinter as tk
+import threading
 
 encoding_map = {
     "Unsigned 8-bit (-u8)": "-u8",
     "Unsigned 32-bit (-u32)": "-u32",
-    "Base85 Encoded (-base85)": "-base85"
+    "Base85 Encoded (-base85)": "-base85",
+    "Auto - Smallest Binary": "auto:binary",
+    "Auto - Smallest Source": "auto:source",
+    "Auto - Fastest Load": "auto:load"
 }
 
 def get_encoding_value(key):
@@ -23,6 +26,14 @@ def get_encoding_key(value=None):
         raise ValueError("encoding_map is empty, cannot get default key")
 
 
+def format_size(num_bytes):
+    """Human readable byte count, e.g. '61.2 KB'."""
+    size = float(num_bytes)
+    for unit in ("B", "KB", "MB"):
+        if size < 1024 or unit == "MB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
 def get_valid_symbol_name(name, fallback="example"):
     if isinstance(name, str) and any(c.isalpha() for c in name):
         return name
@@ -44,6 +55,41 @@ def get_resource_path(*path_parts):
     base_path = get_project_root()
     return os.path.join(base_path, *path_parts)
     
+def run_in_background(app, func, on_done, interval=50, on_progress=None):
+    """
+    Run func() on a worker thread and hand the outcome to on_done(result, error)
+    on the Tk thread. Tk is only touched from the polling after() callback.
+
+    With on_progress, func is called as func(report): the worker calls
+    report(value) as often as it likes and on_progress(value) receives the
+    latest value on the Tk thread, at most once per poll.
+    """
+    outcome = {}
+    progress = {}
+
+    def _target():
+        try:
+            if on_progress is None:
+                outcome["result"] = func()
+            else:
+                outcome["result"] = func(lambda value: progress.__setitem__("value", value))
+        except Exception as e:
+            outcome["error"] = e
+
+    worker = threading.Thread(target=_target, daemon=True)
+    worker.start()
+
+    def _poll():
+        if "value" in progress:
+            on_progress(progress.pop("value"))
+        if worker.is_alive():
+            app.root.after(interval, _poll)
+            return
+        on_done(outcome.get("result"), outcome.get("error"))
+
+    app.root.after(interval, _poll)
+    return worker
+
 def enable_drag_and_drop(widget, app):
     """
     Enable drag-and-drop file support on a tkinter widget.
@@ -51,16 +97,32 @@ def enable_drag_and_drop(widget, app):
     members: font_input (Entry), status_label (Label).
 
     Drops update the font_input Entry and status_label Label.
+    The widget is registered once tkdnd has been loaded by load_drag_and_drop().
     """
+    app.dnd_targets.append(widget)
+    if app.dnd_loaded:
+        _register_drop_target(widget, app)
 
-    from imfont_compressor.core.ui_theme import ColorKeys
+def load_drag_and_drop(app):
+    """Load tkdnd into the running Tk interpreter and register every pending drop target."""
     try:
-        from tkinterdnd2 import DND_FILES
-    except ImportError:
-        print("tkinterdnd2 not available — drag and drop disabled.")
+        from tkinterdnd2 import TkinterDnD
+        TkinterDnD._require(app.root)
+    except (ImportError, RuntimeError) as e:
+        print(f"tkinterdnd2 not available — drag and drop disabled. ({e})")
         return
 
+    app.dnd_loaded = True
+    for widget in app.dnd_targets:
+        _register_drop_target(widget, app)
+
+def _register_drop_target(widget, app):
+    from imfont_compressor.core.ui_theme import ColorKeys
+    from tkinterdnd2 import DND_FILES
+
     def on_drop(event):
+        from imfont_compressor.core.events import set_status, select_font
+
         dropped_files = event.data
         files = [f.strip('{}') for f in dropped_files.split()]
         if not files:
@@ -70,19 +132,13 @@ def enable_drag_and_drop(widget, app):
         if os.path.isfile(dropped_file):
             ext = os.path.splitext(dropped_file)[1].lower()
             if ext in [".ttf", ".otf"]:
-                # Update font_input Entry
-                if app.font_input:
-                    app.font_input.delete(0, tk.END)
-                    app.font_input.insert(0, dropped_file)
-                # Update status_label
-                if app.status_label:
-                    app.status_label.config(text=app.language.get("compressor.status", app.language.get("compressor.status.idle")), fg=app.ui_theme.get_color(ColorKeys.STATUS_IDLE))
+                select_font(app, dropped_file)
             else:
                 if app.status_label:
-                    app.status_label.config(text=app.language.get("compressor.status", app.language.get("compressor.status.invalid_type_drop")), fg=app.ui_theme.get_color(ColorKeys.STATUS_ERROR))
+                    set_status(app, "compressor.status.invalid_type_drop", ColorKeys.STATUS_ERROR)
         else:
             if app.status_label:
-                app.status_label.config(text=app.language.get("compressor.status", app.language.get("compressor.status.invalid_drop")), fg=app.ui_theme.get_color(ColorKeys.STATUS_ERROR))
+                set_status(app, "compressor.status.invalid_drop", ColorKeys.STATUS_ERROR)
 
     widget.drop_target_register(DND_FILES)
     widget.dnd_bind('<<Drop>>', on_drop)
@@ -0,0 +1,177 @@
+import os
+import sys
+import threading
+import time
+import tkinter
+from collections import Counter, deque
+
+STALL_THRESHOLD_MS = 200  # event-loop latency reported as a stall
+HEARTBEAT_MS = 50         # how often the Tk thread checks in
+SAMPLE_MS = 10            # stack sampling period while the Tk thread is late
+MAX_SAMPLES = 500         # per stall, so a long freeze doesn't grow without bound
+STALL_LOG_FILE = "stalls.jsonl"
+# Enables the watchdog with this threshold in milliseconds, like --watch-stalls
+STALL_ENV = "IMFONT_WATCH_STALLS"
+
+_TKINTER_DIR = os.path.dirname(os.path.abspath(tkinter.__file__))
+
+
+def _describe(frame):
+    filename, lineno, name = frame
+    return f"{name} ({os.path.basename(filename)}:{lineno})"
+
+
+def find_handler(stack):
+    """
+    The Tk callback a sampled stack is inside: the first frame after the last
+    tkinter frame, as tkinter calls the bound handler. None outside the event loop.
+    """
+    handler = None
+    for i, (filename, _, _) in enumerate(stack):
+        if os.path.dirname(os.path.abspath(filename)) == _TKINTER_DIR and i + 1 < len(stack):
+            handler = stack[i + 1]
+    return handler
+
+
+class StallWatchdog:
+    """
+    Opt-in detector for a blocked Tk event loop.
+
+    A heartbeat is scheduled with after() every `interval_ms`; how late it
+    runs is the event-loop latency. A monitor thread notices when the
+    heartbeat is overdue and samples the Tk thread's Python stack every
+    SAMPLE_MS until it runs again. A stall longer than `threshold_ms` is
+    printed and appended to stalls.jsonl next to the settings, with its
+    duration, the blocking handler and the most frequently sampled stack.
+
+    Costs one after() callback per interval while idle; stacks are sampled
+    only during a stall.
+    """
+
+    def __init__(self, root, threshold_ms=STALL_THRESHOLD_MS, interval_ms=HEARTBEAT_MS, log=None):
+        self.root = root
+        self.threshold_ms = threshold_ms
+        self.interval_ms = interval_ms
+        self.log = log
+        self.latencies = deque(maxlen=10000)  # ms each heartbeat ran late, most recent last
+        self.stalls = []
+
+        self._thread_id = threading.get_ident()  # the Tk thread: created where the root lives
+        self._lock = threading.Lock()
+        self._samples = Counter()
+        self._sample_count = 0
+        self._due = None
+        self._after_id = None
+        self._stop = threading.Event()
+        self._monitor = None
+
+    def start(self):
+        self._due = time.perf_counter() + self.interval_ms / 1000.0
+        self._after_id = self.root.after(self.interval_ms, self._beat)
+        self._monitor = threading.Thread(target=self._watch, name="StallWatchdog", daemon=True)
+        self._monitor.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def _beat(self):
+        now = time.perf_counter()
+        late_ms = (now - self._due) * 1000.0
+        with self._lock:
+            samples, self._samples = self._samples, Counter()
+            sample_count, self._sample_count = self._sample_count, 0
+            self._due = now + self.interval_ms / 1000.0
+        self.latencies.append(late_ms)
+
+        if late_ms >= self.threshold_ms:
+            self._report(late_ms, samples, sample_count)
+        if not self._stop.is_set():
+            self._after_id = self.root.after(self.interval_ms, self._beat)
+
+    def _watch(self):
+        period = SAMPLE_MS / 1000.0
+        while not self._stop.wait(period):
+            with self._lock:
+                if self._due is None or time.perf_counter() - self._due < period:
+                    continue
+                if self._sample_count >= MAX_SAMPLES:
+                    continue
+                frame = sys._current_frames().get(self._thread_id)
+                stack = []
+                # Walked by hand: traceback.extract_stack would read source lines
+                while frame is not None:
+                    stack.append((frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name))
+                    frame = frame.f_back
+                if stack:
+                    self._samples[tuple(reversed(stack))] += 1
+                    self._sample_count += 1
+
+    def _report(self, duration_ms, samples, sample_count):
+        stack, hits = samples.most_common(1)[0] if samples else ((), 0)
+        # The handler is voted on by all samples: inner frames vary more than the handler
+        handlers = Counter()
+        for sample, count in samples.items():
+            handlers[find_handler(sample)] += count
+        handler = handlers.most_common(1)[0][0] if handlers else None
+        stall = {
+            "time": round(time.time(), 3),
+            "duration_ms": round(duration_ms, 1),
+            "handler": _describe(handler) if handler else None,
+            "hot_frame": _describe(stack[-1]) if stack else None,
+            "samples": sample_count,
+            "stack_share": round(hits / sample_count, 3) if sample_count else None,
+            "stack": [_describe(frame) for frame in stack[-30:]]
+        }
+        self.stalls.append(stall)
+
+        print(f"[Stall] Event loop blocked for {duration_ms:.0f} ms in "
+              f"{stall['handler'] or 'unknown handler'}, at {stall['hot_frame'] or '?'}", file=sys.stderr)
+        if self.log is not None:
+            try:
+                self.log.append(stall)
+            except OSError as e:
+                print(f"[Stall] Failed to log the stall: {e}", file=sys.stderr)
+
+    def summary(self):
+        """Latency percentiles and stall count since start()."""
+        latencies = sorted(self.latencies)
+        if not latencies:
+            return "No heartbeats recorded."
+
+        def percentile(fraction):
+            return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))]
+
+        return (f"Event loop latency: p50 {percentile(0.5):.1f} ms, p99 {percentile(0.99):.1f} ms, "
+                f"max {latencies[-1]:.1f} ms over {len(latencies)} heartbeats; {len(self.stalls)} stall(s) "
+                f"over {self.threshold_ms} ms")
+
+
+def get_stall_threshold(requested=None):
+    """Threshold from --watch-stalls, or from IMFONT_WATCH_STALLS; None when not enabled."""
+    if requested is not None:
+        return requested
+    value = os.environ.get(STALL_ENV)
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return STALL_THRESHOLD_MS
+
+
+def start_watchdog(root, threshold_ms):
+    """Start a StallWatchdog logging to stalls.jsonl in the settings folder."""
+    from imfont_compressor.core.config import get_config_dir
+    from imfont_compressor.core.telemetry import TelemetryLog
+
+    log = TelemetryLog(os.path.join(get_config_dir(), STALL_LOG_FILE))
+    watchdog = StallWatchdog(root, threshold_ms, log=log).start()
+    print(f"[Stall] Watching the event loop (threshold {threshold_ms} ms, log {log.path})", file=sys.stderr)
+    return watchdog
@@ -0,0 +1,64 @@
+# Generate Dear ImGui font sources from an ImFontCompressor manifest at build time.
+#
+#   include(path/to/imfont_compressor/data/ImFontCompressor.cmake)
+#   imfont_compressor_add_fonts(fonts MANIFEST fonts.toml [ALL] [PYTHON <python>])
+#   add_dependencies(my_app fonts)
+#   get_target_property(font_sources fonts IMFONT_OUTPUTS)
+#
+# Every output of the manifest becomes a custom command that runs
+# `python -m imfont_compressor build <manifest> --only <output> --depfiles`,
+# so it is rebuilt when its font or the manifest changes and skipped by the
+# tool when neither its font, its options nor the tool version did. The
+# outputs are read from the manifest at configure time, and CMake configures
+# again when the manifest changes. Needs CMake 3.20 for DEPFILE with every
+# generator, and Python 3.11 for TOML manifests (JSON works with any).
+
+cmake_minimum_required(VERSION 3.20)
+
+# The directory holding the imfont_compressor package, for PYTHONPATH
+get_filename_component(_IMFONT_COMPRESSOR_ROOT "${CMAKE_CURRENT_LIST_DIR}/../.." ABSOLUTE)
+
+function(imfont_compressor_add_fonts target)
+    cmake_parse_arguments(PARSE_ARGV 1 ARG "ALL" "MANIFEST;PYTHON" "")
+    if(NOT ARG_MANIFEST)
+        message(FATAL_ERROR "imfont_compressor_add_fonts(${target}): MANIFEST is required")
+    endif()
+    if(NOT ARG_PYTHON)
+        find_package(Python3 REQUIRED COMPONENTS Interpreter)
+        set(ARG_PYTHON "${Python3_EXECUTABLE}")
+    endif()
+    get_filename_component(manifest "${ARG_MANIFEST}" ABSOLUTE BASE_DIR "${CMAKE_CURRENT_SOURCE_DIR}")
+    set(tool "${CMAKE_COMMAND}" -E env "PYTHONPATH=${_IMFONT_COMPRESSOR_ROOT}" "${ARG_PYTHON}" -m imfont_compressor)
+
+    set_property(DIRECTORY APPEND PROPERTY CMAKE_CONFIGURE_DEPENDS "${manifest}")
+    execute_process(
+        COMMAND ${tool} build "${manifest}" --list
+        OUTPUT_VARIABLE outputs
+        ERROR_VARIABLE error
+        RESULT_VARIABLE result
+        OUTPUT_STRIP_TRAILING_WHITESPACE
+    )
+    if(NOT result EQUAL 0)
+        message(FATAL_ERROR "imfont_compressor_add_fonts(${target}): ${error}")
+    endif()
+    string(REPLACE "\n" ";" outputs "${outputs}")
+
+    set(state_dir "${CMAKE_CURRENT_BINARY_DIR}/${target}.imfont_build")
+    foreach(output IN LISTS outputs)
+        add_custom_command(
+            OUTPUT "${output}"
+            COMMAND ${tool} build "${manifest}" --only "${output}" --depfiles --state-dir "${state_dir}" --quiet
+            DEPENDS "${manifest}"
+            DEPFILE "${output}.d"
+            COMMENT "Generating font source ${output}"
+            VERBATIM
+        )
+    endforeach()
+
+    if(ARG_ALL)
+        add_custom_target(${target} ALL DEPENDS ${outputs})
+    else()
+        add_custom_target(${target} DEPENDS ${outputs})
+    endif()
+    set_target_properties(${target} PROPERTIES IMFONT_OUTPUTS "${outputs}")
+endfunction()
@@ -2,7 +2,12 @@
 #include <stdio.h>
 #include <string.h>
 #include <stdlib.h>
+#include <stdarg.h>
 #include <assert.h>
+#ifdef _WIN32
+#include <io.h>
+#include <fcntl.h>
+#endif
 
 // stb_compress* from stb.h - declaration
 typedef unsigned int stb_uint;
@@ -16,10 +21,26 @@ enum SourceEncoding
     SourceEncoding_Base85,
 };
 
+// Where the source is written: a file, or a growable memory buffer (-server responses)
+struct Output
+{
+    FILE* file = nullptr;
+    char* data = nullptr;
+    size_t size = 0;
+    size_t capacity = 0;
+    bool failed = false;
+};
+
 static bool binary_to_compressed_c(const char* inputfile, const char* symbolname,
                             SourceEncoding source_encoding, bool use_compression,
                             bool use_static, const char* outputfile = nullptr);
 
+static bool write_source(Output& out, const char* inputname, const char* symbolname,
+                         SourceEncoding source_encoding, bool use_compression, bool use_static,
+                         char* data, int data_sz);
+
+static int run_server();
+
 static const char* ExtractFilenameWithoutExtension(const char* path);
 
 int main(int argc, char** argv)
@@ -27,14 +48,16 @@ int main(int argc, char** argv)
     if (argc < 2)
     {
         printf("Usage:\n");
-        printf("  %s [options] <inputfile> [-output <outputfile>] [symbolname]\n\n", argv[0]);
+        printf("  %s [options] <inputfile> [-output <outputfile>] [symbolname]\n", argv[0]);
+        printf("  %s -server\n\n", argv[0]);
         printf("Options:\n");
         printf("  -u8        Encode as uint8_t array (default)\n");
         printf("  -u32       Encode as uint32_t array\n");
         printf("  -base85    Encode using base85 encoding\n");
         printf("  -nocompress  Disable compression of input file\n");
         printf("  -nostatic    Do not mark generated symbol as 'static'\n");
-        printf("  -output <outputfile>  Path to output .cpp file (defaults to stdout if not set)\n\n");
+        printf("  -output <outputfile>  Path to output .cpp file (defaults to stdout if not set)\n");
+        printf("  -server    Serve length-prefixed requests on stdin until it is closed (see run_server)\n\n");
         printf("Arguments:\n");
         printf("  <inputfile>   Path to the binary file to embed\n");
         printf("  [symbolname]  Optional variable/function name for the embedded data.\n");
@@ -46,6 +69,9 @@ int main(int argc, char** argv)
         return 0;
     }
 
+    if (argc == 2 && strcmp(argv[1], "-server") == 0)
+        return run_server();
+
     int argn = 1;
     bool use_compression = true;
     bool use_static = true;
@@ -111,59 +137,116 @@ char Encode85Byte(unsigned int x)
     return (char)((x >= '\\') ? x + 1 : x);
 }
 
-bool binary_to_compressed_c(const char* inputfile, const char* symbolname,
-                            SourceEncoding source_encoding, bool use_compression,
-                            bool use_static, const char* outputfile)
+static int Print(Output& out, const char* fmt, ...)
+{
+    va_list args;
+    if (out.file)
+    {
+        va_start(args, fmt);
+        int n = vfprintf(out.file, fmt, args);
+        va_end(args);
+        return n;
+    }
+
+    for (;;)
+    {
+        size_t room = out.capacity - out.size;
+        va_start(args, fmt);
+        int n = vsnprintf(out.data ? out.data + out.size : nullptr, room, fmt, args);
+        va_end(args);
+        if (n < 0)
+            return n;
+        if ((size_t)n < room) {
+            out.size += n;
+            return n;
+        }
+
+        size_t capacity = out.capacity ? out.capacity * 2 : 64 * 1024;
+        while (capacity - out.size <= (size_t)n)
+            capacity *= 2;
+        char* data = (char*)realloc(out.data, capacity);
+        if (!data) {
+            out.failed = true;
+            return -1;
+        }
+        out.data = data;
+        out.capacity = capacity;
+    }
+}
+
+// Read a whole file, followed by 4 zero bytes: the encoders read whole 32-bit words
+static char* read_file(const char* inputfile, int* data_sz)
 {
-    // Read file
     FILE* f = fopen(inputfile, "rb");
-    if (!f) return false;
-    
-    int data_sz;
-    if (fseek(f, 0, SEEK_END) || (data_sz = (int)ftell(f)) == -1 || fseek(f, 0, SEEK_SET)) {
+    if (!f) return nullptr;
+
+    if (fseek(f, 0, SEEK_END) || (*data_sz = (int)ftell(f)) == -1 || fseek(f, 0, SEEK_SET)) {
         fclose(f);
-        return false;
+        return nullptr;
     }
 
-    char* data = new char[data_sz + 4];
-    if (fread(data, 1, data_sz, f) != (size_t)data_sz) {
+    char* data = new char[*data_sz + 4];
+    if (fread(data, 1, *data_sz, f) != (size_t)*data_sz) {
         fclose(f);
         delete[] data;
-        return false;
+        return nullptr;
     }
-    memset(data + data_sz, 0, 4);
+    memset(data + *data_sz, 0, 4);
     fclose(f);
+    return data;
+}
 
-    // Compress
-    int maxlen = data_sz + 512 + (data_sz >> 2) + sizeof(int);
-    char* compressed = use_compression ? new char[maxlen] : data;
-    int compressed_sz = use_compression ? stb_compress((stb_uchar*)compressed, (stb_uchar*)data, data_sz) : data_sz;
-    if (use_compression)
-        memset(compressed + compressed_sz, 0, maxlen - compressed_sz);
+bool binary_to_compressed_c(const char* inputfile, const char* symbolname,
+                            SourceEncoding source_encoding, bool use_compression,
+                            bool use_static, const char* outputfile)
+{
+    // Read file
+    int data_sz;
+    char* data = read_file(inputfile, &data_sz);
+    if (!data) return false;
 
     // Output
-    FILE* out = stdout;
+    Output out;
+    out.file = stdout;
     bool out_opened = false;
     if (outputfile && strlen(outputfile) > 0) {
-        out = fopen(outputfile, "w");
-        if (!out) {
+        out.file = fopen(outputfile, "w");
+        if (!out.file) {
             fprintf(stderr, "Error: Could not open output file '%s'\n", outputfile);
-            if (use_compression)
-                delete[] compressed;
             delete[] data;
             return false;
         }
         out_opened = true;
     }
 
-    fprintf(out, "// File: '%s' (%d bytes)\n", inputfile, data_sz);
+    bool ret = write_source(out, inputfile, symbolname, source_encoding, use_compression, use_static, data, data_sz);
+
+    if (out_opened)
+        fclose(out.file);
+    delete[] data;
+    return ret;
+}
+
+// Compress (optionally) and print the source. `data` must be followed by 4 zero bytes.
+bool write_source(Output& out, const char* inputname, const char* symbolname,
+                  SourceEncoding source_encoding, bool use_compression, bool use_static,
+                  char* data, int data_sz)
+{
+    // Compress
+    int maxlen = data_sz + 512 + (data_sz >> 2) + sizeof(int);
+    char* compressed = use_compression ? new char[maxlen] : data;
+    int compressed_sz = use_compression ? stb_compress((stb_uchar*)compressed, (stb_uchar*)data, data_sz) : data_sz;
+    if (use_compression)
+        memset(compressed + compressed_sz, 0, maxlen - compressed_sz);
+
+    Print(out, "// File: '%s' (%d bytes)\n", inputname, data_sz);
     const char* static_str = use_static ? "static " : "";
     const char* compressed_str = use_compression ? "compressed_" : "";
 
     if (source_encoding == SourceEncoding_Base85)
     {
-        fprintf(out, "// Exported using binary_to_compressed_c -base85 \"%s\" %s\n", inputfile, symbolname);
-        fprintf(out, "%sconst char %s_%sdata_base85[%d+1] =\n    \"", static_str, symbolname, compressed_str, ((compressed_sz + 3) / 4) * 5);
+        Print(out, "// Exported using binary_to_compressed_c -base85 \"%s\" %s\n", inputname, symbolname);
+        Print(out, "%sconst char %s_%sdata_base85[%d+1] =\n    \"", static_str, symbolname, compressed_str, ((compressed_sz + 3) / 4) * 5);
         char prev_c = 0;
         for (int src_i = 0; src_i < compressed_sz; src_i += 4)
         {
@@ -171,53 +254,186 @@ bool binary_to_compressed_c(const char* inputfile, const char* symbolname,
             for (unsigned int n5 = 0; n5 < 5; n5++, d /= 85)
             {
                 char c = Encode85Byte(d);
-                fprintf(out, (c == '?' && prev_c == '?') ? "\\%c" : "%c", c);
+                Print(out, (c == '?' && prev_c == '?') ? "\\%c" : "%c", c);
                 prev_c = c;
             }
             if ((src_i % 112) == 112 - 4)
-                fprintf(out, "\"\n    \"");
+                Print(out, "\"\n    \"");
         }
-        fprintf(out, "\";\n\n");
+        Print(out, "\";\n\n");
     }
     else if (source_encoding == SourceEncoding_U8)
     {
-        fprintf(out, "// Exported using binary_to_compressed_c -u8 \"%s\" %s\n", inputfile, symbolname);
-        fprintf(out, "%sconst unsigned int %s_%ssize = %d;\n", static_str, symbolname, compressed_str, compressed_sz);
-        fprintf(out, "%sconst unsigned char %s_%sdata[%d] =\n{", static_str, symbolname, compressed_str, compressed_sz);
+        Print(out, "// Exported using binary_to_compressed_c -u8 \"%s\" %s\n", inputname, symbolname);
+        Print(out, "%sconst unsigned int %s_%ssize = %d;\n", static_str, symbolname, compressed_str, compressed_sz);
+        Print(out, "%sconst unsigned char %s_%sdata[%d] =\n{", static_str, symbolname, compressed_str, compressed_sz);
         int column = 0;
         for (int i = 0; i < compressed_sz; i++)
         {
             if (column == 0)
-                fprintf(out, "\n    ");
-            column += fprintf(out, "%d,", static_cast<unsigned char>(compressed[i]));
+                Print(out, "\n    ");
+            column += Print(out, "%d,", static_cast<unsigned char>(compressed[i]));
             if (column >= 180)
                 column = 0;
         }
-        fprintf(out, "\n};\n\n");
+        Print(out, "\n};\n\n");
     }
     else if (source_encoding == SourceEncoding_U32)
     {
-        fprintf(out, "// Exported using binary_to_compressed_c -u32 \"%s\" %s\n", inputfile, symbolname);
-        fprintf(out, "%sconst unsigned int %s_%ssize = %d;\n", static_str, symbolname, compressed_str, compressed_sz);
-        fprintf(out, "%sconst unsigned int %s_%sdata[%d/4] =\n{", static_str, symbolname, compressed_str, ((compressed_sz + 3) / 4) * 4);
+        Print(out, "// Exported using binary_to_compressed_c -u32 \"%s\" %s\n", inputname, symbolname);
+        Print(out, "%sconst unsigned int %s_%ssize = %d;\n", static_str, symbolname, compressed_str, compressed_sz);
+        Print(out, "%sconst unsigned int %s_%sdata[%d/4] =\n{", static_str, symbolname, compressed_str, ((compressed_sz + 3) / 4) * 4);
         int column = 0;
         for (int i = 0; i < compressed_sz; i += 4)
         {
             unsigned int d = *(unsigned int*)(compressed + i);
             if ((column++ % 14) == 0)
-                fprintf(out, "\n    0x%08x, ", d);
+                Print(out, "\n    0x%08x, ", d);
             else
-                fprintf(out, "0x%08x, ", d);
+                Print(out, "0x%08x, ", d);
         }
-        fprintf(out, "\n};\n\n");
+        Print(out, "\n};\n\n");
     }
 
-    if (out_opened)
-        fclose(out);
-    delete[] data;
     if (use_compression)
         delete[] compressed;
-    return true;
+    return out.file ? !ferror(out.file) : !out.failed;
+}
+
+// -server: one process compresses many inputs, saving a process start per file.
+//
+// Requests and responses are frames: a 4-byte little-endian length, then that many bytes.
+//   Request:  u8 encoding (0 = -u8, 1 = -u32, 2 = -base85)
+//             u8 flags (1 = compress, 2 = static, 4 = the input is inline)
+//             u16 symbol length, symbol (empty: derived from the name)
+//             u16 name length, name (the input path, or the name printed for inline input)
+//             inline input: the rest of the frame
+//   Response: u8 status (0 = ok, 1 = error), then the source or the error message
+// The server exits when stdin is closed.
+enum
+{
+    ServerFlag_Compress = 1,
+    ServerFlag_Static = 2,
+    ServerFlag_Inline = 4,
+};
+
+static unsigned int ReadLE(const unsigned char* p, int bytes)
+{
+    unsigned int v = 0;
+    for (int i = bytes - 1; i >= 0; i--)
+        v = (v << 8) | p[i];
+    return v;
+}
+
+static bool write_frame(unsigned char status, const char* payload, size_t size)
+{
+    unsigned int length = (unsigned int)(size + 1);
+    unsigned char header[5] = { (unsigned char)length, (unsigned char)(length >> 8),
+                                (unsigned char)(length >> 16), (unsigned char)(length >> 24), status };
+    return fwrite(header, 1, 5, stdout) == 5 && fwrite(payload, 1, size, stdout) == size && fflush(stdout) == 0;
+}
+
+// Copy a u16-length-prefixed string out of a request; advances `pos`
+static char* read_string(const unsigned char* request, unsigned int length, unsigned int* pos)
+{
+    if (*pos + 2 > length) return nullptr;
+    unsigned int size = ReadLE(request + *pos, 2);
+    if (*pos + 2 + size > length) return nullptr;
+    char* s = new char[size + 1];
+    memcpy(s, request + *pos + 2, size);
+    s[size] = '\0';
+    *pos += 2 + size;
+    return s;
+}
+
+static bool handle_request(unsigned char* request, unsigned int length, Output& out, char* error, size_t error_size)
+{
+    if (length < 2 || request[0] > SourceEncoding_Base85) {
+        snprintf(error, error_size, "Malformed request.");
+        return false;
+    }
+    SourceEncoding source_encoding = (SourceEncoding)request[0];
+    unsigned char flags = request[1];
+    unsigned int pos = 2;
+    char* symbol = read_string(request, length, &pos);
+    char* name = symbol ? read_string(request, length, &pos) : nullptr;
+    if (!name) {
+        snprintf(error, error_size, "Malformed request.");
+        delete[] symbol;
+        return false;
+    }
+
+    int data_sz = 0;
+    char* data = nullptr;
+    char* file_data = nullptr;
+    if (flags & ServerFlag_Inline) {
+        // The request buffer has 4 zero bytes past its end for the encoders
+        data = (char*)request + pos;
+        data_sz = (int)(length - pos);
+    } else {
+        data = file_data = read_file(name, &data_sz);
+    }
+
+    bool ret = data != nullptr;
+    if (ret) {
+        const char* symbolname = symbol[0] ? symbol : ExtractFilenameWithoutExtension(name);
+        ret = write_source(out, name, symbolname, source_encoding, (flags & ServerFlag_Compress) != 0,
+                           (flags & ServerFlag_Static) != 0, data, data_sz);
+    }
+    if (!ret)
+        snprintf(error, error_size, "Error processing file: '%s'", name);
+
+    delete[] file_data;
+    delete[] symbol;
+    delete[] name;
+    return ret;
+}
+
+int run_server()
+{
+#ifdef _WIN32
+    _setmode(_fileno(stdin), _O_BINARY);
+    _setmode(_fileno(stdout), _O_BINARY);
+#endif
+    unsigned char* request = nullptr;
+    unsigned int capacity = 0;
+    Output out;
+    char error[1024];
+
+    for (;;)
+    {
+        unsigned char header[4];
+        size_t got = fread(header, 1, 4, stdin);
+        if (got == 0 && feof(stdin))
+            break; // the client is done
+        if (got != 4)
+            return 1;
+
+        unsigned int length = ReadLE(header, 4);
+        if (length > 0x7ffffff0)
+            return 1;
+        if (length + 4 > capacity || request == nullptr) {
+            free(request);
+            capacity = length + 4;
+            request = (unsigned char*)malloc(capacity);
+            if (!request)
+                return 1;
+        }
+        if (fread(request, 1, length, stdin) != length)
+            return 1;
+        memset(request + length, 0, 4);
+
+        out.size = 0;
+        out.failed = false;
+        bool ok = handle_request(request, length, out, error, sizeof(error));
+        bool written = ok ? write_frame(0, out.data, out.size) : write_frame(1, error, strlen(error));
+        if (!written)
+            return 1;
+    }
+
+    free(request);
+    free(out.data);
+    return 0;
 }
 
 const char* ExtractFilenameWithoutExtension(const char* path) {
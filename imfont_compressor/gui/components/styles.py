@@ -9,8 +9,7 @@ def create_separator_row(app, parent_frame, row_index: int):
     separator.grid(row=row_index, column=0, padx=app.pad_x, pady=(app.pad_y, 0), sticky="ew")
 
     app.ui_theme.apply_colors(separator, bg=ColorKeys.SEPARATOR)
-    app.ui_theme.refresh_colors()
-    
+
     return separator
 
 def create_rounded_frame(parent, width=200, height=100, radius=15, bg="#FFFFFF"):
@@ -46,5 +45,4 @@ def configure_checkbuttons(app, parent, options):
            activeforeground=ColorKeys.CHECK_ACTIVE_FG,                   
            selectcolor=ColorKeys.CHECK_SELECTED,                      
         )
-        cb.grid(row=1, column=i, sticky="ew")
-    app.ui_theme.refresh_colors()
\ No newline at end of file
+        cb.grid(row=1, column=i, sticky="ew")
\ No newline at end of file
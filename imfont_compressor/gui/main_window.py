@@ -5,6 +5,7 @@ from imfont_compressor.core.app import ImFontCompressorApp
 from imfont_compressor.core.ui_theme import ColorKeys
 from imfont_compressor.gui.tabs.compressor_tab import CompressorTab
 from imfont_compressor.gui.tabs.options_tab import OptionsTab
+from imfont_compressor.gui.tabs.preview_tab import PreviewTab
 from imfont_compressor.gui.tabs.unicode_tab import UnicodeTab
 from imfont_compressor.core.language import TextAlignment
 
@@ -18,6 +19,7 @@ class MainWindow:
         self._setup_tab_container()
         self._setup_tabs()
         self._setup_tab_buttons()
+        self.app.language.add_listener(self._on_language_changed)
 
     def _setup_tab_container(self):
         self.app.ui_theme.apply_colors(self.app.root, bg=ColorKeys.BG_ROOT)
@@ -33,6 +35,7 @@ class MainWindow:
 
     def _setup_tabs(self):
         self.compressor_tab = CompressorTab(self.app, self.tab_container)
+        self.preview_tab = PreviewTab(self.app, self.tab_container)
         self.unicode_tab = UnicodeTab(self.app, self.tab_container)
         self.options_tab = OptionsTab(self.app, self.tab_container)
 
@@ -219,11 +222,22 @@ class MainWindow:
         ]
         return canvas.create_polygon(points, smooth=True, splinesteps=36, **kwargs)
 
+    def _on_language_changed(self):
+        # Tab titles and the tab bar direction follow the new language
+        for tab in (self.compressor_tab, self.preview_tab, self.unicode_tab, self.options_tab):
+            self.tab_container.tab(tab.frame, text=self.app.language.get(tab.title_key))
+        self._setup_tab_buttons()
+        self.refresh_colors()
+
     def refresh_colors(self):
         theme = self.app.ui_theme.get_color
+        selected = self.selected_tab_idx
+        if selected is not None and self.app.language.get_alignment() != TextAlignment.LTR:
+            selected = len(self.tab_canvas_items) - 1 - selected
+
         for i, (rect_id, label_id) in enumerate(self.tab_canvas_items):
-            bg = theme(ColorKeys.BUTTON_PRESSED_BG if i == self.selected_tab_idx else ColorKeys.BUTTON_BG)
-            fg = theme(ColorKeys.BUTTON_PRESSED_FG if i == self.selected_tab_idx else ColorKeys.BUTTON_FG)
+            bg = theme(ColorKeys.BUTTON_PRESSED_BG if i == selected else ColorKeys.BUTTON_BG)
+            fg = theme(ColorKeys.BUTTON_PRESSED_FG if i == selected else ColorKeys.BUTTON_FG)
             self.tab_bar.itemconfig(rect_id, fill=bg, outline=theme(ColorKeys.BUTTON_BORDER))
             self.tab_bar.itemconfig(label_id, fill=fg)
         self.tab_bar.configure(bg=theme(ColorKeys.BG_ROOT))
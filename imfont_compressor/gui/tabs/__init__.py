@@ -1,4 +1,5 @@
 from .compressor_tab import CompressorTab
 from .options_tab import OptionsTab
+from .preview_tab import PreviewTab
 
-__all__ = ['CompressorTab', 'OptionsTab']
\ No newline at end of file
+__all__ = ['CompressorTab', 'OptionsTab', 'PreviewTab']
\ No newline at end of file
@@ -10,6 +10,8 @@ from imfont_compressor.core.language import TextAlignment
 from imfont_compressor.core.app import ImFontCompressorApp
 
 class CompressorTab:
+    title_key = "tab.compressor"
+
     def __init__(self, app: ImFontCompressorApp, container: ttk.Notebook):
         self.app = app
         self.container = container
@@ -20,109 +22,129 @@ class CompressorTab:
         self._setup_action_section()
         self._setup_button_section()
 
+        # Widgets are created once; only their placement depends on the text direction
+        self._layout()
+        self.app.language.add_listener(self._layout)
+
+    def _layout(self):
+        is_ltr = self.app.language.get_alignment() == TextAlignment.LTR
+        self._layout_file_section(is_ltr)
+        self._layout_encoding_section(is_ltr)
+        self._layout_extras_section(is_ltr)
+        self._layout_action_section(is_ltr)
+        self._layout_button_section(is_ltr)
+
     def _create_tab(self):
         self.frame = tk.Frame(self.container, bd=2, relief="ridge")
-        self.container.add(self.frame, text=self.app.language.get("tab.compressor"))
+        self.container.add(self.frame, text=self.app.language.get(self.title_key))
 
         self.frame.grid_columnconfigure(0, weight=1)
         self.frame.grid_columnconfigure(1, weight=1)
-        
+
         create_separator_row(self.app, self.frame, 2)
         create_separator_row(self.app, self.frame, 5)
-        
+
         enable_drag_and_drop(self.frame, self.app)
 
     def _setup_file_section(self):
-        align = self.app.language.get_alignment()
-        is_ltr = align == TextAlignment.LTR
+        language = self.app.language
 
-        frame = tk.Frame(self.frame)
-        frame.grid(row=0, column=0, sticky="ew", padx=self.app.pad_x, pady=(self.app.pad_y, 0))
-        frame.grid_columnconfigure(0 if is_ltr else 1, weight=1)
+        self.file_frame = frame = tk.Frame(self.frame)
         self.app.ui_theme.apply_colors(frame, bg=ColorKeys.BG_CHILD_FRAME)
 
-        label = tk.Label(frame, text=self.app.language.get("compressor.label.font_file"))
-        label.grid(row=0, column=0 if is_ltr else 1, sticky="w" if is_ltr else "e", padx=self.app.pad_x, pady=(self.app.pad_y, 0))
-        self.app.ui_theme.apply_colors(label, bg=ColorKeys.BG_CHILD_FRAME, fg=ColorKeys.LABEL)
+        self.font_file_label = tk.Label(frame)
+        language.bind_text(self.font_file_label, "compressor.label.font_file")
+        self.app.ui_theme.apply_colors(self.font_file_label, bg=ColorKeys.BG_CHILD_FRAME, fg=ColorKeys.LABEL)
 
-        self.app.font_input = create_entry(frame, justify=align.to_justify())
-        self.app.font_input.grid(row=1, column=0 if is_ltr else 1, sticky="ew", padx=(self.app.pad_x, 0) if is_ltr else (0, self.app.pad_x))
+        self.app.font_input = create_entry(frame)
 
-        browse_btn = styled_button(
-            self.app, frame, f"{self.app.language.get("compressor.button.browse")}",
+        self.browse_btn = styled_button(
+            self.app, frame, language.get("compressor.button.browse"),
             lambda: events.browse_font(self.app),
             width=10
         )
-        browse_btn.grid(row=1, column=1 if is_ltr else 0, sticky="e" if is_ltr else "w", padx=(self.app.pad_x, self.app.pad_x))
+        language.bind_text(self.browse_btn, "compressor.button.browse")
 
-        dnd_frame = tk.Frame(frame)
-        dnd_frame.grid(row=2, column=0 if is_ltr else 1, sticky="ew")
-        dnd_frame.columnconfigure(0 if is_ltr else 1, weight=1)
-
-        center_frame = tk.Frame(dnd_frame)
-        center_frame.pack(anchor="w" if is_ltr else "e")
+        self.dnd_frame = tk.Frame(frame)
+        self.dnd_center_frame = center_frame = tk.Frame(self.dnd_frame)
 
         # Icon label
-        icon_label = tk.Label(
+        self.dnd_icon_label = tk.Label(
             center_frame,
             text="💡",
             font=tkfont.Font(family="Segoe UI", size=8)
         )
-        icon_label.pack(side="left" if is_ltr else "right", padx=(4, 0) if is_ltr else (0, 4))
 
         # Text label
-        text_label = tk.Label(
+        self.dnd_text_label = tk.Label(
             center_frame,
-            text=str(self.app.language.get("compressor.label.font_file.dnd")),
             font=tkfont.Font(size=8, slant="italic")
         )
-        text_label.pack(side="left" if is_ltr else "right")
+        language.bind_text(self.dnd_text_label, "compressor.label.font_file.dnd")
 
-        self.app.ui_theme.apply_colors(dnd_frame, bg=ColorKeys.BG_CHILD_FRAME)
+        self.app.ui_theme.apply_colors(self.dnd_frame, bg=ColorKeys.BG_CHILD_FRAME)
         self.app.ui_theme.apply_colors(center_frame, bg=ColorKeys.BG_CHILD_FRAME)
-        self.app.ui_theme.apply_colors(icon_label, bg=ColorKeys.BG_CHILD_FRAME, fg=ColorKeys.INPUT_INSIDE)
-        self.app.ui_theme.apply_colors(text_label, bg=ColorKeys.BG_CHILD_FRAME, fg=ColorKeys.INPUT_INSIDE)
+        self.app.ui_theme.apply_colors(self.dnd_icon_label, bg=ColorKeys.BG_CHILD_FRAME, fg=ColorKeys.INPUT_INSIDE)
+        self.app.ui_theme.apply_colors(self.dnd_text_label, bg=ColorKeys.BG_CHILD_FRAME, fg=ColorKeys.INPUT_INSIDE)
 
         self._setup_symbol_name_section(frame)
 
     def _setup_symbol_name_section(self, frame: tk.Frame):
-        align = self.app.language.get_alignment()
-        is_ltr = align == TextAlignment.LTR
-
-        label = tk.Label(frame, text=f"{self.app.language.get("compressor.label.symbol_name")}")
-        label.grid(row=3, column=0 if is_ltr else 1, sticky="w" if is_ltr else "e", pady=(4, 2), padx=self.app.pad_x)
-        self.app.ui_theme.apply_colors(label, bg=ColorKeys.BG_CHILD_FRAME, fg=ColorKeys.LABEL)
+        self.symbol_name_label = tk.Label(frame)
+        self.app.language.bind_text(self.symbol_name_label, "compressor.label.symbol_name")
+        self.app.ui_theme.apply_colors(self.symbol_name_label, bg=ColorKeys.BG_CHILD_FRAME, fg=ColorKeys.LABEL)
 
         self.app.symbol_name_input = create_entry(
             frame,
             width=50,
             bg=self.app.ui_theme.get_color("COLOR_ENTRY_BG"),
             fg=self.app.ui_theme.get_color("COLOR_ENTRY_FG"),
-            insertbackground=self.app.ui_theme.get_color("COLOR_ENTRY_INSERT_BG"),
-            justify=align.to_justify()
+            insertbackground=self.app.ui_theme.get_color("COLOR_ENTRY_INSERT_BG")
         )
 
         self.app.symbol_name_input.insert(0, "example")
+        self.app.symbol_name_input.bind("<KeyRelease>", lambda e: events.on_option_changed(self.app))
+
+    def _layout_file_section(self, is_ltr):
+        align = TextAlignment.LTR if is_ltr else TextAlignment.RTL
+        pad_x = self.app.pad_x
+
+        self.file_frame.grid(row=0, column=0, sticky="ew", padx=pad_x, pady=(self.app.pad_y, 0))
+        self.file_frame.grid_columnconfigure(0, weight=1 if is_ltr else 0)
+        self.file_frame.grid_columnconfigure(1, weight=0 if is_ltr else 1)
+
+        self.font_file_label.grid(row=0, column=0 if is_ltr else 1, sticky="w" if is_ltr else "e", padx=pad_x, pady=(self.app.pad_y, 0))
+
+        self.app.font_input.configure(justify=align.to_justify())
+        self.app.font_input.grid(row=1, column=0 if is_ltr else 1, sticky="ew", padx=(pad_x, 0) if is_ltr else (0, pad_x))
+        self.browse_btn.grid(row=1, column=1 if is_ltr else 0, sticky="e" if is_ltr else "w", padx=(pad_x, pad_x))
+
+        self.dnd_frame.grid(row=2, column=0 if is_ltr else 1, sticky="ew")
+        self.dnd_frame.columnconfigure(0, weight=1 if is_ltr else 0)
+        self.dnd_frame.columnconfigure(1, weight=0 if is_ltr else 1)
+        self.dnd_center_frame.pack(anchor="w" if is_ltr else "e")
+        self.dnd_icon_label.pack(side="left" if is_ltr else "right", padx=(4, 0) if is_ltr else (0, 4))
+        self.dnd_text_label.pack(side="left" if is_ltr else "right")
+
+        self.symbol_name_label.grid(row=3, column=0 if is_ltr else 1, sticky="w" if is_ltr else "e", pady=(4, 2), padx=pad_x)
+        self.app.symbol_name_input.configure(justify=align.to_justify())
         self.app.symbol_name_input.grid(
             row=4, column=0,
             columnspan=2,
-            sticky="ew", 
-            pady=(0, self.app.pad_y + 4), 
-            padx=self.app.pad_x
+            sticky="ew",
+            pady=(0, self.app.pad_y + 4),
+            padx=pad_x
         )
 
     def _setup_encoding_section(self):
-        align = self.app.language.get_alignment()
-        is_ltr = align == TextAlignment.LTR
-
-        frame = tk.Frame(self.frame)
-        frame.grid(row=3, column=0, sticky="w" if is_ltr else "e", padx=self.app.pad_x, pady=(self.app.pad_y, 0))
+        self.encoding_frame = frame = tk.Frame(self.frame)
         self.app.ui_theme.apply_colors(frame,
             bg=ColorKeys.BG_CHILD_FRAME
         )
 
-        label = tk.Label(frame, text=self.app.language.get("compressor.label.encoding"))
-        self.app.ui_theme.apply_colors(label,
+        self.encoding_label = tk.Label(frame)
+        self.app.language.bind_text(self.encoding_label, "compressor.label.encoding")
+        self.app.ui_theme.apply_colors(self.encoding_label,
             bg=ColorKeys.BG_CHILD_FRAME,
             fg=ColorKeys.LABEL
         )
@@ -135,25 +157,45 @@ class CompressorTab:
             state="readonly"
         )
         self.app.encoding_combo['values'] = list(encoding_map.keys())
-        self.app.encoding_combo.bind("<<ComboboxSelected>>", events.on_option_changed(self.app))
+        self.app.encoding_combo.bind("<<ComboboxSelected>>", lambda e: events.on_option_changed(self.app))
+
+        self.app.btn_compare = styled_button(
+            self.app, frame, self.app.language.get("compressor.button.compare"),
+            lambda: events.compare_encodings(self.app),
+            width=10
+        )
+        self.app.language.bind_text(self.app.btn_compare, "compressor.button.compare")
 
-        label.grid(row=0, column=0 if is_ltr else 1, sticky="w" if is_ltr else "e", padx=(0, 3) if is_ltr else (3, 0))
-        self.app.encoding_combo.grid(row=0, column=1 if is_ltr else 0, sticky="w" if is_ltr else "e")
+        self.app.estimate_label = tk.Label(frame, text="", font=tkfont.Font(size=8, slant="italic"))
+        self.app.ui_theme.apply_colors(self.app.estimate_label,
+            bg=ColorKeys.BG_CHILD_FRAME,
+            fg=ColorKeys.INPUT_INSIDE
+        )
+
+    def _layout_encoding_section(self, is_ltr):
+        self.encoding_frame.grid(row=3, column=0, sticky="w" if is_ltr else "e", padx=self.app.pad_x, pady=(self.app.pad_y, 0))
+
+        if is_ltr:
+            self.encoding_label.grid(row=0, column=0, sticky="w", padx=(0, 3))
+            self.app.encoding_combo.grid(row=0, column=1, sticky="w")
+            self.app.btn_compare.grid(row=0, column=2, padx=(6, 0))
+            self.app.estimate_label.grid(row=0, column=3, sticky="w", padx=(6, 0))
+        else:
+            self.app.estimate_label.grid(row=0, column=0, sticky="e", padx=(0, 6))
+            self.app.btn_compare.grid(row=0, column=1, padx=(0, 6))
+            self.app.encoding_combo.grid(row=0, column=2, sticky="e")
+            self.encoding_label.grid(row=0, column=3, sticky="e", padx=(3, 0))
 
     def _setup_extras_section(self):
-        frame = tk.Frame(self.frame)
+        self.extras_frame = frame = tk.Frame(self.frame)
         frame.grid(row=4, column=0, sticky="ew", pady=0, padx=self.app.pad_x)
         self.app.ui_theme.apply_colors(frame,
             bg=ColorKeys.BG_CHILD_FRAME
         )
 
-        # Get alignment direction
-        align = self.app.language.get_alignment()
-        is_ltr = align == TextAlignment.LTR
-
-        label = tk.Label(frame, text=self.app.language.get("compressor.label.extras"))
-        label.grid(row=0, column=0 if is_ltr else 2, sticky="w" if is_ltr else "e")
-        self.app.ui_theme.apply_colors(label,
+        self.extras_label = tk.Label(frame)
+        self.app.language.bind_text(self.extras_label, "compressor.label.extras")
+        self.app.ui_theme.apply_colors(self.extras_label,
             bg=ColorKeys.BG_CHILD_FRAME,
             fg=ColorKeys.LABEL
         )
@@ -171,8 +213,11 @@ class CompressorTab:
         )
         frame.grid_columnconfigure(1, weight=1)
 
+    def _layout_extras_section(self, is_ltr):
+        self.extras_label.grid(row=0, column=0 if is_ltr else 2, sticky="w" if is_ltr else "e")
+
     def _setup_action_section(self):
-        frame = tk.Frame(
+        self.action_frame = frame = tk.Frame(
             self.frame,
             bg=self.app.ui_theme.get_color("COLOR_BG_ACTION_FRAME")
         )
@@ -186,41 +231,17 @@ class CompressorTab:
             lambda: events.compress_font(self.app),
             width=18
         )
+        self.app.language.bind_text(self.app.btn_compress, "compressor.button.compress_font")
+        # Hidden: profile compressions (cProfile + tracemalloc), like `compress --profile`
+        self.app.root.bind_all("<Control-Shift-P>", lambda e: events.toggle_job_profiling(self.app))
 
         # Create status label
-        status_text = self.app.language.get("compressor.status", self.app.language.get("compressor.status.idle"))
         self.app.status_label = tk.Label(
             frame,
-            text=status_text,
             font=tkfont.Font(size=9, slant="italic")
         )
-
-        # Determine alignment
-        align = self.app.language.get_alignment()
-        if align == TextAlignment.LTR:
-            frame.grid_columnconfigure(1, weight=1)
-            self.app.btn_compress.grid(
-                row=0, column=0, sticky="ew",
-                pady=(self.app.pad_y, 0),
-                padx=(self.app.pad_x, 0)
-            )
-            self.app.status_label.grid(
-                row=0, column=1, sticky="ew",
-                pady=(self.app.pad_y, 0),
-                padx=self.app.pad_x
-            )
-        else:  # RTL
-            frame.grid_columnconfigure(0, weight=1)
-            self.app.status_label.grid(
-                row=0, column=0, sticky="ew",
-                pady=(self.app.pad_y, 0),
-                padx=self.app.pad_x
-            )
-            self.app.btn_compress.grid(
-                row=0, column=1, sticky="ew",
-                pady=(self.app.pad_y, 0),
-                padx=(0, self.app.pad_x)
-            )
+        self.app.language.bind_text(self.app.status_label, "compressor.status",
+                                    self.app.language.component("compressor.status.idle"))
 
         # Apply theme colors to status label
         self.app.ui_theme.apply_colors(
@@ -229,6 +250,20 @@ class CompressorTab:
             fg=ColorKeys.LABEL
         )
 
+    def _layout_action_section(self, is_ltr):
+        frame = self.action_frame
+        pad_y = (self.app.pad_y, 0)
+        if is_ltr:
+            frame.grid_columnconfigure(0, weight=0)
+            frame.grid_columnconfigure(1, weight=1)
+            self.app.btn_compress.grid(row=0, column=0, sticky="ew", pady=pad_y, padx=(self.app.pad_x, 0))
+            self.app.status_label.grid(row=0, column=1, sticky="ew", pady=pad_y, padx=self.app.pad_x)
+        else:  # RTL
+            frame.grid_columnconfigure(0, weight=1)
+            frame.grid_columnconfigure(1, weight=0)
+            self.app.status_label.grid(row=0, column=0, sticky="ew", pady=pad_y, padx=self.app.pad_x)
+            self.app.btn_compress.grid(row=0, column=1, sticky="ew", pady=pad_y, padx=(0, self.app.pad_x))
+
     def _setup_button_section(self):
         frame = tk.Frame(
             self.frame,
@@ -237,30 +272,34 @@ class CompressorTab:
         frame.grid(row=7, column=0, padx=self.app.pad_x, pady=(self.app.pad_y, self.app.pad_y + 5))
         frame.grid_columnconfigure(0, weight=1)
 
-        btn_reset = styled_button(
-            self.app, frame, self.app.language.get("compressor.button.reset"), 
-            lambda: events.reset_to_defaults(self.app), 
+        self.btn_reset = styled_button(
+            self.app, frame, self.app.language.get("compressor.button.reset"),
+            lambda: events.reset_to_defaults(self.app),
             padx=12, pady=10, width=18
         )
 
         self.app.btn_copy = styled_button(
-            self.app, frame, self.app.language.get("compressor.button.copy"), 
-            lambda: events.copy_result(self.app), 
+            self.app, frame, self.app.language.get("compressor.button.copy"),
+            lambda: events.copy_result(self.app),
             padx=12, pady=10, width=18, state="disabled"
         )
 
         self.app.btn_save = styled_button(
-            self.app, frame, self.app.language.get("compressor.button.save"), 
-            lambda: events.save_result(self.app), 
+            self.app, frame, self.app.language.get("compressor.button.save"),
+            lambda: events.save_result(self.app),
             padx=12, pady=10, width=18, state="disabled"
         )
 
-        align = self.app.language.get_alignment()
-        if align == TextAlignment.LTR:
-            btn_reset.grid(row=0, column=0, padx=(0, 2))
+        self.app.language.bind_text(self.btn_reset, "compressor.button.reset")
+        self.app.language.bind_text(self.app.btn_copy, "compressor.button.copy")
+        self.app.language.bind_text(self.app.btn_save, "compressor.button.save")
+
+    def _layout_button_section(self, is_ltr):
+        if is_ltr:
+            self.btn_reset.grid(row=0, column=0, padx=(0, 2))
             self.app.btn_copy.grid(row=0, column=1, padx=2)
             self.app.btn_save.grid(row=0, column=2, padx=(2, 0))
         else:
             self.app.btn_copy.grid(row=0, column=0, padx=(0, 2))
             self.app.btn_save.grid(row=0, column=1, padx=2)
-            btn_reset.grid(row=0, column=2, padx=(2, 0))
+            self.btn_reset.grid(row=0, column=2, padx=(2, 0))
@@ -3,13 +3,14 @@ from tkinter import ttk, font as tkfont
 import imfont_compressor.core.events as events
 from imfont_compressor.core.app import ImFontCompressorApp
 from imfont_compressor.gui.components.buttons import styled_button
-from imfont_compressor.core.utils import get_resource_path
+from imfont_compressor.core.assets import read_asset
 from imfont_compressor.core.ui_theme import ColorKeys
 from imfont_compressor.core.language import TextAlignment
 from imfont_compressor import CURRENT_VERSION, AUTHOR
-from PIL import Image, ImageTk
 
 class OptionsTab:
+    title_key = "tab.options"
+
     def __init__(self, app: ImFontCompressorApp, container):
         self.app = app
         self.container = container
@@ -17,12 +18,19 @@ class OptionsTab:
         self._setup_language_and_theme_section()
         self._setup_about_content()
 
+        self._layout()
+        self.app.language.add_listener(self._layout)
+
     def _create_tab(self):
         self.frame = tk.Frame(self.container, bd=2, relief="ridge")
-        self.container.add(self.frame, text=self.app.language.get("tab.options"))
+        self.container.add(self.frame, text=self.app.language.get(self.title_key))
 
+    def load_background(self):
+        """Show the logo behind the options; loaded after startup since it needs PIL."""
         try:
-            original = Image.open(get_resource_path("assets/logo.png"))
+            from io import BytesIO
+            from PIL import Image, ImageTk
+            original = Image.open(BytesIO(read_asset("assets", "logo.png")))
 
             resized = original.resize((100, 100), Image.Resampling.LANCZOS)
             self.bg_photo = ImageTk.PhotoImage(resized)
@@ -37,13 +45,16 @@ class OptionsTab:
             bg_label = tk.Label(outline_frame, image=self.bg_photo, borderwidth=0)
             bg_label.place(relx=0.5, rely=0.5, anchor="center")
 
+            # Created after the first paint, so theme them like the rest of the tree
+            self.app.ui_theme.register_defaults(outline_frame)
+            self.app.ui_theme.refresh_widget(outline_frame)
+            self.app.ui_theme.refresh_widget(bg_label)
+
             outline_frame.lower()
         except Exception as e:
             print("Error loading background image:", e)
 
     def _setup_language_and_theme_section(self):
-        align = self.app.language.get_alignment()
-        is_ltr = align == TextAlignment.LTR
         visuals_font = tkfont.Font(size=12, weight="bold")
 
         # === Row Container Frame ===
@@ -52,91 +63,63 @@ class OptionsTab:
         self.app.ui_theme.apply_colors(row_frame, bg=ColorKeys.BG_CHILD_FRAME)
 
         # === Language Section ===
-        lang_frame = tk.Frame(row_frame, bd=2, relief="sunken")
-        lang_frame.pack(
-            side="left" if is_ltr else "right",
-            padx=(self.app.pad_x, self.app.pad_x // 2),
-            pady=self.app.pad_y
-        )
+        self.lang_frame = tk.Frame(row_frame, bd=2, relief="sunken")
 
-        lang_label = tk.Label(
-            lang_frame,
-            text=self.app.language.get('options.label.language'),
-            font=visuals_font
-        )
-        lang_label.pack(
-            side="left" if is_ltr else "right",
-            padx=(0, 4) if is_ltr else (4, 0),
-            pady=2
-        )
+        self.lang_label = tk.Label(self.lang_frame, font=visuals_font)
+        self.app.language.bind_text(self.lang_label, 'options.label.language')
 
         language_names = [name for code, name in self.app.language.get_available_languages()]
         current_lang_name = self.app.language.get_language_name()
         
         self.app.language_combo = ttk.Combobox(
-            lang_frame,
+            self.lang_frame,
             values=language_names,
-            state="readonly",
-            justify="left" if is_ltr else "right"
+            state="readonly"
         )
         self.app.language_combo.set(current_lang_name if current_lang_name in language_names else language_names[0])
         self.app.language_combo.bind("<<ComboboxSelected>>", lambda e: events.on_language_changed(self.app))
-        self.app.language_combo.pack(
-            side="left" if is_ltr else "right",
-            pady=2
-        )
 
         # === Theme Section ===
-        theme_frame = tk.Frame(row_frame, bd=2, relief="sunken")
-        theme_frame.pack(
-            side="left" if is_ltr else "right",
-            padx=(self.app.pad_x // 2, self.app.pad_x),
-            pady=self.app.pad_y
-        )
+        self.theme_frame = tk.Frame(row_frame, bd=2, relief="sunken")
 
-        theme_label = tk.Label(
-            theme_frame,
-            text=self.app.language.get('options.label.theme'),
-            font=visuals_font
-        )
-        theme_label.pack(
-            side="left" if is_ltr else "right",
-            padx=(0, 4) if is_ltr else (4, 0),
-            pady=2
-        )
+        self.theme_label = tk.Label(self.theme_frame, font=visuals_font)
+        self.app.language.bind_text(self.theme_label, 'options.label.theme')
 
         theme_names = self.app.ui_theme.get_theme_display_list()
         self.app.theme_combo = ttk.Combobox(
-            theme_frame,
+            self.theme_frame,
             values=theme_names,
-            state="readonly",
-            justify="left" if is_ltr else "right"
+            state="readonly"
         )
         self.app.theme_combo.set(self.app.ui_theme.get_name())
         self.app.theme_combo.bind("<<ComboboxSelected>>", lambda e: events.on_theme_changed(self.app))
-        self.app.theme_combo.pack(
-            side="left" if is_ltr else "right",
-            pady=2
-        )
+
+    def _layout(self):
+        is_ltr = self.app.language.get_alignment() == TextAlignment.LTR
+        side = "left" if is_ltr else "right"
+
+        self.lang_frame.pack(side=side, padx=(self.app.pad_x, self.app.pad_x // 2), pady=self.app.pad_y)
+        self.lang_label.pack(side=side, padx=(0, 4) if is_ltr else (4, 0), pady=2)
+        self.app.language_combo.configure(justify=side)
+        self.app.language_combo.pack(side=side, pady=2)
+
+        self.theme_frame.pack(side=side, padx=(self.app.pad_x // 2, self.app.pad_x), pady=self.app.pad_y)
+        self.theme_label.pack(side=side, padx=(0, 4) if is_ltr else (4, 0), pady=2)
+        self.app.theme_combo.configure(justify=side)
+        self.app.theme_combo.pack(side=side, pady=2)
 
     def _setup_about_content(self):
         container = tk.Frame(self.frame)
         container.place(relx=0.5, rely=1.0, anchor="s", y=-20)
 
         # Version Label
-        version = tk.Label(
-            container,
-            text=self.app.language.get("options.label.build", CURRENT_VERSION),
-            justify="center"
-        )
+        version = tk.Label(container, justify="center")
+        self.app.language.bind_text(version, "options.label.build", CURRENT_VERSION)
         version.grid(row=0, column=1, sticky="ew")
 
         # Credits Label
-        credits = tk.Label(
-            container,
-            text=self.app.language.get("options.label.credits", AUTHOR),
-            justify="center"
-        )
+        credits = tk.Label(container, justify="center")
+        self.app.language.bind_text(credits, "options.label.credits", AUTHOR)
         credits.grid(row=1, column=1, sticky="ew", pady=(0, self.app.pad_y))
 
         # Copyright Label
@@ -158,6 +141,7 @@ class OptionsTab:
             lambda: events.open_discord(self.app),
             width=16
         )
+        self.app.language.bind_text(discord_btn, "options.button.discord")
         discord_btn.grid(row=2, column=0, sticky="ew", padx=(0, self.app.pad_x))
 
         # Update Button
@@ -166,6 +150,7 @@ class OptionsTab:
             lambda: events.check_and_notify_update(self.app),
             width=16
         )
+        self.app.language.bind_text(self.app.update_btn, "options.button.check_for_updates")
         self.app.update_btn.grid(row=2, column=1, sticky="ew")
 
         # GitHub Button
@@ -174,6 +159,7 @@ class OptionsTab:
             lambda: events.open_github(self.app),
             width=16
         )
+        self.app.language.bind_text(github_btn, "options.button.github")
         github_btn.grid(row=2, column=2, sticky="ew", padx=(self.app.pad_x, 0))
 
         
\ No newline at end of file
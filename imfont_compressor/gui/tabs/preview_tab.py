@@ -0,0 +1,269 @@
+import tkinter as tk
+from tkinter import ttk, font as tkfont
+from imfont_compressor.core.app import ImFontCompressorApp
+from imfont_compressor.core.ui_theme import ColorKeys
+from imfont_compressor.core.language import TextAlignment
+from imfont_compressor.core.utils import format_size, run_in_background
+from imfont_compressor.gui.components.buttons import styled_button
+from imfont_compressor.gui.components.entries import create_entry
+
+
+class PreviewTab:
+    """
+    Read-only view of the generated code.
+
+    The output is read from its spool file through an OutputDocument and only
+    the lines that fit in the text box are inserted, so scrolling, jumping and
+    searching cost the same for a 100 KB and a 100 MB result. The scrollbar
+    is driven by hand and maps to line numbers in the whole document.
+    """
+    title_key = "tab.preview"
+
+    def __init__(self, app: ImFontCompressorApp, container: ttk.Notebook):
+        self.app = app
+        self.container = container
+        self.document = None
+        self.top_line = 0
+        self.visible_lines = 1
+        self.match_line = None
+        self.search_generation = 0
+
+        self._create_tab()
+        self._setup_toolbar()
+        self._setup_view()
+
+        self._layout()
+        self.app.language.add_listener(self._layout)
+
+    def _create_tab(self):
+        self.frame = tk.Frame(self.container, bd=2, relief="ridge")
+        self.container.add(self.frame, text=self.app.language.get(self.title_key))
+        self.frame.grid_rowconfigure(1, weight=1)
+        self.frame.grid_columnconfigure(0, weight=1)
+
+    def _setup_toolbar(self):
+        language = self.app.language
+
+        self.toolbar = frame = tk.Frame(self.frame)
+        self.app.ui_theme.apply_colors(frame, bg=ColorKeys.BG_CHILD_FRAME)
+
+        self.summary_label = tk.Label(frame, font=tkfont.Font(size=9, slant="italic"))
+        language.bind_text(self.summary_label, "preview.label.empty")
+        self.app.ui_theme.apply_colors(self.summary_label, bg=ColorKeys.BG_CHILD_FRAME, fg=ColorKeys.LABEL)
+
+        self.btn_start = styled_button(self.app, frame, language.get("preview.button.start"), self.go_to_start, width=8)
+        self.btn_end = styled_button(self.app, frame, language.get("preview.button.end"), self.go_to_end, width=8)
+        language.bind_text(self.btn_start, "preview.button.start")
+        language.bind_text(self.btn_end, "preview.button.end")
+
+        self.search_var = tk.StringVar()
+        self.search_entry = create_entry(frame, textvariable=self.search_var, width=24)
+        self.search_entry.bind("<Return>", lambda e: self.find_next())
+        self.search_entry.bind("<Shift-Return>", lambda e: self.find_previous())
+
+        self.btn_previous = styled_button(self.app, frame, language.get("preview.button.previous"), self.find_previous, width=8)
+        self.btn_next = styled_button(self.app, frame, language.get("preview.button.next"), self.find_next, width=8)
+        language.bind_text(self.btn_previous, "preview.button.previous")
+        language.bind_text(self.btn_next, "preview.button.next")
+
+        self.position_label = tk.Label(frame, font=tkfont.Font(size=8, slant="italic"))
+        self.app.ui_theme.apply_colors(self.position_label, bg=ColorKeys.BG_CHILD_FRAME, fg=ColorKeys.INPUT_INSIDE)
+
+    def _setup_view(self):
+        self.view_frame = frame = tk.Frame(self.frame)
+        self.app.ui_theme.apply_colors(frame, bg=ColorKeys.BG_CHILD_FRAME)
+        frame.grid_rowconfigure(0, weight=1)
+        frame.grid_columnconfigure(0, weight=1)
+
+        self.text_font = tkfont.Font(family="Courier New", size=9)
+        self.text = tk.Text(
+            frame,
+            wrap="none",
+            font=self.text_font,
+            padx=4,
+            pady=2,
+            borderwidth=2,
+            relief="sunken",
+            state="disabled"
+        )
+        self.app.ui_theme.apply_colors(
+            self.text,
+            bg=ColorKeys.BG_MAIN_FRAME,
+            fg=ColorKeys.LABEL,
+            disabled_bg=ColorKeys.BG_CHILD_FRAME,
+            disabled_fg=ColorKeys.LABEL
+        )
+        self.text.tag_configure("match", background="#ffd54f", foreground="#000000")
+
+        self.v_scroll = tk.Scrollbar(frame, orient="vertical", command=self._on_scrollbar)
+        self.h_scroll = tk.Scrollbar(frame, orient="horizontal", command=self.text.xview)
+        self.text.configure(xscrollcommand=self.h_scroll.set)
+        for scrollbar in (self.v_scroll, self.h_scroll):
+            self.app.ui_theme.apply_colors(
+                scrollbar,
+                bg=ColorKeys.BUTTON_BG,
+                troughcolor=ColorKeys.BG_CHILD_FRAME,
+                activebackground=ColorKeys.BUTTON_HOVER_BG
+            )
+
+        self.text.bind("<Configure>", self._on_resize)
+        self.text.bind("<MouseWheel>", self._on_mousewheel)
+        self.text.bind("<Button-4>", lambda e: self.scroll_to(self.top_line - 3))
+        self.text.bind("<Button-5>", lambda e: self.scroll_to(self.top_line + 3))
+        self.text.bind("<Prior>", lambda e: self.scroll_to(self.top_line - self.visible_lines))
+        self.text.bind("<Next>", lambda e: self.scroll_to(self.top_line + self.visible_lines))
+        self.text.bind("<Control-Home>", lambda e: self.go_to_start())
+        self.text.bind("<Control-End>", lambda e: self.go_to_end())
+
+    def _layout(self):
+        is_ltr = self.app.language.get_alignment() == TextAlignment.LTR
+        pad_x = self.app.pad_x
+        pad_y = self.app.pad_y
+
+        self.toolbar.grid(row=0, column=0, sticky="ew", padx=pad_x, pady=(pad_y, 0))
+        self.view_frame.grid(row=1, column=0, sticky="nsew", padx=pad_x, pady=pad_y)
+
+        # Widgets in reading order; RTL mirrors the row
+        row = [self.btn_start, self.btn_end, self.search_entry, self.btn_previous, self.btn_next, self.position_label]
+        if not is_ltr:
+            row.reverse()
+        for column, widget in enumerate(row):
+            widget.grid(row=0, column=column, padx=2, pady=(0, 4))
+        self.toolbar.grid_columnconfigure(len(row) - 1 if is_ltr else 0, weight=1)
+        self.toolbar.grid_columnconfigure(0 if is_ltr else len(row) - 1, weight=0)
+        self.position_label.grid_configure(sticky="w" if is_ltr else "e")
+        self.search_entry.configure(justify="left" if is_ltr else "right")
+
+        self.summary_label.grid(row=1, column=0, columnspan=len(row), sticky="w" if is_ltr else "e")
+
+        # The code itself is always left-to-right; only the scrollbar follows the language
+        self.text.grid(row=0, column=1 if not is_ltr else 0, sticky="nsew")
+        self.v_scroll.grid(row=0, column=1 if is_ltr else 0, sticky="ns")
+        self.h_scroll.grid(row=1, column=0, columnspan=2, sticky="ew")
+        self.view_frame.grid_columnconfigure(0, weight=1 if is_ltr else 0)
+        self.view_frame.grid_columnconfigure(1, weight=0 if is_ltr else 1)
+
+    def show_document(self, document):
+        """Display an indexed OutputDocument from the start."""
+        self.document = document
+        self.match_line = None
+        self.app.language.bind_text(
+            self.summary_label, "preview.label.summary",
+            format_size(document.size), f"{document.line_count:,}"
+        )
+        self.scroll_to(0)
+
+    def clear(self):
+        self.document = None
+        self.app.language.bind_text(self.summary_label, "preview.label.empty")
+        self.app.language.unbind_text(self.position_label)
+        self.position_label.config(text="")
+        self._render()
+
+    def go_to_start(self):
+        self.scroll_to(0)
+
+    def go_to_end(self):
+        if self.document is not None:
+            self.scroll_to(self.document.line_count)
+
+    def scroll_to(self, line):
+        line_count = self.document.line_count if self.document is not None else 0
+        self.top_line = max(0, min(line, line_count - self.visible_lines))
+        self._render()
+
+    def _render(self):
+        lines = self.document.read_lines(self.top_line, self.visible_lines) if self.document else []
+        x_view = self.text.xview()[0]
+
+        self.text.configure(state="normal")
+        self.text.delete("1.0", tk.END)
+        self.text.insert("1.0", "\n".join(lines))
+        self._highlight_match()
+        self.text.configure(state="disabled")
+        self.text.xview_moveto(x_view)
+
+        if self.document is None or not self.document.line_count:
+            self.v_scroll.set(0, 1)
+            return
+
+        total = self.document.line_count
+        self.v_scroll.set(self.top_line / total, min(1, (self.top_line + self.visible_lines) / total))
+        self.app.language.bind_text(
+            self.position_label, "preview.label.position",
+            f"{self.top_line + 1:,}", f"{min(total, self.top_line + self.visible_lines):,}"
+        )
+
+    def _highlight_match(self):
+        needle = self.search_var.get()
+        if self.match_line is None or not needle:
+            return
+        row = self.match_line - self.top_line + 1
+        if not 1 <= row <= self.visible_lines:
+            return
+        line_text = self.text.get(f"{row}.0", f"{row}.end")
+        column = line_text.lower().find(needle.lower())
+        if column != -1:
+            self.text.tag_add("match", f"{row}.{column}", f"{row}.{column + len(needle)}")
+            self.text.see(f"{row}.{column}")
+
+    def _on_resize(self, event):
+        visible = max(1, (event.height - 8) // self.text_font.metrics("linespace"))
+        if visible != self.visible_lines:
+            self.visible_lines = visible
+            self.scroll_to(self.top_line)
+
+    def _on_mousewheel(self, event):
+        self.scroll_to(self.top_line - (event.delta // 120) * 3)
+        return "break"
+
+    def _on_scrollbar(self, action, *args):
+        if self.document is None:
+            return
+        if action == "moveto":
+            self.scroll_to(int(float(args[0]) * self.document.line_count))
+        elif action == "scroll":
+            amount, unit = int(args[0]), args[1]
+            self.scroll_to(self.top_line + amount * (self.visible_lines if unit == "pages" else 1))
+
+    def find_next(self):
+        self._find(backwards=False)
+
+    def find_previous(self):
+        self._find(backwards=True)
+
+    def _find(self, backwards):
+        needle = self.search_var.get()
+        if self.document is None or not needle:
+            return
+
+        # Continue after (or before) the current match, wrapping around once
+        if self.match_line is None:
+            start = self.top_line
+        else:
+            start = self.match_line if backwards else self.match_line + 1
+        document = self.document
+
+        def _search():
+            line = document.find(needle, start, backwards)
+            if line is None:
+                line = document.find(needle, document.line_count if backwards else 0, backwards)
+            return line
+
+        # Scanning a large output takes a while; a newer search or document wins
+        self.search_generation += 1
+        generation = self.search_generation
+
+        def _done(line, error):
+            if generation != self.search_generation or document is not self.document:
+                return
+            if error is not None or line is None:
+                self.match_line = None
+                self.app.language.bind_text(self.position_label, "preview.label.not_found", needle)
+                return
+
+            self.match_line = line
+            # Keep a few lines of context above the match
+            self.scroll_to(line - min(3, self.visible_lines // 2))
+
+        run_in_background(self.app, _search, _done, interval=10)
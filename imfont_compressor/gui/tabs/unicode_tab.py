@@ -7,22 +7,22 @@ import tkinter.messagebox as messagebox
 
 
 class UnicodeTab:
+    title_key = "tab.unicode"
+
     def __init__(self, app: ImFontCompressorApp, container):
         self.app = app
         self.container = container
         self._create_tab()
         self._setup_unicode_tools()
 
+        self._layout()
+        self.app.language.add_listener(self._layout)
+
     def _create_tab(self):
         self.frame = tk.Frame(self.container, bd=2, relief="ridge")
-        self.container.add(self.frame, text=self.app.language.get("tab.unicode"))
+        self.container.add(self.frame, text=self.app.language.get(self.title_key))
 
     def _setup_unicode_tools(self):
-        align = self.app.language.get_alignment()
-        is_ltr = align == TextAlignment.LTR
-        justify = "left" if is_ltr else "right"
-        anchor = "w" if is_ltr else "e"
-
         self.frame.grid_rowconfigure(0, weight=1)
         self.frame.grid_columnconfigure(0, weight=1)
 
@@ -33,19 +33,16 @@ class UnicodeTab:
         label_font = ("Segoe UI", 10, "bold")
 
         # Prefix section
-        prefix_frame = tk.Frame(form_frame)
-        prefix_frame.pack(fill="x", pady=(0, 10))
-        self.app.ui_theme.apply_colors(prefix_frame, bg=ColorKeys.BG_CHILD_FRAME)
-
-        prefix_frame.grid_columnconfigure(1 if is_ltr else 0, weight=1)
+        self.prefix_frame = tk.Frame(form_frame)
+        self.prefix_frame.pack(fill="x", pady=(0, 10))
+        self.app.ui_theme.apply_colors(self.prefix_frame, bg=ColorKeys.BG_CHILD_FRAME)
 
-        label = tk.Label(prefix_frame, text=self.app.language.get("unicode.label.prefix"), font=label_font)
-        label.grid(row=0, column=0 if is_ltr else 1, padx=(self.app.pad_x, 0) if is_ltr else (0, self.app.pad_x), pady=self.app.pad_y, sticky=anchor)
-        self.app.ui_theme.apply_colors(label, bg=ColorKeys.BG_CHILD_FRAME, fg=ColorKeys.LABEL)
+        self.prefix_label = tk.Label(self.prefix_frame, font=label_font)
+        self.app.language.bind_text(self.prefix_label, "unicode.label.prefix")
+        self.app.ui_theme.apply_colors(self.prefix_label, bg=ColorKeys.BG_CHILD_FRAME, fg=ColorKeys.LABEL)
 
         self.prefix_var = tk.StringVar(value="FONT_")
-        entry = tk.Entry(prefix_frame, textvariable=self.prefix_var, width=20, justify=justify)
-        entry.grid(row=0, column=1 if is_ltr else 0, sticky=anchor, padx=4)
+        self.prefix_entry = tk.Entry(self.prefix_frame, textvariable=self.prefix_var, width=20)
 
         # Input section
         input_frame = tk.Frame(form_frame)
@@ -54,16 +51,15 @@ class UnicodeTab:
 
         label = tk.Label(
             input_frame,
-            text=self.app.language.get("unicode.label.enter_named_codepoints"),
             font=label_font,
             anchor="center"
         )
+        self.app.language.bind_text(label, "unicode.label.enter_named_codepoints")
         label.pack(anchor="center")
         self.app.ui_theme.apply_colors(label, bg=ColorKeys.BG_CHILD_FRAME, fg=ColorKeys.LABEL)
 
         self.codepoints_var = tk.StringVar()
-        code_entry = tk.Entry(input_frame, textvariable=self.codepoints_var, width=50, justify=justify)
-        code_entry.pack(fill="x", padx=self.app.pad_x, pady=(2, self.app.pad_y), anchor=anchor)
+        self.code_entry = tk.Entry(input_frame, textvariable=self.codepoints_var, width=50)
         self.codepoints_var.trace_add("write", self.update_defines)
         self.prefix_var.trace_add("write", self.update_defines)
 
@@ -81,7 +77,6 @@ class UnicodeTab:
             state="disabled"
         )
         self.output.pack(padx=4, pady=(0, 4), fill="both", expand=True)
-        self.output.tag_configure("align", justify=justify)
         self.app.ui_theme.apply_colors(
             self.output,
             bg=ColorKeys.BG_MAIN_FRAME,
@@ -97,8 +92,24 @@ class UnicodeTab:
             self.app.language.get("unicode.button.copy_output"),
             self.copy_output
         )
+        self.app.language.bind_text(copy_btn, "unicode.button.copy_output")
         copy_btn.pack(pady=(6, 0))
 
+    def _layout(self):
+        is_ltr = self.app.language.get_alignment() == TextAlignment.LTR
+        justify = "left" if is_ltr else "right"
+        anchor = "w" if is_ltr else "e"
+
+        self.prefix_frame.grid_columnconfigure(0, weight=0 if is_ltr else 1)
+        self.prefix_frame.grid_columnconfigure(1, weight=1 if is_ltr else 0)
+        self.prefix_label.grid(row=0, column=0 if is_ltr else 1, padx=(self.app.pad_x, 0) if is_ltr else (0, self.app.pad_x), pady=self.app.pad_y, sticky=anchor)
+        self.prefix_entry.configure(justify=justify)
+        self.prefix_entry.grid(row=0, column=1 if is_ltr else 0, sticky=anchor, padx=4)
+
+        self.code_entry.configure(justify=justify)
+        self.code_entry.pack(fill="x", padx=self.app.pad_x, pady=(2, self.app.pad_y), anchor=anchor)
+        self.output.tag_configure("align", justify=justify)
+
     def update_defines(self, *_):
         raw_input = self.codepoints_var.get()
         prefix = self.prefix_var.get().strip()
@@ -1,7 +1,22 @@
-def run_app():
-    from imfont_compressor.core.app import ImFontCompressorApp
-    app = ImFontCompressorApp()
-    app.setup_gui()
+import sys
+
+def run_app(profile_startup=False, exit_after_startup=False, watch_stalls=None):
+    from imfont_compressor.core.startup import StartupProfile
+    profile = StartupProfile(profile_startup)
+
+    with profile.phase("imports"):
+        from imfont_compressor.core.app import ImFontCompressorApp
+        import imfont_compressor.gui.main_window  # noqa: F401  (timed here, not in "widget build")
+
+    app = ImFontCompressorApp(profile)
+    app.setup_gui(exit_after_startup, watch_stalls)
 
 if __name__ == "__main__":
+    # Needed by the process pools of frozen (PyInstaller) builds
+    import multiprocessing
+    multiprocessing.freeze_support()
+
+    if len(sys.argv) > 1:
+        from imfont_compressor.cli import main
+        sys.exit(main())
     run_app()
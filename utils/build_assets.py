@@ -0,0 +1,26 @@
+import sys
+import os
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from imfont_compressor.core.assets import build_bundle, BUNDLE_FILENAME
+from imfont_compressor.core.utils import format_size
+
+# Kept out of the package directory so development runs keep using the loose files
+OUTPUT_DIR = os.path.join(PROJECT_ROOT, "build")
+OUTPUT_PATH = os.path.join(OUTPUT_DIR, BUNDLE_FILENAME)
+
+
+def main():
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    sizes = build_bundle(OUTPUT_PATH)
+    for name, size in sizes.items():
+        print(f"  {name:<24}{format_size(size):>10}")
+    print(f"Wrote {OUTPUT_PATH} ({len(sizes)} entries, {format_size(os.path.getsize(OUTPUT_PATH))})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
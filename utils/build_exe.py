@@ -7,11 +7,15 @@ sys.path.insert(0, PROJECT_ROOT)
 
 from imfont_compressor import CURRENT_VERSION
 import PyInstaller.__main__
+import build_assets
 
 PATH = "imfont_compressor"
 ICON_PATH = f"{PATH}/assets/icon.ico"
 EXE_NAME = f"{PATH}.exe"
 
+# Themes, languages and the logo ship packed in one file instead of many loose ones
+build_assets.main()
+
 PyInstaller.__main__.run([
     f"{PATH}/main.py",
     "--onefile",
@@ -19,9 +23,7 @@ PyInstaller.__main__.run([
     "--name", EXE_NAME,
     f"--icon={ICON_PATH}",
     "--add-data", f"{PATH}/assets/icon.ico;assets",
-    "--add-data", f"{PATH}/assets/logo.png;assets",
-    "--add-data", f"{PATH}/assets/themes;assets/themes",
-    "--add-data", f"{PATH}/assets/languages;assets/languages",
+    "--add-data", f"{build_assets.OUTPUT_PATH};.",
     "--add-binary", f"{PATH}/data/binary_to_compressed_c.exe;data",
 ])
 